@@ -3,26 +3,45 @@
 SEC-009: Supports per-user rate limiting by passing user_id to LLM calls.
 """
 
-from enum import Enum
+import asyncio
+import hashlib
+from enum import IntEnum
 from typing import AsyncIterator
 
+from config import get_settings
 from models.schemas import Entity
-from services.extractor import DecisionExtractor
-from services.llm import get_llm_client
+from services.extractor import get_extractor
+from services.llm import MESSAGE_OVERHEAD_TOKENS, estimate_tokens, get_llm_client
+from services.semantic_cache import get_semantic_cache
 from utils.json_extraction import extract_json_from_response
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Bound concurrent LLM calls across all agents so batch synthesis does not
+# burst past the provider rate limit and trigger retry storms
+MAX_CONCURRENT_LLM_CALLS = 5
+_llm_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
 
-class InterviewState(str, Enum):
-    OPENING = "opening"
-    TRIGGER = "trigger"
-    CONTEXT = "context"
-    OPTIONS = "options"
-    DECISION = "decision"
-    RATIONALE = "rationale"
-    SUMMARIZING = "summarizing"
+# Most recent turns sent with each interview reply
+MAX_HISTORY_MESSAGES = 10
+
+
+class InterviewState(IntEnum):
+    """Interview stages in the order the interview progresses through them."""
+
+    OPENING = 0
+    TRIGGER = 1
+    CONTEXT = 2
+    OPTIONS = 3
+    DECISION = 4
+    RATIONALE = 5
+    SUMMARIZING = 6
+
+    @property
+    def label(self) -> str:
+        """User-facing stage name, e.g. "trigger"."""
+        return self.name.lower()
 
 
 # Stage-specific prompts with detailed guidance (ML-P2-1)
@@ -188,7 +207,7 @@ def _format_stage_guidance(state: InterviewState) -> str:
     stage_info = STAGE_PROMPTS.get(state, STAGE_PROMPTS[InterviewState.OPENING])
 
     guidance_parts = [
-        f"CURRENT STAGE: {state.value.upper()}",
+        f"CURRENT STAGE: {state.name}",
         f"GOAL: {stage_info['goal']}",
         "",
         "FOCUS AREAS:",
@@ -220,6 +239,159 @@ def _format_stage_guidance(state: InterviewState) -> str:
     return "\n".join(guidance_parts)
 
 
+# Stage guidance is static, so render it once at import instead of per turn
+_STAGE_GUIDANCE = {state: _format_stage_guidance(state) for state in InterviewState}
+
+_SYSTEM_PROMPT = """You are a knowledge capture assistant helping engineers document their decisions.
+
+Your goal is to extract a complete decision trace with these components:
+1. TRIGGER - What prompted the decision (problem, need, event)
+2. CONTEXT - Background, constraints, environment
+3. OPTIONS - Alternatives considered (including rejected ones)
+4. DECISION - What was ultimately chosen
+5. RATIONALE - Why this choice was made over others
+
+INTERVIEW GUIDELINES:
+- Ask ONE question at a time (never multiple questions)
+- Keep responses concise (2-3 sentences max)
+- Be conversational and encouraging
+- Listen carefully and reference what the user has said
+- Probe deeper when answers are vague
+- Move to the next stage when you have enough detail
+
+You will receive stage-specific guidance for what to focus on."""
+
+_RESPONSE_INSTRUCTIONS = """Based on the stage guidance above, respond naturally as the interview assistant.
+- Ask only ONE follow-up question relevant to the current stage
+- Keep your response concise (2-3 sentences)
+- Reference something specific the user said to show you're listening"""
+
+# Complete system message per stage. All static text lives here, ahead of the
+# conversation turns, so the prompt prefix is identical from one turn to the
+# next and can be served from the provider's prompt cache.
+_STAGE_SYSTEM_PROMPTS = {
+    state: f"{_SYSTEM_PROMPT}\n\n{guidance}\n\n---\n\n{_RESPONSE_INSTRUCTIONS}"
+    for state, guidance in _STAGE_GUIDANCE.items()
+}
+
+# Pre-written responses used in fast_mode or when the LLM is unavailable
+_FALLBACK_RESPONSES = {
+    InterviewState.TRIGGER: (
+        "Great, that's a good start! Can you tell me more about the context? "
+        "What was the situation you were in, and what constraints or requirements did you have?"
+    ),
+    InterviewState.CONTEXT: (
+        "I understand the situation better now. What alternatives or options "
+        "did you consider before making this decision?"
+    ),
+    InterviewState.OPTIONS: (
+        "Those are interesting alternatives. What did you ultimately decide to do? "
+        "What was your final choice?"
+    ),
+    InterviewState.DECISION: (
+        "Got it. Why did you choose this approach over the other options? "
+        "What factors influenced your decision?"
+    ),
+    InterviewState.RATIONALE: (
+        "Excellent! I have all the key information now. "
+        "Let me save this decision trace to your knowledge graph."
+    ),
+    InterviewState.SUMMARIZING: (
+        "This decision has been captured! You can view it in the Knowledge Graph "
+        "or start documenting another decision."
+    ),
+}
+
+_DEFAULT_FALLBACK_RESPONSE = (
+    "Thanks for sharing! What decision would you like to document? "
+    "Tell me what triggered this decision or what problem you were trying to solve."
+)
+
+
+_SYNTHESIS_PROMPT = """Based on this interview conversation, synthesize a complete decision trace.
+
+Conversation:
+{conversation_text}
+
+Return a JSON object with:
+{{
+  "trigger": "What prompted the decision",
+  "context": "Background and constraints",
+  "options": ["Option 1", "Option 2", ...],
+  "decision": "What was decided",
+  "rationale": "Why this was chosen",
+  "confidence": 0.0-1.0 (how complete is this trace)
+}}
+
+Return ONLY valid JSON."""
+
+# Semantic cache entries are keyed on the template, so editing the prompt or
+# its output schema invalidates earlier syntheses
+_SYNTHESIS_PROMPT_VERSION = hashlib.sha256(_SYNTHESIS_PROMPT.encode()).hexdigest()[:12]
+
+
+def _synthesis_matches(synthesis: dict, conversation_text: str) -> bool:
+    """Check that a cached synthesis describes this conversation.
+
+    Similar transcripts can differ only in the option that was chosen, so a
+    cached synthesis is reused only when its decision and every option
+    appear verbatim (case-insensitively) in the current transcript.
+    """
+    text = conversation_text.lower()
+    decision = synthesis.get("decision") or ""
+    options = synthesis.get("options") or []
+    return bool(decision) and all(
+        phrase.lower() in text for phrase in (decision, *options)
+    )
+
+
+def _state_for_count(response_count: int) -> InterviewState:
+    """Map a substantial-response count to the heuristic interview state.
+
+    The Nth substantial user response moves the interview to the Nth stage
+    after OPENING; anything past RATIONALE means summarize.
+    """
+    return InterviewState(min(response_count + 1, InterviewState.SUMMARIZING))
+
+
+def _format_history(history: list[dict], last: int | None = None) -> str:
+    """Render conversation messages as a "Role: content" transcript.
+
+    Args:
+        history: List of conversation messages
+        last: If given, only the last N messages are rendered
+
+    Returns:
+        Newline-joined transcript text
+    """
+    messages = history if last is None else history[-last:]
+    return "\n".join(f"{m['role'].title()}: {m['content']}" for m in messages)
+
+
+def _trim_history(
+    history: list[dict], max_messages: int, token_budget: int
+) -> list[dict]:
+    """Take the most recent messages that fit a message count and token budget.
+
+    Args:
+        history: List of conversation messages
+        max_messages: Maximum number of messages to keep
+        token_budget: Maximum estimated tokens across the kept messages
+
+    Returns:
+        The longest tail of history within both limits
+    """
+    start = len(history)
+    stop = max(start - max_messages, 0)
+    total = 0
+    for i in range(start - 1, stop - 1, -1):
+        total += estimate_tokens(history[i]["content"]) + MESSAGE_OVERHEAD_TOKENS
+        if total > token_budget:
+            break
+        start = i
+    return history[start:]
+
+
 class InterviewAgent:
     """AI-powered interview agent for knowledge capture using NVIDIA Llama.
 
@@ -239,30 +411,30 @@ class InterviewAgent:
             user_id: User ID for per-user rate limiting (SEC-009).
         """
         self.llm = get_llm_client()
-        self.extractor = DecisionExtractor()
+        # Shared extractor: a fresh one per agent would open its own LLM cache
+        # Redis connection, and agents are created per request
+        self.extractor = get_extractor()
         self.state = InterviewState.OPENING
         self.fast_mode = fast_mode
         self.user_id = user_id
+        # (history, len(history), count) from the last response count
+        self._response_count_cache: tuple[list[dict], int, int] | None = None
 
-    def _get_system_prompt(self) -> str:
-        return """You are a knowledge capture assistant helping engineers document their decisions.
+    async def _generate(self, prompt: str, **kwargs) -> str:
+        """Call the LLM, waiting for a slot in the shared concurrency limit.
 
-Your goal is to extract a complete decision trace with these components:
-1. TRIGGER - What prompted the decision (problem, need, event)
-2. CONTEXT - Background, constraints, environment
-3. OPTIONS - Alternatives considered (including rejected ones)
-4. DECISION - What was ultimately chosen
-5. RATIONALE - Why this choice was made over others
+        Args:
+            prompt: The user prompt
+            **kwargs: Passed through to LLMClient.generate
 
-INTERVIEW GUIDELINES:
-- Ask ONE question at a time (never multiple questions)
-- Keep responses concise (2-3 sentences max)
-- Be conversational and encouraging
-- Listen carefully and reference what the user has said
-- Probe deeper when answers are vague
-- Move to the next stage when you have enough detail
+        Returns:
+            The generated text
+        """
+        async with _llm_semaphore:
+            return await self.llm.generate(prompt, **kwargs)
 
-You will receive stage-specific guidance for what to focus on."""
+    def _get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
 
     def _get_stage_prompt(self, state: InterviewState) -> str:
         """Get the detailed prompt guidance for a specific interview stage.
@@ -276,7 +448,7 @@ You will receive stage-specific guidance for what to focus on."""
         Returns:
             Formatted stage guidance string
         """
-        return _format_stage_guidance(state)
+        return _STAGE_GUIDANCE[state]
 
     def _determine_next_state_heuristic(self, history: list[dict]) -> InterviewState:
         """Determine the next state using simple response count heuristic.
@@ -292,25 +464,34 @@ You will receive stage-specific guidance for what to focus on."""
         Returns:
             The appropriate next state
         """
-        # Count substantial user responses (>20 chars indicates real content)
-        user_responses = [
-            m for m in history if m["role"] == "user" and len(m["content"]) > 20
-        ]
+        return _state_for_count(self._count_substantial_responses(history))
 
-        response_count = len(user_responses)
+    def _count_substantial_responses(self, history: list[dict]) -> int:
+        """Count user responses long enough to carry real content (>20 chars).
 
-        if response_count == 0:
-            return InterviewState.TRIGGER
-        elif response_count == 1:
-            return InterviewState.CONTEXT
-        elif response_count == 2:
-            return InterviewState.OPTIONS
-        elif response_count == 3:
-            return InterviewState.DECISION
-        elif response_count == 4:
-            return InterviewState.RATIONALE
-        else:
-            return InterviewState.SUMMARIZING
+        History is append-only during a session, so the count is cached
+        against the history list and only messages appended since the last
+        call are scanned. Repeated state lookups within one turn are free and
+        each new turn costs O(new messages) rather than a full rescan.
+
+        Args:
+            history: List of conversation messages
+
+        Returns:
+            Number of substantial user responses
+        """
+        start, count = 0, 0
+        cached = self._response_count_cache
+        if cached is not None and cached[0] is history and cached[1] <= len(history):
+            start, count = cached[1], cached[2]
+
+        for i in range(start, len(history)):
+            m = history[i]
+            if m["role"] == "user" and len(m["content"]) > 20:
+                count += 1
+
+        self._response_count_cache = (history, len(history), count)
+        return count
 
     def _analyze_content_coverage(self, history: list[dict]) -> dict[str, float]:
         """Analyze what decision components are covered in the conversation.
@@ -466,10 +647,7 @@ You will receive stage-specific guidance for what to focus on."""
             The appropriate next state
         """
         # For very short conversations, use simple heuristic
-        user_responses = [
-            m for m in history if m["role"] == "user" and len(m["content"]) > 20
-        ]
-        if len(user_responses) <= 1:
+        if self._count_substantial_responses(history) <= 1:
             return self._determine_next_state_heuristic(history)
 
         # Analyze content coverage
@@ -523,9 +701,7 @@ You will receive stage-specific guidance for what to focus on."""
             return InterviewState.TRIGGER
 
         # Format conversation for LLM
-        conversation_text = "\n".join(
-            f"{m['role'].title()}: {m['content']}" for m in history[-8:]
-        )
+        conversation_text = _format_history(history, last=8)
 
         prompt = f"""Analyze this interview conversation and determine what information is still needed
 to complete a decision trace.
@@ -546,7 +722,7 @@ Respond with ONLY one of: TRIGGER, CONTEXT, OPTIONS, DECISION, RATIONALE, or COM
 If all components are well-covered, respond with COMPLETE."""
 
         try:
-            response = await self.llm.generate(
+            response = await self._generate(
                 prompt,
                 temperature=0.1,  # Low temperature for deterministic output
                 max_tokens=20,
@@ -568,7 +744,7 @@ If all components are well-covered, respond with COMPLETE."""
 
             for key, state in state_mapping.items():
                 if key in response_upper:
-                    logger.debug(f"LLM determined stage: {state.value}")
+                    logger.debug(f"LLM determined stage: {state.label}")
                     return state
 
             # Couldn't parse response, fall back to content analysis
@@ -579,6 +755,38 @@ If all components are well-covered, respond with COMPLETE."""
             logger.warning(f"LLM state determination failed: {e}, using heuristic")
             return self._determine_next_state_heuristic(history)
 
+    def _build_prompt(
+        self, history: list[dict], user_message: str = ""
+    ) -> tuple[str, list[dict]]:
+        """Build the LLM request for the current stage (ML-P2-1).
+
+        Static system + stage guidance come first and the most recent turns
+        follow as chat messages, so only the tail of the prompt changes
+        between turns. Expects self.state to already be set for this turn.
+
+        ML-P1-3: Turns are kept only while the estimated prompt stays under
+        max_prompt_tokens * prompt_warning_threshold, so long messages cannot
+        grow prefill cost without bound.
+
+        Args:
+            history: Previous conversation history
+            user_message: The message being answered, counted against the budget
+
+        Returns:
+            Tuple of (system prompt, recent history messages)
+        """
+        system_prompt = _STAGE_SYSTEM_PROMPTS[self.state]
+        settings = get_settings()
+        token_budget = (
+            int(settings.max_prompt_tokens * settings.prompt_warning_threshold)
+            - estimate_tokens(system_prompt)
+            - estimate_tokens(user_message)
+            - 2 * MESSAGE_OVERHEAD_TOKENS
+        )
+        return system_prompt, _trim_history(
+            history, MAX_HISTORY_MESSAGES, token_budget
+        )
+
     async def process_message(
         self,
         user_message: str,
@@ -598,40 +806,18 @@ If all components are well-covered, respond with COMPLETE."""
 
         # Fast mode: use pre-written responses for instant feedback
         if self.fast_mode:
-            return self._generate_fallback_response(user_message, history), []
-
-        # Build prompt with stage-specific guidance (ML-P2-1)
-        system_prompt = self._get_system_prompt()
-        stage_guidance = self._get_stage_prompt(self.state)
+            return self.fast_reply(user_message, history, self.state), []
 
-        # Format conversation history (keep last 10 for context)
-        history_text = "\n".join(
-            f"{m['role'].title()}: {m['content']}" for m in history[-10:]
-        )
-
-        prompt = f"""{stage_guidance}
-
----
-
-CONVERSATION HISTORY:
-{history_text}
-
-User: {user_message}
-
----
-
-Based on the stage guidance above, respond naturally as the interview assistant.
-- Ask only ONE follow-up question relevant to the current stage
-- Keep your response concise (2-3 sentences)
-- Reference something specific the user said to show you're listening"""
+        system_prompt, recent_history = self._build_prompt(history, user_message)
 
         try:
             # SEC-009: Pass user_id for per-user rate limiting
-            response_text = await self.llm.generate(
-                prompt,
+            response_text = await self._generate(
+                user_message,
                 system_prompt=system_prompt,
                 temperature=0.7,
                 user_id=self.user_id,
+                history=recent_history,
             )
 
             # Skip entity extraction during chat for faster responses
@@ -640,12 +826,39 @@ Based on the stage guidance above, respond naturally as the interview assistant.
 
         except (TimeoutError, ConnectionError) as e:
             logger.error(f"LLM connection error: {e}")
-            return self._generate_fallback_response(user_message, history), []
+            return (
+                self._generate_fallback_response(user_message, history, self.state),
+                [],
+            )
+
+    def fast_reply(
+        self,
+        user_message: str,
+        history: list[dict],
+        state: InterviewState | None = None,
+    ) -> str:
+        """Reply with the pre-written response for the current stage.
+
+        Synchronous fast_mode counterpart to process_message/stream_response:
+        no LLM call is made, so callers can skip the coroutine/async-generator
+        machinery entirely.
+
+        Args:
+            user_message: The user's message
+            history: Previous conversation history
+            state: Stage already determined for this turn. If None, the
+                   stage is determined from the history.
+
+        Returns:
+            Pre-written response appropriate for the current stage
+        """
+        return self._generate_fallback_response(user_message, history, state)
 
     def _generate_fallback_response(
         self,
         user_message: str,
         history: list[dict],
+        state: InterviewState | None = None,
     ) -> str:
         """Generate a pre-written response for fast interaction.
 
@@ -654,45 +867,18 @@ Based on the stage guidance above, respond naturally as the interview assistant.
         Args:
             user_message: The user's message
             history: Previous conversation history
+            state: Stage already determined for this turn. If None, the
+                   stage is determined from the history.
 
         Returns:
             Pre-written response appropriate for the current stage
         """
-        self.state = self._determine_next_state(history)
-
-        responses = {
-            InterviewState.TRIGGER: (
-                "Great, that's a good start! Can you tell me more about the context? "
-                "What was the situation you were in, and what constraints or requirements did you have?"
-            ),
-            InterviewState.CONTEXT: (
-                "I understand the situation better now. What alternatives or options "
-                "did you consider before making this decision?"
-            ),
-            InterviewState.OPTIONS: (
-                "Those are interesting alternatives. What did you ultimately decide to do? "
-                "What was your final choice?"
-            ),
-            InterviewState.DECISION: (
-                "Got it. Why did you choose this approach over the other options? "
-                "What factors influenced your decision?"
-            ),
-            InterviewState.RATIONALE: (
-                "Excellent! I have all the key information now. "
-                "Let me save this decision trace to your knowledge graph."
-            ),
-            InterviewState.SUMMARIZING: (
-                "This decision has been captured! You can view it in the Knowledge Graph "
-                "or start documenting another decision."
-            ),
-        }
-
-        return responses.get(
-            self.state,
-            "Thanks for sharing! What decision would you like to document? "
-            "Tell me what triggered this decision or what problem you were trying to solve.",
+        self.state = (
+            state if state is not None else self._determine_next_state(history)
         )
 
+        return _FALLBACK_RESPONSES.get(self.state, _DEFAULT_FALLBACK_RESPONSE)
+
     async def stream_response(
         self,
         user_message: str,
@@ -712,43 +898,20 @@ Based on the stage guidance above, respond naturally as the interview assistant.
 
         # Fast mode: return pre-written response immediately
         if self.fast_mode:
-            response = self._generate_fallback_response(user_message, history)
-            yield response, []
+            yield self.fast_reply(user_message, history, self.state), []
             return
 
-        # Build prompt with stage-specific guidance (ML-P2-1)
-        system_prompt = self._get_system_prompt()
-        stage_guidance = self._get_stage_prompt(self.state)
-
-        # Format conversation history
-        history_text = "\n".join(
-            f"{m['role'].title()}: {m['content']}" for m in history[-10:]
-        )
-
-        prompt = f"""{stage_guidance}
-
----
-
-CONVERSATION HISTORY:
-{history_text}
-
-User: {user_message}
-
----
-
-Based on the stage guidance above, respond naturally as the interview assistant.
-- Ask only ONE follow-up question relevant to the current stage
-- Keep your response concise (2-3 sentences)
-- Reference something specific the user said to show you're listening"""
+        system_prompt, recent_history = self._build_prompt(history, user_message)
 
         try:
             full_response = ""
             # SEC-009: Pass user_id for per-user rate limiting
             async for chunk in self.llm.generate_stream(
-                prompt,
+                user_message,
                 system_prompt=system_prompt,
                 temperature=0.7,
                 user_id=self.user_id,
+                history=recent_history,
             ):
                 full_response += chunk
                 yield chunk, []
@@ -758,7 +921,10 @@ Based on the stage guidance above, respond naturally as the interview assistant.
 
         except (TimeoutError, ConnectionError) as e:
             logger.error(f"LLM connection error during streaming: {e}")
-            yield self._generate_fallback_response(user_message, history), []
+            yield (
+                self._generate_fallback_response(user_message, history, self.state),
+                [],
+            )
 
     async def synthesize_decision(self, history: list[dict]) -> dict:
         """Synthesize a complete decision trace from the conversation.
@@ -769,30 +935,24 @@ Based on the stage guidance above, respond naturally as the interview assistant.
         Returns:
             Decision trace dict with trigger, context, options, decision, rationale, confidence
         """
-        conversation_text = "\n".join(
-            f"{m['role'].title()}: {m['content']}" for m in history
-        )
-
-        prompt = f"""Based on this interview conversation, synthesize a complete decision trace.
-
-Conversation:
-{conversation_text}
-
-Return a JSON object with:
-{{
-  "trigger": "What prompted the decision",
-  "context": "Background and constraints",
-  "options": ["Option 1", "Option 2", ...],
-  "decision": "What was decided",
-  "rationale": "Why this was chosen",
-  "confidence": 0.0-1.0 (how complete is this trace)
-}}
-
-Return ONLY valid JSON."""
+        conversation_text = _format_history(history)
+        prompt = _SYNTHESIS_PROMPT.format(conversation_text=conversation_text)
+
+        # Near-duplicate sessions may reuse an earlier synthesis for this user,
+        # but only if the cached decision and options occur in this transcript
+        cache = get_semantic_cache()
+        cache_user = self.user_id or "anonymous"
+        embedding = await cache.embed(conversation_text)
+        if embedding is not None:
+            cached = await cache.get(
+                embedding, "synthesis", _SYNTHESIS_PROMPT_VERSION, cache_user
+            )
+            if cached is not None and _synthesis_matches(cached, conversation_text):
+                return cached
 
         try:
             # SEC-009: Pass user_id for per-user rate limiting
-            response = await self.llm.generate(
+            response = await self._generate(
                 prompt,
                 temperature=0.3,
                 user_id=self.user_id,
@@ -806,7 +966,7 @@ Return ONLY valid JSON."""
                 return self._create_default_decision(history)
 
             # Validate required fields and add defaults
-            return {
+            decision = {
                 "trigger": result.get("trigger", "Unknown trigger"),
                 "context": result.get("context", ""),
                 "options": result.get("options", []),
@@ -814,6 +974,15 @@ Return ONLY valid JSON."""
                 "rationale": result.get("rationale", ""),
                 "confidence": result.get("confidence", 0.5),
             }
+            if embedding is not None:
+                await cache.set(
+                    embedding,
+                    "synthesis",
+                    _SYNTHESIS_PROMPT_VERSION,
+                    cache_user,
+                    decision,
+                )
+            return decision
 
         except (TimeoutError, ConnectionError) as e:
             logger.error(f"LLM connection error during synthesis: {e}")
@@ -822,6 +991,22 @@ Return ONLY valid JSON."""
             logger.error(f"Unexpected error during synthesis: {e}")
             return self._create_default_decision(history)
 
+    async def process_batch(self, sessions: list[list[dict]]) -> list[dict]:
+        """Synthesize decision traces for several conversations concurrently.
+
+        LLM calls share the module-wide concurrency limit, so large batches
+        are throttled rather than sent to the provider all at once.
+
+        Args:
+            sessions: Conversation histories, one per session
+
+        Returns:
+            Decision trace dicts in the same order as sessions
+        """
+        return list(
+            await asyncio.gather(*(self.synthesize_decision(h) for h in sessions))
+        )
+
     def _create_default_decision(self, history: list[dict]) -> dict:
         """Create a default decision structure from conversation history.
 
@@ -1,10 +1,31 @@
 """Application configuration with secure handling of sensitive values (SEC-007)."""
 
+import re
 from functools import lru_cache
 
-from pydantic import SecretStr, field_validator
+from pydantic import PrivateAttr, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Matches the password segment of a URL (user:password@host)
+_URL_PASSWORD_RE = re.compile(r":([^:@]+)@")
+
+# Non-sensitive Settings fields shown by __repr__, in display order (SEC-007)
+_REPR_FIELDS = (
+    "database_url",
+    "neo4j_uri",
+    "neo4j_user",
+    "redis_url",
+    "nvidia_model",
+    "nvidia_embedding_model",
+    "rate_limit_requests",
+    "max_prompt_tokens",
+    "claude_logs_path",
+    "algorithm",
+    "debug",
+    "cors_origins",
+)
+_MASKED_URL_FIELDS = frozenset({"database_url", "redis_url"})
+
 
 class Settings(BaseSettings):
     """Application settings with secure secret handling.
@@ -24,13 +45,35 @@ class Settings(BaseSettings):
             return v.replace("postgresql://", "postgresql+asyncpg://", 1)
         return v
 
+    # PostgreSQL connection pool (SD-009)
+    # pool_size + max_overflow should cover peak concurrent DB-bound requests
+    postgres_pool_size: int = 20  # Connections kept open in the pool
+    postgres_max_overflow: int = 40  # Extra connections allowed under burst load
+    postgres_pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    postgres_pool_recycle: int = 1800  # Recycle connections after this many seconds
+    postgres_jit: bool = False  # JIT slows down short OLTP queries, so off by default
+    postgres_statement_cache_size: int = 1024  # Prepared statements kept per connection
+    postgres_create_tables: bool = True  # Disable when Alembic manages the schema
+
     neo4j_uri: str = (
         ""  # e.g., bolt://localhost:7687 or neo4j+s://xxx.databases.neo4j.io
     )
     neo4j_user: str = ""
     neo4j_password: SecretStr = SecretStr("")  # SEC-007: Use SecretStr for passwords
+    # Naming the database saves a home-database lookup round-trip per session
+    neo4j_database: str = "neo4j"
+
+    # Neo4j connection pool (SD-009)
+    neo4j_pool_max_size: int = 100  # Maximum pooled connections
+    neo4j_pool_acquisition_timeout: float = 60.0  # Seconds to wait for a connection
+
     redis_url: str = ""  # e.g., redis://localhost:6379
 
+    # Redis connection pool (SD-009)
+    redis_pool_max_size: int = 50  # Maximum pooled connections
+    redis_socket_timeout: float = 5.0  # Socket and connect timeout in seconds
+    redis_health_check_interval: int = 30  # Idle seconds before a connection is pinged
+
     # AI Provider (NVIDIA NIM) - SEC-007: Use SecretStr for API keys
     nvidia_api_key: SecretStr = SecretStr("")
     nvidia_model: str = "nvidia/llama-3.3-nemotron-super-49b-v1.5"
@@ -67,6 +110,11 @@ class Settings(BaseSettings):
     llm_extraction_prompt_version: str = (
         "v1"  # Bump when prompts change to invalidate cache
     )
+    # Semantic LLM cache: reuse responses for near-duplicate inputs
+    semantic_cache_enabled: bool = False  # Opt-in: hits are approximate matches
+    semantic_cache_threshold: float = 0.95  # Minimum cosine similarity for a hit
+    semantic_cache_max_text_length: int = 8000  # Longer inputs are not cached
+    semantic_cache_max_entries: int = 32  # Entries kept per user and response kind
     # LLM model fallback settings (ML-QW-2)
     # If primary model fails, fall back to a secondary model
     llm_fallback_model: str = "nvidia/llama-3.1-nemotron-70b-instruct"  # Fallback model
@@ -114,35 +162,38 @@ class Settings(BaseSettings):
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
+    # get_settings() is cached, so repr is built once and reused by log calls
+    _cached_repr: str | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value) -> None:
+        # Field assignment (e.g. test overrides) invalidates the cached repr
+        if not name.startswith("_"):
+            self._cached_repr = None
+        super().__setattr__(name, value)
+
     def __repr__(self) -> str:
         """Custom repr that masks sensitive values (SEC-007)."""
-        # Only show non-sensitive fields in repr
-        safe_fields = {
-            "database_url": self._mask_url(self.database_url),
-            "neo4j_uri": self.neo4j_uri,
-            "neo4j_user": self.neo4j_user,
-            "redis_url": self._mask_url(self.redis_url),
-            "nvidia_model": self.nvidia_model,
-            "nvidia_embedding_model": self.nvidia_embedding_model,
-            "rate_limit_requests": self.rate_limit_requests,
-            "max_prompt_tokens": self.max_prompt_tokens,
-            "claude_logs_path": self.claude_logs_path,
-            "algorithm": self.algorithm,
-            "debug": self.debug,
-            "cors_origins": self.cors_origins,
-        }
-        fields_str = ", ".join(f"{k}={v!r}" for k, v in safe_fields.items())
-        return f"Settings({fields_str})"
+        if self._cached_repr is None:
+            # Only show non-sensitive fields in repr
+            fields_str = ", ".join(
+                f"{name}={self._repr_value(name)!r}" for name in _REPR_FIELDS
+            )
+            self._cached_repr = f"Settings({fields_str})"
+        return self._cached_repr
+
+    def _repr_value(self, name: str):
+        """Get a field value for repr, masking URL passwords."""
+        value = getattr(self, name)
+        if name in _MASKED_URL_FIELDS:
+            return self._mask_url(value)
+        return value
 
     @staticmethod
     def _mask_url(url: str) -> str:
         """Mask password in database URLs."""
         if not url:
             return url
-        # Simple masking for URLs with passwords
-        import re
-
-        return re.sub(r":([^:@]+)@", ":***@", url)
+        return _URL_PASSWORD_RE.sub(":***@", url)
 
     def get_nvidia_api_key(self) -> str:
         """Safely get NVIDIA API key value."""
@@ -161,6 +212,7 @@ class Settings(BaseSettings):
         return self.neo4j_password.get_secret_value()
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Get the process-wide settings, parsed from the environment once."""
     return Settings()
@@ -1,9 +1,12 @@
 """Neo4j database connection with configurable connection pooling and retry logic (SD-009).
 
 Pool configuration via environment variables:
-- NEO4J_POOL_MAX_SIZE: Maximum connections (default: 50)
+- NEO4J_POOL_MAX_SIZE: Maximum connections (default: 100)
 - NEO4J_POOL_ACQUISITION_TIMEOUT: Connection acquisition timeout in seconds (default: 60)
 
+Session configuration:
+- NEO4J_DATABASE: Database that sessions run against (default: neo4j)
+
 Retry configuration:
 - NEO4J_MAX_RETRIES: Maximum retry attempts (default: 3)
 - NEO4J_RETRY_DELAY: Base delay for exponential backoff (default: 1.0)
@@ -11,9 +14,11 @@ Retry configuration:
 
 import asyncio
 import random
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, Callable, TypeVar
 
-from neo4j import AsyncGraphDatabase
+from neo4j import AsyncGraphDatabase, AsyncSession
 from neo4j.exceptions import (
     ClientError,
     DatabaseError,
@@ -24,7 +29,7 @@ from neo4j.exceptions import (
 
 from config import get_settings
 from utils.logging import get_logger
-from utils.vectors import cosine_similarity
+from utils.vectors import vector_norm
 
 logger = get_logger(__name__)
 
@@ -33,6 +38,12 @@ driver = None
 # Embedding dimensions from NVIDIA NV-EmbedQA model
 EMBEDDING_DIMENSIONS = 2048
 
+# Candidates requested from a vector index (HNSW) before user/threshold
+# filtering. The index returns the global top-k, so scoped lookups over-fetch.
+# Note: for cosine indexes Neo4j reports score = (1 + cosine) / 2, so queries
+# convert with `2 * score - 1` before comparing against cosine thresholds.
+VECTOR_SEARCH_CANDIDATES = 50
+
 T = TypeVar("T")
 
 # Exceptions that should trigger a retry (SD-009)
@@ -138,14 +149,229 @@ async def with_retry(
     raise RuntimeError(f"Unexpected state in retry for {operation_name}")
 
 
+# Seconds to wait at startup for indexes to finish populating
+INDEX_ONLINE_TIMEOUT_SECONDS = 60
+
+# Constraints and indexes created at startup as (name, cypher, required).
+# Optional statements depend on the Neo4j version/edition (e.g. vector indexes
+# need 5.11+) and are skipped rather than failing startup.
+NEO4J_SCHEMA_STATEMENTS: tuple[tuple[str, str, bool], ...] = (
+    # Constraints
+    (
+        "decision_id constraint",
+        "CREATE CONSTRAINT decision_id IF NOT EXISTS FOR (d:DecisionTrace) REQUIRE d.id IS UNIQUE",
+        True,
+    ),
+    (
+        "entity_id constraint",
+        "CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (e:Entity) REQUIRE e.id IS UNIQUE",
+        True,
+    ),
+    (
+        "concept_id constraint",
+        "CREATE CONSTRAINT concept_id IF NOT EXISTS FOR (c:Concept) REQUIRE c.id IS UNIQUE",
+        True,
+    ),
+    (
+        "system_id constraint",
+        "CREATE CONSTRAINT system_id IF NOT EXISTS FOR (s:System) REQUIRE s.id IS UNIQUE",
+        True,
+    ),
+    (
+        "technology_id constraint",
+        "CREATE CONSTRAINT technology_id IF NOT EXISTS FOR (t:Technology) REQUIRE t.id IS UNIQUE",
+        True,
+    ),
+    (
+        "pattern_id constraint",
+        "CREATE CONSTRAINT pattern_id IF NOT EXISTS FOR (p:Pattern) REQUIRE p.id IS UNIQUE",
+        True,
+    ),
+    # Standard indexes
+    (
+        "decision_created index",
+        "CREATE INDEX decision_created IF NOT EXISTS FOR (d:DecisionTrace) ON (d.created_at)",
+        True,
+    ),
+    (
+        "entity_name index",
+        "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)",
+        True,
+    ),
+    (
+        "entity_type index",
+        "CREATE INDEX entity_type IF NOT EXISTS FOR (e:Entity) ON (e.type)",
+        True,
+    ),
+    # Case-insensitive entity lookup (lowercase name)
+    (
+        "entity_name_lookup index",
+        "CREATE INDEX entity_name_lookup IF NOT EXISTS FOR (e:Entity) ON (e.name)",
+        False,
+    ),
+    # Entity aliases index for resolution
+    (
+        "entity_aliases index",
+        "CREATE INDEX entity_aliases IF NOT EXISTS FOR (e:Entity) ON (e.aliases)",
+        False,
+    ),
+    # Decision source index for filtering
+    (
+        "decision_source index",
+        "CREATE INDEX decision_source IF NOT EXISTS FOR (d:DecisionTrace) ON (d.source)",
+        False,
+    ),
+    # KG-P1-6: Composite indexes for common query patterns
+    # Decision user_id + source for user-scoped queries by source
+    (
+        "decision_user_source composite index",
+        "CREATE INDEX decision_user_source IF NOT EXISTS FOR (d:DecisionTrace) ON (d.user_id, d.source)",
+        False,
+    ),
+    # Decision user_id + created_at for user timeline queries
+    (
+        "decision_user_created composite index",
+        "CREATE INDEX decision_user_created IF NOT EXISTS FOR (d:DecisionTrace) ON (d.user_id, d.created_at)",
+        False,
+    ),
+    # Decision user_id + trigger for bulk import duplicate checks; the decision
+    # text is compared as COALESCE(agent_decision, decision), so it is filtered
+    # after the seek rather than indexed
+    (
+        "decision_user_trigger composite index",
+        "CREATE INDEX decision_user_trigger IF NOT EXISTS FOR (d:DecisionTrace) ON (d.user_id, d.trigger)",
+        False,
+    ),
+    # Entity type + name for type-filtered lookups
+    (
+        "entity_type_name composite index",
+        "CREATE INDEX entity_type_name IF NOT EXISTS FOR (e:Entity) ON (e.type, e.name)",
+        False,
+    ),
+    # Decision source + created_at for time-based source analysis
+    (
+        "decision_source_time composite index",
+        "CREATE INDEX decision_source_time IF NOT EXISTS FOR (d:DecisionTrace) ON (d.source, d.created_at)",
+        False,
+    ),
+    # Index for user_id alone (frequently used in WHERE clauses)
+    (
+        "decision_user_id index",
+        "CREATE INDEX decision_user_id IF NOT EXISTS FOR (d:DecisionTrace) ON (d.user_id)",
+        False,
+    ),
+    # Vector indexes for semantic search (Neo4j 5.11+)
+    (
+        "decision_embedding vector index",
+        f"""
+        CREATE VECTOR INDEX decision_embedding IF NOT EXISTS
+        FOR (d:DecisionTrace)
+        ON d.embedding
+        OPTIONS {{
+            indexConfig: {{
+                `vector.dimensions`: {EMBEDDING_DIMENSIONS},
+                `vector.similarity_function`: 'cosine'
+            }}
+        }}
+        """,
+        False,
+    ),
+    (
+        "entity_embedding vector index",
+        f"""
+        CREATE VECTOR INDEX entity_embedding IF NOT EXISTS
+        FOR (e:Entity)
+        ON e.embedding
+        OPTIONS {{
+            indexConfig: {{
+                `vector.dimensions`: {EMBEDDING_DIMENSIONS},
+                `vector.similarity_function`: 'cosine'
+            }}
+        }}
+        """,
+        False,
+    ),
+    # Full-text indexes for hybrid search
+    (
+        "decision_fulltext index",
+        """
+        CREATE FULLTEXT INDEX decision_fulltext IF NOT EXISTS
+        FOR (d:DecisionTrace)
+        ON EACH [d.trigger, d.context, d.agent_decision, d.agent_rationale]
+        """,
+        False,
+    ),
+    (
+        "entity_fulltext index",
+        """
+        CREATE FULLTEXT INDEX entity_fulltext IF NOT EXISTS
+        FOR (e:Entity)
+        ON EACH [e.name]
+        """,
+        False,
+    ),
+)
+
+
+async def _create_schema(session) -> None:
+    """Create all constraints and indexes in NEO4J_SCHEMA_STATEMENTS.
+
+    All statements are first sent in a single write transaction, so startup
+    costs one round trip instead of one per statement. If any statement fails
+    the transaction is rolled back and the statements are re-run one at a
+    time, where failures of optional statements are logged and skipped.
+    """
+
+    async def _run_all(tx):
+        for _, query, _ in NEO4J_SCHEMA_STATEMENTS:
+            result = await tx.run(query)
+            await result.consume()
+
+    try:
+        await session.execute_write(_run_all)
+        logger.info(
+            f"Created {len(NEO4J_SCHEMA_STATEMENTS)} Neo4j constraints/indexes"
+        )
+        return
+    except (ClientError, DatabaseError) as e:
+        logger.debug(f"Batched schema creation failed, running per statement: {e}")
+
+    for name, query, required in NEO4J_SCHEMA_STATEMENTS:
+        if required:
+            await (await session.run(query)).consume()
+            continue
+        try:
+            await (await session.run(query)).consume()
+            logger.info(f"Created {name}")
+        except (ClientError, DatabaseError) as e:
+            logger.debug(f"{name} skipped: {e}")
+
+
+async def _await_indexes(session) -> None:
+    """Wait for newly created indexes to come online.
+
+    Queries issued while an index is still populating fall back to label
+    scans, so startup waits up to INDEX_ONLINE_TIMEOUT_SECONDS. A timeout is
+    logged rather than failing startup; the indexes keep populating.
+    """
+    try:
+        await (
+            await session.run(
+                "CALL db.awaitIndexes($timeout)",
+                timeout=INDEX_ONLINE_TIMEOUT_SECONDS,
+            )
+        ).consume()
+    except (ClientError, DatabaseError) as e:
+        logger.warning(f"Neo4j indexes not online yet: {e}")
+
+
 async def init_neo4j():
     """Initialize Neo4j connection with configurable pool settings."""
     global driver
     settings = get_settings()
 
-    # Get pool settings from environment with defaults
-    pool_max_size = getattr(settings, "neo4j_pool_max_size", 50)
-    pool_acquisition_timeout = getattr(settings, "neo4j_pool_acquisition_timeout", 60)
+    pool_max_size = settings.neo4j_pool_max_size
+    pool_acquisition_timeout = settings.neo4j_pool_acquisition_timeout
 
     logger.info(
         f"Initializing Neo4j connection pool: "
@@ -161,177 +387,9 @@ async def init_neo4j():
 
     # Create constraints and indexes with retry (SD-009)
     async def create_indexes():
-        async with driver.session() as session:
-            # Constraints
-            await session.run(
-                "CREATE CONSTRAINT decision_id IF NOT EXISTS FOR (d:DecisionTrace) REQUIRE d.id IS UNIQUE"
-            )
-            await session.run(
-                "CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (e:Entity) REQUIRE e.id IS UNIQUE"
-            )
-            await session.run(
-                "CREATE CONSTRAINT concept_id IF NOT EXISTS FOR (c:Concept) REQUIRE c.id IS UNIQUE"
-            )
-            await session.run(
-                "CREATE CONSTRAINT system_id IF NOT EXISTS FOR (s:System) REQUIRE s.id IS UNIQUE"
-            )
-            await session.run(
-                "CREATE CONSTRAINT technology_id IF NOT EXISTS FOR (t:Technology) REQUIRE t.id IS UNIQUE"
-            )
-            await session.run(
-                "CREATE CONSTRAINT pattern_id IF NOT EXISTS FOR (p:Pattern) REQUIRE p.id IS UNIQUE"
-            )
-
-            # Standard indexes
-            await session.run(
-                "CREATE INDEX decision_created IF NOT EXISTS FOR (d:DecisionTrace) ON (d.created_at)"
-            )
-            await session.run(
-                "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)"
-            )
-            await session.run(
-                "CREATE INDEX entity_type IF NOT EXISTS FOR (e:Entity) ON (e.type)"
-            )
-
-            # Case-insensitive entity lookup (lowercase name)
-            try:
-                await session.run(
-                    "CREATE INDEX entity_name_lookup IF NOT EXISTS FOR (e:Entity) ON (e.name)"
-                )
-                logger.info("Created entity_name_lookup index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Entity name lookup index skipped: {e}")
-
-            # Entity aliases index for resolution
-            try:
-                await session.run(
-                    "CREATE INDEX entity_aliases IF NOT EXISTS FOR (e:Entity) ON (e.aliases)"
-                )
-                logger.info("Created entity_aliases index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Entity aliases index skipped: {e}")
-
-            # Decision source index for filtering
-            try:
-                await session.run(
-                    "CREATE INDEX decision_source IF NOT EXISTS FOR (d:DecisionTrace) ON (d.source)"
-                )
-                logger.info("Created decision_source index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Decision source index skipped: {e}")
-
-            # KG-P1-6: Composite indexes for common query patterns
-
-            # Decision user_id + source for user-scoped queries by source
-            try:
-                await session.run(
-                    "CREATE INDEX decision_user_source IF NOT EXISTS FOR (d:DecisionTrace) ON (d.user_id, d.source)"
-                )
-                logger.info("Created decision_user_source composite index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Decision user_source index skipped: {e}")
-
-            # Decision user_id + created_at for user timeline queries
-            try:
-                await session.run(
-                    "CREATE INDEX decision_user_created IF NOT EXISTS FOR (d:DecisionTrace) ON (d.user_id, d.created_at)"
-                )
-                logger.info("Created decision_user_created composite index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Decision user_created index skipped: {e}")
-
-            # Entity type + name for type-filtered lookups
-            try:
-                await session.run(
-                    "CREATE INDEX entity_type_name IF NOT EXISTS FOR (e:Entity) ON (e.type, e.name)"
-                )
-                logger.info("Created entity_type_name composite index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Entity type_name index skipped: {e}")
-
-            # Decision source + created_at for time-based source analysis
-            try:
-                await session.run(
-                    "CREATE INDEX decision_source_time IF NOT EXISTS FOR (d:DecisionTrace) ON (d.source, d.created_at)"
-                )
-                logger.info("Created decision_source_time composite index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Decision source_time index skipped: {e}")
-
-            # Index for user_id alone (frequently used in WHERE clauses)
-            try:
-                await session.run(
-                    "CREATE INDEX decision_user_id IF NOT EXISTS FOR (d:DecisionTrace) ON (d.user_id)"
-                )
-                logger.info("Created decision_user_id index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Decision user_id index skipped: {e}")
-
-            # Vector indexes for semantic search (Neo4j 5.11+)
-            try:
-                await session.run(
-                    """
-                    CREATE VECTOR INDEX decision_embedding IF NOT EXISTS
-                    FOR (d:DecisionTrace)
-                    ON d.embedding
-                    OPTIONS {
-                        indexConfig: {
-                            `vector.dimensions`: $dimensions,
-                            `vector.similarity_function`: 'cosine'
-                        }
-                    }
-                    """,
-                    dimensions=EMBEDDING_DIMENSIONS,
-                )
-                logger.info("Created decision_embedding vector index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(
-                    f"Vector index creation skipped (may already exist or Neo4j < 5.11): {e}"
-                )
-
-            try:
-                await session.run(
-                    """
-                    CREATE VECTOR INDEX entity_embedding IF NOT EXISTS
-                    FOR (e:Entity)
-                    ON e.embedding
-                    OPTIONS {
-                        indexConfig: {
-                            `vector.dimensions`: $dimensions,
-                            `vector.similarity_function`: 'cosine'
-                        }
-                    }
-                    """,
-                    dimensions=EMBEDDING_DIMENSIONS,
-                )
-                logger.info("Created entity_embedding vector index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Vector index creation skipped: {e}")
-
-            # Full-text indexes for hybrid search
-            try:
-                await session.run(
-                    """
-                    CREATE FULLTEXT INDEX decision_fulltext IF NOT EXISTS
-                    FOR (d:DecisionTrace)
-                    ON EACH [d.trigger, d.context, d.agent_decision, d.agent_rationale]
-                    """
-                )
-                logger.info("Created decision_fulltext index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Full-text index creation skipped: {e}")
-
-            try:
-                await session.run(
-                    """
-                    CREATE FULLTEXT INDEX entity_fulltext IF NOT EXISTS
-                    FOR (e:Entity)
-                    ON EACH [e.name]
-                    """
-                )
-                logger.info("Created entity_fulltext index")
-            except (ClientError, DatabaseError) as e:
-                logger.debug(f"Full-text index creation skipped: {e}")
+        async with _open_session() as session:
+            await _create_schema(session)
+            await _await_indexes(session)
 
     await with_retry(
         create_indexes,
@@ -351,9 +409,49 @@ async def close_neo4j():
         logger.info("Neo4j connection pool closed")
 
 
+def _open_session():
+    """Open a pooled session on the configured database.
+
+    Sessions without an explicit database make the driver resolve the user's
+    home database first, costing an extra round-trip per session.
+    """
+    return driver.session(database=get_settings().neo4j_database)
+
+
 async def get_neo4j_session():
     """Get a Neo4j session from the pool."""
-    return driver.session()
+    return _open_session()
+
+
+async def get_neo4j_db() -> AsyncIterator[AsyncSession]:
+    """Get a Neo4j session for the request, closed once the request is done.
+
+    FastAPI dependency counterpart of get_neo4j_session:
+
+        session: AsyncSession = Depends(get_neo4j_db)
+    """
+    async with _open_session() as session:
+        yield session
+
+
+@asynccontextmanager
+async def neo4j_session(session=None) -> AsyncIterator:
+    """Use the caller's session if given, otherwise a pooled one closed on exit.
+
+    Lets helpers accept an optional session without open/close boilerplate:
+
+        async with neo4j_session(session) as session:
+            ...
+    """
+    if session is not None:
+        yield session
+        return
+
+    pooled = _open_session()
+    try:
+        yield pooled
+    finally:
+        await pooled.close()
 
 
 def get_pool_stats() -> dict:
@@ -370,7 +468,7 @@ def get_pool_stats() -> dict:
 
     settings = get_settings()
     return {
-        "max_size": getattr(settings, "neo4j_pool_max_size", 50),
+        "max_size": settings.neo4j_pool_max_size,
         "in_use": 0,  # Neo4j driver doesn't expose this directly
     }
 
@@ -382,12 +480,8 @@ def get_pool_stats() -> dict:
 
 async def find_entity_by_name(name: str, session=None) -> dict | None:
     """Find an entity by name (case-insensitive) or alias with retry support."""
-    close_session = False
-    if session is None:
-        session = await get_neo4j_session()
-        close_session = True
 
-    async def _query():
+    async def _query(session):
         result = await session.run(
             """
             MATCH (e:Entity)
@@ -401,44 +495,36 @@ async def find_entity_by_name(name: str, session=None) -> dict | None:
         record = await result.single()
         return dict(record) if record else None
 
-    try:
+    async with neo4j_session(session) as session:
         return await with_retry(
             _query,
+            session,
             max_retries=3,
             base_delay=0.5,
             operation_name=f"find_entity_by_name({name})",
         )
-    finally:
-        if close_session:
-            await session.close()
 
 
 async def get_all_entity_names(session=None) -> list[dict]:
     """Get all entity names for fuzzy matching with retry support."""
-    close_session = False
-    if session is None:
-        session = await get_neo4j_session()
-        close_session = True
 
-    async def _query():
+    async def _query(session):
         result = await session.run(
             """
             MATCH (e:Entity)
             RETURN e.id AS id, e.name AS name, e.type AS type
             """
         )
-        return [dict(record) async for record in result]
+        return await result.data()
 
-    try:
+    async with neo4j_session(session) as session:
         return await with_retry(
             _query,
+            session,
             max_retries=3,
             base_delay=0.5,
             operation_name="get_all_entity_names",
         )
-    finally:
-        if close_session:
-            await session.close()
 
 
 # SEC-008: Whitelist of allowed order_by fields to prevent injection
@@ -476,6 +562,30 @@ def validate_order_by(field: str) -> str:
     return field
 
 
+_DECISIONS_INVOLVING_ENTITY_QUERY = """
+MATCH (e:Entity)
+WHERE toLower(e.name) = toLower($name)
+   OR ANY(alias IN COALESCE(e.aliases, []) WHERE toLower(alias) = toLower($name))
+WITH e
+MATCH (d:DecisionTrace)-[:INVOLVES]->(e)
+RETURN d.id AS id,
+       d.trigger AS trigger,
+       COALESCE(d.agent_decision, d.decision) AS decision,
+       COALESCE(d.agent_rationale, d.rationale) AS rationale,
+       d.created_at AS created_at,
+       d.source AS source
+ORDER BY d.{order_by} ASC
+"""
+
+# One pre-built query per whitelisted order_by field (SEC-008). Queries are
+# formatted once at import, so a call is a dict lookup and never builds
+# Cypher from caller input.
+_DECISIONS_INVOLVING_ENTITY_QUERIES = {
+    field: _DECISIONS_INVOLVING_ENTITY_QUERY.format(order_by=field)
+    for field in ALLOWED_ORDER_BY_FIELDS
+}
+
+
 async def get_decisions_involving_entity(
     entity_name: str, order_by: str = "created_at", session=None
 ) -> list[dict]:
@@ -483,54 +593,55 @@ async def get_decisions_involving_entity(
     # SEC-008: Validate order_by field
     order_by = validate_order_by(order_by)
 
-    close_session = False
-    if session is None:
-        session = await get_neo4j_session()
-        close_session = True
-
-    async def _query():
+    async def _query(session):
         result = await session.run(
-            f"""
-            MATCH (e:Entity)
-            WHERE toLower(e.name) = toLower($name)
-               OR ANY(alias IN COALESCE(e.aliases, []) WHERE toLower(alias) = toLower($name))
-            WITH e
-            MATCH (d:DecisionTrace)-[:INVOLVES]->(e)
-            RETURN d.id AS id,
-                   d.trigger AS trigger,
-                   COALESCE(d.agent_decision, d.decision) AS decision,
-                   COALESCE(d.agent_rationale, d.rationale) AS rationale,
-                   d.created_at AS created_at,
-                   d.source AS source
-            ORDER BY d.{order_by} ASC
-            """,
+            _DECISIONS_INVOLVING_ENTITY_QUERIES[order_by],
             name=entity_name,
         )
-        return [dict(record) async for record in result]
+        return await result.data()
 
-    try:
+    async with neo4j_session(session) as session:
         return await with_retry(
             _query,
+            session,
             max_retries=3,
             base_delay=0.5,
             operation_name=f"get_decisions_involving_entity({entity_name})",
         )
-    finally:
-        if close_session:
-            await session.close()
 
 
 async def find_similar_entity_by_embedding(
     embedding: list[float], threshold: float = 0.9, session=None
 ) -> dict | None:
     """Find an entity by embedding similarity with retry support."""
-    close_session = False
-    if session is None:
-        session = await get_neo4j_session()
-        close_session = True
+    query_norm = vector_norm(embedding) if embedding else 0.0
+    if query_norm == 0:
+        return None
 
-    async def _query():
-        # Try using GDS cosine similarity
+    async def _query(session):
+        # Primary: approximate nearest neighbours via the entity_embedding
+        # HNSW index instead of scoring every entity
+        try:
+            result = await session.run(
+                """
+                CALL db.index.vector.queryNodes('entity_embedding', $candidates, $embedding)
+                YIELD node AS e, score
+                WITH e, 2 * score - 1 AS similarity
+                WHERE similarity > $threshold
+                RETURN e.id AS id, e.name AS name, e.type AS type, similarity
+                ORDER BY similarity DESC
+                LIMIT 1
+                """,
+                embedding=embedding,
+                threshold=threshold,
+                candidates=VECTOR_SEARCH_CANDIDATES,
+            )
+            record = await result.single()
+            return dict(record) if record else None
+        except (ClientError, DatabaseError) as e:
+            logger.debug(f"Entity vector index query failed, trying GDS: {e}")
+
+        # Secondary: GDS cosine similarity (linear scan)
         try:
             result = await session.run(
                 """
@@ -548,39 +659,38 @@ async def find_similar_entity_by_embedding(
             record = await result.single()
             return dict(record) if record else None
         except (ClientError, DatabaseError):
-            # Fall back to returning all entities for manual calculation
+            # GDS not installed - compute cosine in Cypher so only the best
+            # match crosses the wire instead of every entity's embedding
             result = await session.run(
                 """
                 MATCH (e:Entity)
                 WHERE e.embedding IS NOT NULL
-                RETURN e.id AS id, e.name AS name, e.type AS type, e.embedding AS embedding
-                """
+                  AND size(e.embedding) = size($embedding)
+                WITH e, reduce(
+                    acc = [0.0, 0.0],
+                    i IN range(0, size($embedding) - 1) |
+                    [acc[0] + e.embedding[i] * $embedding[i],
+                     acc[1] + e.embedding[i] * e.embedding[i]]
+                ) AS sums
+                WHERE sums[1] > 0
+                WITH e, sums[0] / (sqrt(sums[1]) * $query_norm) AS similarity
+                WHERE similarity > $threshold
+                RETURN e.id AS id, e.name AS name, e.type AS type, similarity
+                ORDER BY similarity DESC
+                LIMIT 1
+                """,
+                embedding=embedding,
+                query_norm=query_norm,
+                threshold=threshold,
             )
+            record = await result.single()
+            return dict(record) if record else None
 
-            best_match = None
-            best_similarity = threshold
-
-            async for record in result:
-                other_embedding = record["embedding"]
-                similarity = cosine_similarity(embedding, other_embedding)
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_match = {
-                        "id": record["id"],
-                        "name": record["name"],
-                        "type": record["type"],
-                        "similarity": similarity,
-                    }
-
-            return best_match
-
-    try:
+    async with neo4j_session(session) as session:
         return await with_retry(
             _query,
+            session,
             max_retries=3,
             base_delay=0.5,
             operation_name="find_similar_entity_by_embedding",
         )
-    finally:
-        if close_session:
-            await session.close()
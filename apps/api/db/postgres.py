@@ -1,9 +1,16 @@
 """PostgreSQL database connection with configurable connection pooling and retry logic (SD-009).
 
 Pool configuration via environment variables:
-- POSTGRES_POOL_MIN_SIZE: Minimum connections (default: 2)
-- POSTGRES_POOL_MAX_SIZE: Maximum connections (default: 10)
-- POSTGRES_POOL_RECYCLE: Connection recycle time in seconds (default: 3600)
+- POSTGRES_POOL_SIZE: Connections kept open in the pool (default: 20)
+- POSTGRES_MAX_OVERFLOW: Extra connections allowed under burst load (default: 40)
+- POSTGRES_POOL_TIMEOUT: Seconds to wait for a free connection (default: 30)
+- POSTGRES_POOL_RECYCLE: Connection recycle time in seconds (default: 1800)
+- POSTGRES_JIT: Enable PostgreSQL JIT compilation for sessions (default: false)
+- POSTGRES_STATEMENT_CACHE_SIZE: Prepared statements cached per connection (default: 1024)
+- POSTGRES_CREATE_TABLES: Create missing tables at startup (default: true);
+  set to false when the schema is managed by Alembic migrations
+
+Connections are handed out LIFO so the pool keeps a hot working set.
 
 Retry configuration:
 - POSTGRES_MAX_RETRIES: Maximum retry attempts (default: 3)
@@ -35,6 +42,8 @@ async_session_maker = None
 
 T = TypeVar("T")
 
+ASYNCPG_URL_PREFIX = "postgresql+asyncpg://"
+
 # Exceptions that should trigger a retry (SD-009)
 POSTGRES_RETRYABLE_EXCEPTIONS = (
     OperationalError,  # Connection issues, server disconnects
@@ -53,6 +62,35 @@ class Base(DeclarativeBase):
     pass
 
 
+def _connect_args(settings) -> dict[str, Any]:
+    """Build asyncpg connection arguments from settings (SD-009).
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Keyword arguments passed to the asyncpg DBAPI connect call
+    """
+    if not settings.database_url.startswith(ASYNCPG_URL_PREFIX):
+        logger.warning(
+            f"DATABASE_URL does not use the {ASYNCPG_URL_PREFIX} driver; "
+            "asyncpg statement caching and session settings are disabled"
+        )
+        return {}
+
+    cache_size = settings.postgres_statement_cache_size
+    connect_args: dict[str, Any] = {
+        # asyncpg's own cache for implicitly prepared queries
+        "statement_cache_size": cache_size,
+        # SQLAlchemy's per-connection cache of explicitly prepared statements
+        "prepared_statement_cache_size": cache_size,
+    }
+    if not settings.postgres_jit:
+        # JIT compilation costs more than it saves on short OLTP queries
+        connect_args["server_settings"] = {"jit": "off"}
+    return connect_args
+
+
 def _calculate_backoff(
     attempt: int, base_delay: float = 1.0, max_delay: float = 8.0
 ) -> float:
@@ -152,23 +190,25 @@ async def init_postgres():
     global engine, async_session_maker
     settings = get_settings()
 
-    # Get pool settings from environment with defaults
-    pool_min_size = getattr(settings, "postgres_pool_min_size", 2)
-    pool_max_size = getattr(settings, "postgres_pool_max_size", 10)
-    pool_recycle = getattr(settings, "postgres_pool_recycle", 3600)
-
     logger.info(
         f"Initializing PostgreSQL connection pool: "
-        f"min={pool_min_size}, max={pool_max_size}, recycle={pool_recycle}s"
+        f"size={settings.postgres_pool_size}, "
+        f"max_overflow={settings.postgres_max_overflow}, "
+        f"timeout={settings.postgres_pool_timeout}s, "
+        f"recycle={settings.postgres_pool_recycle}s"
     )
 
     engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,
         pool_pre_ping=True,
-        pool_size=pool_min_size,
-        max_overflow=pool_max_size - pool_min_size,
-        pool_recycle=pool_recycle,
+        pool_size=settings.postgres_pool_size,
+        max_overflow=settings.postgres_max_overflow,
+        pool_timeout=settings.postgres_pool_timeout,
+        pool_recycle=settings.postgres_pool_recycle,
+        # Reuse the most recently returned connection so idle extras can time out
+        pool_use_lifo=True,
+        connect_args=_connect_args(settings),
     )
 
     async_session_maker = async_sessionmaker(
@@ -177,17 +217,20 @@ async def init_postgres():
         expire_on_commit=False,
     )
 
-    # Create tables with retry (SD-009)
-    async def create_tables():
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+    # Create tables with retry (SD-009). Deployments that manage the schema
+    # with Alembic can skip this catalog round-trip per table at startup.
+    if settings.postgres_create_tables:
 
-    await with_retry(
-        create_tables,
-        max_retries=3,
-        base_delay=1.0,
-        operation_name="PostgreSQL table creation",
-    )
+        async def create_tables():
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+        await with_retry(
+            create_tables,
+            max_retries=3,
+            base_delay=1.0,
+            operation_name="PostgreSQL table creation",
+        )
 
     # Seed the anonymous user if it doesn't exist (required for unauthenticated sessions)
     async with async_session_maker() as session:
@@ -1,8 +1,11 @@
 """Redis connection with configurable connection pooling and retry logic (SD-009).
 
 Pool configuration via environment variables:
-- REDIS_POOL_MAX_SIZE: Maximum connections (default: 10)
+- REDIS_POOL_MAX_SIZE: Maximum connections (default: 50)
 - REDIS_SOCKET_TIMEOUT: Socket timeout in seconds (default: 5)
+- REDIS_HEALTH_CHECK_INTERVAL: Idle seconds before a connection is pinged (default: 30)
+
+Connections use the RESP3 protocol (Redis 6+).
 
 Retry configuration:
 - REDIS_MAX_RETRIES: Maximum retry attempts (default: 3)
@@ -140,23 +143,25 @@ async def init_redis():
     global redis_client
     settings = get_settings()
 
-    # Get pool settings from environment with defaults
-    pool_max_size = getattr(settings, "redis_pool_max_size", 10)
-    socket_timeout = getattr(settings, "redis_socket_timeout", 5.0)
+    pool_max_size = settings.redis_pool_max_size
+    socket_timeout = settings.redis_socket_timeout
 
     logger.info(
         f"Initializing Redis connection pool: "
         f"max_size={pool_max_size}, socket_timeout={socket_timeout}s"
     )
 
-    redis_client = redis.from_url(
+    pool = redis.ConnectionPool.from_url(
         settings.redis_url,
         encoding="utf-8",
         decode_responses=True,
         max_connections=pool_max_size,
         socket_timeout=socket_timeout,
         socket_connect_timeout=socket_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+        protocol=3,
     )
+    redis_client = redis.Redis(connection_pool=pool)
 
     # Test connection with retry (SD-009)
     await with_retry(
@@ -173,7 +178,9 @@ async def close_redis():
     """Close Redis connection pool."""
     global redis_client
     if redis_client:
-        await redis_client.close()
+        # A client built from an explicit pool does not close the pool itself
+        await redis_client.aclose()
+        await redis_client.connection_pool.disconnect()
         logger.info("Redis connection pool closed")
 
 
@@ -193,11 +200,10 @@ def get_pool_stats() -> dict:
             "in_use": 0,
         }
 
-    settings = get_settings()
     pool = redis_client.connection_pool
 
     return {
-        "max_size": getattr(settings, "redis_pool_max_size", 10),
+        "max_size": pool.max_connections,
         "in_use": len(pool._in_use_connections)
         if hasattr(pool, "_in_use_connections")
         else 0,
@@ -11,19 +11,23 @@ Features:
 """
 
 import asyncio
+import json
 import os
 import platform
 import signal
+import time
 from contextlib import asynccontextmanager
+from types import MappingProxyType
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import ValidationError
 from sqlalchemy import text
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.requests import ClientDisconnect
 
 from config import get_settings
 from db.neo4j import close_neo4j, init_neo4j
@@ -56,16 +60,45 @@ APP_VERSION = "0.1.0"
 APP_NAME = "Continuum API"
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 # Global shutdown event for coordinating graceful shutdown
 shutdown_event = asyncio.Event()
 
 
+# Readiness probes may hit every second on every replica; a dependency that
+# answered within this window is reported healthy without another round-trip
+HEALTH_CHECK_CACHE_TTL = 2.0  # seconds
+_last_healthy: dict[str, float] = {}
+
+# Probe statements are built once and reused by every health check
+_PG_PING = text("SELECT 1")
+_NEO4J_PING = "RETURN 1"
+
+
+def _recently_healthy(service: str) -> bool:
+    """Check whether a service passed a health check within the cache TTL."""
+    checked_at = _last_healthy.get(service)
+    return (
+        checked_at is not None
+        and time.monotonic() - checked_at < HEALTH_CHECK_CACHE_TTL
+    )
+
+
+def _record_health(service: str, healthy: bool) -> bool:
+    """Remember a successful check; failures are always re-checked."""
+    if healthy:
+        _last_healthy[service] = time.monotonic()
+    else:
+        _last_healthy.pop(service, None)
+    return healthy
+
+
 def get_request_id(request: Request) -> str | None:
     """Extract request ID from request state or headers."""
-    if hasattr(request.state, "request_id"):
-        return request.state.request_id
-    return request.headers.get("X-Request-ID")
+    return getattr(request.state, "request_id", None) or request.headers.get(
+        "X-Request-ID"
+    )
 
 
 async def check_postgres_connection() -> bool:
@@ -74,28 +107,32 @@ async def check_postgres_connection() -> bool:
 
     if engine is None:
         return False
+    if _recently_healthy("postgres"):
+        return True
     try:
         async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
-        return True
+            await conn.scalar(_PG_PING)
+        return _record_health("postgres", True)
     except Exception as e:
         logger.error(f"PostgreSQL health check failed: {e}")
-        return False
+        return _record_health("postgres", False)
 
 
 async def check_neo4j_connection() -> bool:
     """Verify Neo4j connection is healthy."""
-    from db.neo4j import driver
+    from db.neo4j import driver, get_neo4j_session
 
     if driver is None:
         return False
-    try:
-        async with driver.session() as session:
-            await session.run("RETURN 1")
+    if _recently_healthy("neo4j"):
         return True
+    try:
+        async with await get_neo4j_session() as session:
+            await session.run(_NEO4J_PING)
+        return _record_health("neo4j", True)
     except Exception as e:
         logger.error(f"Neo4j health check failed: {e}")
-        return False
+        return _record_health("neo4j", False)
 
 
 async def check_redis_connection() -> bool:
@@ -103,49 +140,49 @@ async def check_redis_connection() -> bool:
     client = get_redis()
     if client is None:
         return False
+    if _recently_healthy("redis"):
+        return True
     try:
         await client.ping()
-        return True
+        return _record_health("redis", True)
     except Exception as e:
         logger.error(f"Redis health check failed: {e}")
-        return False
+        return _record_health("redis", False)
 
 
 async def init_databases() -> dict[str, bool]:
-    """Initialize all database connections with error handling."""
-    services_status = {"postgres": False, "neo4j": False, "redis": False}
+    """Initialize all database connections with error handling.
 
-    # Initialize PostgreSQL
-    try:
-        await init_postgres()
-        services_status["postgres"] = True
-        logger.info("PostgreSQL connection established")
-    except Exception as e:
-        logger.error(f"Failed to connect to PostgreSQL: {e}")
-        raise
+    The three connections are independent, so they are established
+    concurrently. If any fails, the ones that succeeded are closed and the
+    first error is re-raised.
+    """
+    services = {
+        "postgres": ("PostgreSQL", init_postgres, close_postgres),
+        "neo4j": ("Neo4j", init_neo4j, close_neo4j),
+        "redis": ("Redis", init_redis, close_redis),
+    }
+    results = await asyncio.gather(
+        *(init() for _, init, _ in services.values()), return_exceptions=True
+    )
 
-    # Initialize Neo4j
-    try:
-        await init_neo4j()
-        services_status["neo4j"] = True
-        logger.info("Neo4j connection established")
-    except Exception as e:
-        logger.error(f"Failed to connect to Neo4j: {e}")
-        # Close PostgreSQL if Neo4j fails
-        await close_postgres()
-        raise
+    services_status: dict[str, bool] = {}
+    errors: list[BaseException] = []
+    for (service, (label, _, _)), result in zip(services.items(), results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to connect to {label}: {result}")
+            errors.append(result)
+            services_status[service] = False
+        else:
+            logger.info(f"{label} connection established")
+            services_status[service] = True
 
-    # Initialize Redis
-    try:
-        await init_redis()
-        services_status["redis"] = True
-        logger.info("Redis connection established")
-    except Exception as e:
-        logger.error(f"Failed to connect to Redis: {e}")
-        # Close other connections if Redis fails
-        await close_postgres()
-        await close_neo4j()
-        raise
+    if errors:
+        # Close the connections that did come up before failing startup
+        for service, (_, _, close) in services.items():
+            if services_status[service]:
+                await close()
+        raise errors[0]
 
     return services_status
 
@@ -277,8 +314,6 @@ def log_shutdown_info():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager with graceful shutdown support."""
-    settings = get_settings()
-
     # Set up signal handlers
     try:
         loop = asyncio.get_running_loop()
@@ -326,6 +361,7 @@ app = FastAPI(
     description="Knowledge Management Platform API",
     version=APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -334,21 +370,26 @@ app = FastAPI(
 # =============================================================================
 
 
+def _format_validation_errors(
+    exc: RequestValidationError | ValidationError,
+) -> list[dict[str, str]]:
+    """Convert Pydantic validation errors to the SD-016 error detail format."""
+    return [
+        {
+            "field": ".".join(map(str, error.get("loc", ()))),
+            "message": error.get("msg", "Validation error"),
+            "type": error.get("type", "value_error"),
+        }
+        for error in exc.errors()
+    ]
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors with standardized format (SD-016)."""
-    errors = []
-    for error in exc.errors():
-        field = ".".join(str(loc) for loc in error.get("loc", []))
-        errors.append(
-            {
-                "field": field,
-                "message": error.get("msg", "Validation error"),
-                "type": error.get("type", "value_error"),
-            }
-        )
+    errors = _format_validation_errors(exc)
 
     response = create_validation_error_response(
         message="Request validation failed",
@@ -362,24 +403,15 @@ async def validation_exception_handler(
         f"{len(errors)} error(s)"
     )
 
-    return JSONResponse(status_code=422, content=response)
+    return ORJSONResponse(status_code=422, content=response)
 
 
 @app.exception_handler(ValidationError)
 async def pydantic_validation_exception_handler(
     request: Request, exc: ValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic ValidationError (from manual validation) with standardized format."""
-    errors = []
-    for error in exc.errors():
-        field = ".".join(str(loc) for loc in error.get("loc", []))
-        errors.append(
-            {
-                "field": field,
-                "message": error.get("msg", "Validation error"),
-                "type": error.get("type", "value_error"),
-            }
-        )
+    errors = _format_validation_errors(exc)
 
     response = create_validation_error_response(
         message="Data validation failed",
@@ -388,16 +420,15 @@ async def pydantic_validation_exception_handler(
         path=str(request.url.path),
     )
 
-    return JSONResponse(status_code=422, content=response)
+    return ORJSONResponse(status_code=422, content=response)
 
 
-@app.exception_handler(StarletteHTTPException)
-async def http_exception_handler(
-    request: Request, exc: StarletteHTTPException
-) -> JSONResponse:
-    """Handle HTTP exceptions with standardized format (SD-016)."""
-    # Map status codes to error types
-    error_type_map = {
+# Non-standard status (nginx convention) for requests aborted by the client
+CLIENT_CLOSED_REQUEST = 499
+
+# Map status codes to error types
+_STATUS_TO_ERROR_TYPE = MappingProxyType(
+    {
         400: ErrorType.BAD_REQUEST,
         401: ErrorType.UNAUTHORIZED,
         403: ErrorType.FORBIDDEN,
@@ -406,8 +437,15 @@ async def http_exception_handler(
         429: ErrorType.RATE_LIMITED,
         503: ErrorType.SERVICE_UNAVAILABLE,
     }
+)
 
-    error_type = error_type_map.get(exc.status_code, ErrorType.INTERNAL_ERROR)
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> ORJSONResponse:
+    """Handle HTTP exceptions with standardized format (SD-016)."""
+    error_type = _STATUS_TO_ERROR_TYPE.get(exc.status_code, ErrorType.INTERNAL_ERROR)
     message = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
 
     response = create_error_response(
@@ -418,13 +456,13 @@ async def http_exception_handler(
         path=str(request.url.path),
     )
 
-    return JSONResponse(status_code=exc.status_code, content=response)
+    return ORJSONResponse(status_code=exc.status_code, content=response)
 
 
 @app.exception_handler(CircuitBreakerOpen)
 async def circuit_breaker_exception_handler(
     request: Request, exc: CircuitBreakerOpen
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle circuit breaker open exceptions with standardized format (SD-006, SD-016)."""
     response = create_error_response(
         error=ErrorType.CIRCUIT_BREAKER_OPEN,
@@ -443,15 +481,28 @@ async def circuit_breaker_exception_handler(
         f"Retry in {exc.time_remaining:.1f}s"
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=503,
         content=response,
         headers={"Retry-After": str(int(exc.time_remaining + 1))},
     )
 
 
+@app.exception_handler(ClientDisconnect)
+async def client_disconnect_handler(
+    request: Request, exc: ClientDisconnect
+) -> Response:
+    """Handle requests aborted by the client without logging a traceback.
+
+    Registered separately from the catch-all handler, which Starlette runs in
+    ServerErrorMiddleware and always re-raises from.
+    """
+    logger.debug(f"Client disconnected on {request.method} {request.url.path}")
+    return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+
 @app.exception_handler(Exception)
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions with standardized format (SD-016)."""
     # Log the full exception for debugging
     logger.exception(
@@ -468,7 +519,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         path=str(request.url.path),
     )
 
-    return JSONResponse(status_code=500, content=response)
+    return ORJSONResponse(status_code=500, content=response)
 
 
 # =============================================================================
@@ -485,7 +536,6 @@ app.add_middleware(RequestSizeLimitMiddleware)
 
 # SEC-011: CORS with restricted methods and headers
 # Previously allowed ["*"] for both, which was unnecessarily permissive
-settings = get_settings()
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -502,7 +552,7 @@ app.add_middleware(
         "Accept-Encoding",
     ],
     # Expose headers that frontend may need to read
-    expose_headers=["X-Request-ID"],
+    expose_headers=["X-Request-ID", "X-Next-Cursor"],
     # Cache preflight for 1 hour
     max_age=3600,
 )
@@ -532,11 +582,18 @@ app.include_router(export.router, prefix="/api/export", tags=["Export"])
 # Health & Status Endpoints
 # =============================================================================
 
+# Static bodies are serialized once at import instead of on every probe
+_HEALTH_BODY = json.dumps({"status": "healthy"}).encode()
+_LIVE_BODY = json.dumps({"alive": True}).encode()
+_ROOT_BODY = json.dumps(
+    {"name": APP_NAME, "version": APP_VERSION, "docs": "/docs"}
+).encode()
+
 
 @app.get("/health")
 async def health_check():
     """Basic health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/health/ready")
@@ -545,9 +602,14 @@ async def readiness_check():
     Readiness probe - checks if the application can serve traffic.
     Returns 503 if any critical dependency is unhealthy.
     """
-    postgres_ok = await check_postgres_connection()
-    neo4j_ok = await check_neo4j_connection()
-    redis_ok = await check_redis_connection()
+    # Run the checks concurrently so latency is the slowest check, not the sum
+    results = await asyncio.gather(
+        check_postgres_connection(),
+        check_neo4j_connection(),
+        check_redis_connection(),
+        return_exceptions=True,
+    )
+    postgres_ok, neo4j_ok, redis_ok = (result is True for result in results)
 
     all_healthy = postgres_ok and neo4j_ok and redis_ok
 
@@ -561,7 +623,7 @@ async def readiness_check():
     }
 
     if not all_healthy:
-        return JSONResponse(status_code=503, content=status)
+        return ORJSONResponse(status_code=503, content=status)
 
     return status
 
@@ -572,7 +634,7 @@ async def liveness_check():
     Liveness probe - checks if the application process is running.
     This should be lightweight and not check external dependencies.
     """
-    return {"alive": True}
+    return Response(content=_LIVE_BODY, media_type="application/json")
 
 
 @app.get("/health/circuits")
@@ -600,8 +662,4 @@ async def circuit_breaker_status():
 
 @app.get("/")
 async def root():
-    return {
-        "name": APP_NAME,
-        "version": APP_VERSION,
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
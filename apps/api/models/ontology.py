@@ -1,9 +1,13 @@
 """Ontology schema definition for knowledge graph entities and relationships."""
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
+from rapidfuzz import fuzz, process
+
 
 class EntityType(Enum):
     """Types of entities that can be extracted from decisions."""
@@ -946,9 +950,12 @@ CANONICAL_NAMES: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedEntity:
-    """Result of entity resolution."""
+    """Result of entity resolution.
+
+    Slotted because batch resolution creates one instance per extracted entity.
+    """
 
     id: Optional[str]
     name: str
@@ -957,18 +964,78 @@ class ResolvedEntity:
     match_method: Optional[str] = None
     confidence: float = 1.0
     canonical_name: Optional[str] = None
-    aliases: list[str] = None
-
-    def __post_init__(self):
-        if self.aliases is None:
-            self.aliases = []
+    aliases: list[str] = field(default_factory=list)
 
 
+# Entity resolution looks up the same few hundred names over and over, so
+# both helpers are memoized; CANONICAL_NAMES keys are already lowercase.
+@lru_cache(maxsize=4096)
 def get_canonical_name(name: str) -> str:
     """Get the canonical name for an entity, or return the original if not found."""
     return CANONICAL_NAMES.get(name.lower(), name)
 
 
+@lru_cache(maxsize=4096)
 def normalize_entity_name(name: str) -> str:
     """Normalize an entity name for comparison (lowercase, strip whitespace)."""
     return name.lower().strip()
+
+
+def _build_alias_index() -> dict[str, tuple[str, ...]]:
+    """Invert CANONICAL_NAMES into canonical name -> aliases."""
+    aliases: dict[str, list[str]] = {}
+    for alias, canonical in CANONICAL_NAMES.items():
+        aliases.setdefault(canonical, []).append(alias)
+    return {canonical: tuple(names) for canonical, names in aliases.items()}
+
+
+# Reverse index, built once: canonical name -> every alias that maps to it
+CANONICAL_ALIASES: dict[str, tuple[str, ...]] = _build_alias_index()
+
+_ALIAS_KEYS = tuple(CANONICAL_NAMES)
+
+
+def fuzzy_canonical_name(name: str, score_cutoff: float = 85) -> str:
+    """Get the canonical name for a misspelled alias, or return the original.
+
+    Args:
+        name: Entity name to match against the known aliases
+        score_cutoff: Minimum rapidfuzz ratio (0-100) for a match
+
+    Returns:
+        Canonical name of the closest alias, or name if none clears the cutoff
+    """
+    match = process.extractOne(
+        name.lower(), _ALIAS_KEYS, scorer=fuzz.ratio, score_cutoff=score_cutoff
+    )
+    return CANONICAL_NAMES[match[0]] if match else name
+
+
+# Single alternation over every alias, longest first so "asp.net core" wins over
+# "asp.net"; lookarounds stand in for \b because aliases like "c++" and ".net"
+# start or end with non-word characters.
+_CANONICAL_MENTION_RE = re.compile(
+    r"(?<!\w)(?:"
+    + "|".join(map(re.escape, sorted(CANONICAL_NAMES, key=len, reverse=True)))
+    + r")(?!\w)",
+    re.IGNORECASE,
+)
+
+
+def find_canonical_mentions(text: str) -> list[tuple[int, int, str]]:
+    """Find known entity aliases mentioned in free text.
+
+    Scans the text once with a precompiled pattern instead of testing every
+    alias separately.
+
+    Args:
+        text: Free text to scan (matching is case-insensitive)
+
+    Returns:
+        (start, end, canonical_name) tuples for non-overlapping mentions,
+        in order of appearance
+    """
+    return [
+        (match.start(), match.end(), CANONICAL_NAMES[match.group().lower()])
+        for match in _CANONICAL_MENTION_RE.finditer(text)
+    ]
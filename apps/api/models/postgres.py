@@ -1,5 +1,5 @@
 import enum
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Optional
 from uuid import uuid4
 
@@ -13,6 +13,11 @@ def generate_uuid() -> str:
     return str(uuid4())
 
 
+def utcnow() -> datetime:
+    # Columns are timezone-naive UTC; datetime.utcnow() is deprecated
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class SessionStatus(str, enum.Enum):
     ACTIVE = "active"
     COMPLETED = "completed"
@@ -26,9 +31,9 @@ class User(Base):
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     password_hash: Mapped[str] = mapped_column(String(255))
     name: Mapped[Optional[str]] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=utcnow, onupdate=utcnow
     )
 
     # Relationships
@@ -46,15 +51,17 @@ class CaptureSession(Base):
         Enum(SessionStatus), default=SessionStatus.ACTIVE
     )
     project_name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=utcnow, onupdate=utcnow
     )
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
     user: Mapped["User"] = relationship(back_populates="capture_sessions")
-    messages: Mapped[list["CaptureMessage"]] = relationship(back_populates="session")
+    messages: Mapped[list["CaptureMessage"]] = relationship(
+        back_populates="session", order_by="CaptureMessage.timestamp"
+    )
 
 
 class CaptureMessage(Base):
@@ -67,7 +74,7 @@ class CaptureMessage(Base):
     role: Mapped[str] = mapped_column(String(20))  # "user" or "assistant"
     content: Mapped[str] = mapped_column(Text)
     extracted_entities: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     session: Mapped["CaptureSession"] = relationship(back_populates="messages")
@@ -79,7 +86,7 @@ class ProcessedFile(Base):
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     file_path: Mapped[str] = mapped_column(String(512), unique=True, index=True)
     file_hash: Mapped[str] = mapped_column(String(64))
-    processed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    processed_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     decisions_extracted: Mapped[int] = mapped_column(default=0)
 
 
@@ -91,7 +98,7 @@ class Drill(Base):
     description: Mapped[str] = mapped_column(Text)
     scenario: Mapped[str] = mapped_column(Text)
     decision_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
 
 class DrillAttempt(Base):
@@ -103,4 +110,4 @@ class DrillAttempt(Base):
     response: Mapped[str] = mapped_column(Text)
     score: Mapped[Optional[float]] = mapped_column(nullable=True)
     feedback: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
@@ -42,14 +42,14 @@ async def get_current_user_id(
         return "anonymous"
 
     try:
-        # Expected format: "Bearer <jwt_token>"
-        parts = authorization.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        # Expected format: "Bearer <jwt_token>"; partition avoids building a
+        # list on every authenticated request
+        scheme, _, token = authorization.strip().partition(" ")
+        token = token.lstrip()
+        if not token or " " in token or scheme.lower() != "bearer":
             logger.warning("Invalid authorization header format")
             return "anonymous"
 
-        token = parts[1]
-
         # Validate and decode the JWT token
         try:
             payload = jwt.decode(
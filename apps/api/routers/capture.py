@@ -14,13 +14,16 @@ from datetime import UTC, datetime
 from typing import Any, Optional
 from uuid import uuid4
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from agents.interview import InterviewAgent
 from db.postgres import get_db
-from models.postgres import CaptureMessage, CaptureSession, SessionStatus
+from models.postgres import CaptureMessage, CaptureSession, SessionStatus, utcnow
 from models.schemas import (
     CaptureMessage as CaptureMessageSchema,
 )
@@ -28,9 +31,11 @@ from models.schemas import (
     CaptureSession as CaptureSessionSchema,
 )
 from models.schemas import (
+    DecisionCreate,
     Entity,
 )
 from routers.auth import get_current_user_id
+from services.extractor import get_extractor
 from services.message_queue import get_message_queue_manager
 from utils.logging import get_logger
 
@@ -44,6 +49,10 @@ MAX_HISTORY_SIZE = 50  # Maximum messages in history
 MAX_MESSAGES_PER_MINUTE = 20  # Rate limit for WebSocket messages
 WEBSOCKET_RATE_WINDOW = 60  # Window in seconds
 
+# Reuses one compiled serializer for the entity lists sent with every message
+# and stream chunk, instead of a model_dump() call per entity
+_ENTITY_LIST_ADAPTER = TypeAdapter(list[Entity])
+
 
 class WebSocketRateLimiter:
     """Simple in-memory rate limiter for WebSocket messages (SEC-012).
@@ -121,6 +130,7 @@ async def _verify_session_ownership(
     db: AsyncSession,
     session_id: str,
     user_id: str,
+    with_messages: bool = False,
 ) -> CaptureSession:
     """Verify the user owns the session and return it.
 
@@ -128,6 +138,8 @@ async def _verify_session_ownership(
         db: Database session
         session_id: The session ID to check
         user_id: The user ID who should own the session
+        with_messages: Eagerly load the session's messages (ordered by
+            timestamp) in the same query
 
     Returns:
         The CaptureSession if found and owned by user
@@ -135,12 +147,16 @@ async def _verify_session_ownership(
     Raises:
         HTTPException 404 if session not found or not owned by user
     """
-    result = await db.execute(
-        select(CaptureSession).where(
-            CaptureSession.id == session_id,
-            CaptureSession.user_id == user_id,
-        )
+    query = select(CaptureSession).where(
+        CaptureSession.id == session_id,
+        CaptureSession.user_id == user_id,
     )
+    if with_messages:
+        # JOIN the messages in rather than issuing a second SELECT
+        query = query.options(joinedload(CaptureSession.messages))
+    result = await db.execute(query)
+    if with_messages:
+        result = result.unique()
     session = result.scalar_one_or_none()
 
     if not session:
@@ -151,6 +167,24 @@ async def _verify_session_ownership(
     return session
 
 
+def _message_to_schema(message: CaptureMessage) -> CaptureMessageSchema:
+    """Build a CaptureMessage response from a stored message row.
+
+    Rows were validated when they were written, so the schema and its
+    entities are constructed without re-running field validation; long
+    sessions can hold hundreds of messages.
+    """
+    return CaptureMessageSchema.model_construct(
+        id=message.id,
+        role=message.role,
+        content=message.content,
+        timestamp=message.timestamp,
+        extracted_entities=[
+            Entity.model_construct(**e) for e in (message.extracted_entities or [])
+        ],
+    )
+
+
 @router.post("/sessions", response_model=CaptureSessionSchema)
 async def start_capture_session(
     project_name: Optional[str] = None,
@@ -162,15 +196,19 @@ async def start_capture_session(
     Creates a new capture session linked to the current user.
     Anonymous users can create sessions, but they won't persist across auth.
     """
+    # Timestamps are set here (naive UTC, like the column defaults) so the
+    # response can be built without a refresh round-trip after commit
+    now = utcnow()
     session = CaptureSession(
         id=str(uuid4()),
         user_id=user_id,
         status=SessionStatus.ACTIVE,
         project_name=project_name,
+        created_at=now,
+        updated_at=now,
     )
     db.add(session)
     await db.commit()
-    await db.refresh(session)
 
     logger.info(f"Created capture session {session.id} for user")
 
@@ -194,31 +232,17 @@ async def get_capture_session(
     Users can only access their own sessions. Returns 404 if session
     doesn't exist or belongs to another user.
     """
-    session = await _verify_session_ownership(db, session_id, user_id)
-
-    # Get messages
-    result = await db.execute(
-        select(CaptureMessage)
-        .where(CaptureMessage.session_id == session_id)
-        .order_by(CaptureMessage.timestamp)
+    session = await _verify_session_ownership(
+        db, session_id, user_id, with_messages=True
     )
-    messages = result.scalars().all()
+    messages = session.messages
 
     return CaptureSessionSchema(
         id=session.id,
         status=session.status.value,
         created_at=session.created_at,
         updated_at=session.updated_at,
-        messages=[
-            CaptureMessageSchema(
-                id=m.id,
-                role=m.role,
-                content=m.content,
-                timestamp=m.timestamp,
-                extracted_entities=[Entity(**e) for e in (m.extracted_entities or [])],
-            )
-            for m in messages
-        ],
+        messages=[_message_to_schema(m) for m in messages],
     )
 
 
@@ -234,14 +258,31 @@ async def send_capture_message(
     Users can only send messages to their own sessions.
     SD-010: Messages are batched for improved database performance.
     """
-    # Verify session ownership and get session
-    session = await _verify_session_ownership(db, session_id, user_id)
+    # Get message queue manager (SD-010)
+    queue_manager = get_message_queue_manager()
+
+    # Earlier turns may still be queued rather than persisted (SD-010). Take
+    # the snapshot before loading the session so a flush in between can't
+    # drop them from both
+    pending = queue_manager.get_pending_messages(session_id)
+
+    # Verify session ownership and get session with its conversation history
+    session = await _verify_session_ownership(
+        db, session_id, user_id, with_messages=True
+    )
 
     if session.status != SessionStatus.ACTIVE:
         raise HTTPException(status_code=400, detail="Session is not active")
 
-    # Get message queue manager (SD-010)
-    queue_manager = get_message_queue_manager()
+    # Build history before queueing the new message; the agent receives
+    # the new message separately
+    persisted_ids = {m.id for m in session.messages}
+    history = [{"role": m.role, "content": m.content} for m in session.messages]
+    history.extend(
+        {"role": m.role, "content": m.content}
+        for m in pending
+        if m.id not in persisted_ids
+    )
 
     # Save user message via batch queue (SD-010)
     await queue_manager.add_message(
@@ -251,19 +292,11 @@ async def send_capture_message(
         content=content.get("content", ""),
     )
 
-    # Get conversation history
-    result = await db.execute(
-        select(CaptureMessage)
-        .where(CaptureMessage.session_id == session_id)
-        .order_by(CaptureMessage.timestamp)
-    )
-    history = result.scalars().all()
-
     # Generate AI response using interview agent with per-user rate limiting (SEC-009)
     interview_agent = InterviewAgent(user_id=user_id)
     response_content, extracted_entities = await interview_agent.process_message(
         user_message=content.get("content", ""),
-        history=[{"role": m.role, "content": m.content} for m in history],
+        history=history,
     )
 
     # Save AI response via batch queue (SD-010)
@@ -272,7 +305,7 @@ async def send_capture_message(
         session_id=session_id,
         role="assistant",
         content=response_content,
-        extracted_entities=[e.model_dump() for e in extracted_entities],
+        extracted_entities=_ENTITY_LIST_ADAPTER.dump_python(extracted_entities),
     )
 
     return CaptureMessageSchema(
@@ -323,13 +356,10 @@ async def complete_capture_session(
     history = [{"role": m.role, "content": m.content} for m in messages]
 
     decision_data = await interview_agent.synthesize_decision(history)
-    logger.debug(f"Synthesized decision for session {session_id}")
+    logger.debug("Synthesized decision for session %s", session_id)
 
     if decision_data and decision_data.get("trigger"):
-        from models.schemas import DecisionCreate
-        from services.extractor import DecisionExtractor
-
-        extractor = DecisionExtractor()
+        extractor = get_extractor()
         decision = DecisionCreate(
             trigger=decision_data.get("trigger", ""),
             context=decision_data.get("context", ""),
@@ -355,8 +385,9 @@ async def complete_capture_session(
             f"No valid decision to save for session {session_id} - missing trigger or empty data"
         )
 
+    # No refresh needed: updated_at's onupdate is applied to the instance on
+    # flush, and the session does not expire attributes on commit
     await db.commit()
-    await db.refresh(session)
 
     # Clean up the session queue (SD-010)
     await queue_manager.remove_session(db, session_id)
@@ -366,19 +397,19 @@ async def complete_capture_session(
         status=session.status.value,
         created_at=session.created_at,
         updated_at=session.updated_at,
-        messages=[
-            CaptureMessageSchema(
-                id=m.id,
-                role=m.role,
-                content=m.content,
-                timestamp=m.timestamp,
-                extracted_entities=[Entity(**e) for e in (m.extracted_entities or [])],
-            )
-            for m in messages
-        ],
+        messages=[_message_to_schema(m) for m in messages],
     )
 
 
+async def _send_json(websocket: WebSocket, data: dict) -> None:
+    """Send a JSON text frame encoded with orjson.
+
+    Starlette's send_json goes through the stdlib encoder; this runs for every
+    streamed chunk, so use the faster encoder but keep text frames for clients.
+    """
+    await websocket.send_text(orjson.dumps(data).decode())
+
+
 @router.websocket("/sessions/{session_id}/ws")
 async def capture_websocket(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for real-time capture sessions with input validation (SEC-012).
@@ -416,12 +447,13 @@ async def capture_websocket(websocket: WebSocket, session_id: str):
                 data = await websocket.receive_json()
             except Exception as parse_error:
                 logger.warning(f"WebSocket parse error: {type(parse_error).__name__}")
-                await websocket.send_json(
+                await _send_json(
+                    websocket,
                     {
                         "type": "error",
                         "error": "Invalid JSON format",
                         "code": "INVALID_JSON",
-                    }
+                    },
                 )
                 continue
 
@@ -429,12 +461,13 @@ async def capture_websocket(websocket: WebSocket, session_id: str):
             is_valid, error_message = validate_websocket_message(data)
             if not is_valid:
                 logger.warning(f"WebSocket validation failed: {error_message}")
-                await websocket.send_json(
+                await _send_json(
+                    websocket,
                     {
                         "type": "error",
                         "error": error_message,
                         "code": "VALIDATION_ERROR",
-                    }
+                    },
                 )
                 continue
 
@@ -444,13 +477,14 @@ async def capture_websocket(websocket: WebSocket, session_id: str):
                 logger.warning(
                     f"WebSocket rate limit exceeded for session {session_id}"
                 )
-                await websocket.send_json(
+                await _send_json(
+                    websocket,
                     {
                         "type": "error",
                         "error": f"Rate limit exceeded. Please wait {retry_after:.0f} seconds.",
                         "code": "RATE_LIMITED",
                         "retry_after": retry_after,
-                    }
+                    },
                 )
                 continue
 
@@ -467,30 +501,40 @@ async def capture_websocket(websocket: WebSocket, session_id: str):
             # Stream response
             full_response = ""
             try:
-                async for chunk, entities in interview_agent.stream_response(
-                    user_message, history
-                ):
-                    full_response += chunk
-                    await websocket.send_json(
-                        {
-                            "type": "chunk",
-                            "content": chunk,
-                            "entities": [e.model_dump() for e in entities],
-                        }
+                if interview_agent.fast_mode:
+                    # Pre-written reply: no need to drive the async generator
+                    full_response = interview_agent.fast_reply(user_message, history)
+                    await _send_json(
+                        websocket,
+                        {"type": "chunk", "content": full_response, "entities": []},
                     )
+                else:
+                    async for chunk, entities in interview_agent.stream_response(
+                        user_message, history
+                    ):
+                        full_response += chunk
+                        await _send_json(
+                            websocket,
+                            {
+                                "type": "chunk",
+                                "content": chunk,
+                                "entities": _ENTITY_LIST_ADAPTER.dump_python(entities),
+                            },
+                        )
             except Exception as llm_error:
                 logger.error(f"LLM error in WebSocket: {type(llm_error).__name__}")
-                await websocket.send_json(
+                await _send_json(
+                    websocket,
                     {
                         "type": "error",
                         "error": "Failed to generate response. Please try again.",
                         "code": "LLM_ERROR",
-                    }
+                    },
                 )
                 continue
 
             # Send completion
-            await websocket.send_json({"type": "complete"})
+            await _send_json(websocket, {"type": "complete"})
 
             # Update history
             history.append({"role": "user", "content": user_message})
@@ -4,9 +4,13 @@ SEC-014: Replaced silent exception handling with specific exception handling and
 SD-024: Added Redis caching for dashboard stats (30 second TTL).
 """
 
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from neo4j.exceptions import AuthError as Neo4jAuthError
 from neo4j.exceptions import ServiceUnavailable as Neo4jServiceUnavailable
+from pydantic import TypeAdapter
 from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,13 +18,95 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from db.neo4j import get_neo4j_session
 from db.postgres import get_db
 from models.postgres import CaptureSession
-from models.schemas import DashboardStats, Decision, Entity
+from models.schemas import DashboardStats, DecisionSource
 from utils.cache import get_cached, set_cached
 from utils.logging import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Counts, review backlog and recent decisions, fetched together so the
+# dashboard costs one Neo4j round-trip instead of four
+DASHBOARD_STATS_QUERY = """
+CALL () {
+    MATCH (d:DecisionTrace)
+    RETURN count(d) AS total_decisions
+}
+CALL () {
+    MATCH (e:Entity)
+    RETURN count(e) AS total_entities
+}
+CALL () {
+    MATCH (d:DecisionTrace)
+    WHERE (d.user_id = $user_id OR d.user_id IS NULL)
+      AND d.human_rationale IS NULL
+    RETURN count(d) AS needs_review
+}
+CALL () {
+    MATCH (d:DecisionTrace)
+    OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
+    WITH d, collect(e {.id, .name, .type}) AS entities
+    ORDER BY d.created_at DESC
+    LIMIT 6
+    // Project only the response fields: returning whole nodes would make the
+    // driver materialize every property, embeddings included
+    RETURN collect({
+        d: d {
+            .id, .trigger, .context, .options, .agent_decision, .decision,
+            .agent_rationale, .rationale, .human_decision, .human_rationale,
+            .confidence, .created_at
+        },
+        entities: entities
+    }) AS recent
+}
+RETURN total_decisions, total_entities, needs_review, recent
+"""
+
+# The combined query replaces four separately tracked queries; a failure
+# still counts as all four towards the 503 threshold below
+NEO4J_STATS_ERRORS = (
+    "neo4j_decisions",
+    "neo4j_entities",
+    "neo4j_recent_decisions",
+    "neo4j_needs_review",
+)
+
+# Serializes timestamps exactly as the Decision model does on /api/decisions;
+# the result stays a plain string so the stats dict can be cached as JSON
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+
+def _decision_from_record(d, entities) -> dict:
+    """Build a serialized Decision from projected DecisionTrace properties.
+
+    Rows come from DecisionTrace nodes that were validated on write, so the
+    response payload is built as plain dicts (in Decision's output shape)
+    instead of validating and re-serializing a model per decision. Map
+    projections return missing properties as null, hence the `or` defaults.
+    """
+    return {
+        "trigger": d.get("trigger") or "(untitled)",
+        "context": d.get("context") or "(no context)",
+        "options": d.get("options") or [],
+        "agent_decision": d.get("agent_decision") or d.get("decision") or "(not recorded)",
+        "agent_rationale": d.get("agent_rationale") or d.get("rationale") or "(not recorded)",
+        "human_decision": d.get("human_decision"),
+        "human_rationale": d.get("human_rationale"),
+        "id": d["id"],
+        "confidence": d.get("confidence") or 0.0,
+        # Stored as ISO strings; normalized to Decision's output format
+        "created_at": _DATETIME_ADAPTER.dump_python(
+            datetime.fromisoformat(d["created_at"]), mode="json"
+        ),
+        "entities": [
+            {"id": e["id"], "name": e["name"], "type": e.get("type") or "concept"}
+            for e in entities
+            if e
+        ],
+        "source": DecisionSource.UNKNOWN,
+        "project_name": None,
+    }
+
 
 @router.get("/stats", response_model=DashboardStats)
 async def get_dashboard_stats(
@@ -36,7 +122,7 @@ async def get_dashboard_stats(
     cached = await get_cached("dashboard_stats", user_id)
     if cached is not None:
         logger.debug(f"Returning cached dashboard stats for user {user_id}")
-        return DashboardStats(**cached)
+        return ORJSONResponse(content=cached)
 
     # Track what succeeded for partial responses
     total_sessions = 0
@@ -59,101 +145,37 @@ async def get_dashboard_stats(
         )
         errors.append("postgres_sessions")
 
-    # Get Neo4j stats
+    # Get Neo4j stats in a single round-trip; each CALL subquery returns
+    # exactly one row, so the cross product is one record
     try:
         session = await get_neo4j_session()
         async with session:
-            # Count decisions
-            try:
-                result = await session.run(
-                    "MATCH (d:DecisionTrace) RETURN count(d) as count"
-                )
-                record = await result.single()
-                total_decisions = record["count"] if record else 0
-            except Exception as e:
-                logger.error(
-                    f"Neo4j error counting decisions: {type(e).__name__}: {e}",
-                    exc_info=True,
-                )
-                errors.append("neo4j_decisions")
-
-            # Count entities
+            record = None
             try:
-                result = await session.run("MATCH (e:Entity) RETURN count(e) as count")
+                result = await session.run(DASHBOARD_STATS_QUERY, user_id=user_id)
                 record = await result.single()
-                total_entities = record["count"] if record else 0
             except Exception as e:
                 logger.error(
-                    f"Neo4j error counting entities: {type(e).__name__}: {e}",
+                    f"Neo4j error fetching dashboard stats: {type(e).__name__}: {e}",
                     exc_info=True,
                 )
-                errors.append("neo4j_entities")
-
-            # Get recent decisions
-            try:
-                result = await session.run(
-                    """
-                    MATCH (d:DecisionTrace)
-                    OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
-                    WITH d, collect(e) as entities
-                    ORDER BY d.created_at DESC
-                    LIMIT 6
-                    RETURN d, entities
-                    """
-                )
-
-                async for record in result:
-                    d = record["d"]
-                    entities = record["entities"]
-
-                    decision = Decision(
-                        id=d["id"],
-                        trigger=d.get("trigger") or "(untitled)",
-                        context=d.get("context") or "(no context)",
-                        options=d.get("options", []),
-                        agent_decision=d.get("agent_decision") or d.get("decision") or "(not recorded)",
-                        agent_rationale=d.get("agent_rationale") or d.get("rationale") or "(not recorded)",
-                        human_decision=d.get("human_decision"),
-                        human_rationale=d.get("human_rationale"),
-                        confidence=d.get("confidence", 0.0),
-                        created_at=d.get("created_at", ""),
-                        entities=[
-                            Entity(
-                                id=e["id"],
-                                name=e["name"],
-                                type=e.get("type", "concept"),
-                            )
-                            for e in entities
-                            if e
-                        ],
+                errors.extend(NEO4J_STATS_ERRORS)
+
+            if record:
+                total_decisions = record["total_decisions"]
+                total_entities = record["total_entities"]
+                needs_review = record["needs_review"]
+                try:
+                    recent_decisions = [
+                        _decision_from_record(row["d"], row["entities"])
+                        for row in record["recent"]
+                    ]
+                except Exception as e:
+                    logger.error(
+                        f"Error parsing recent decisions: {type(e).__name__}: {e}",
+                        exc_info=True,
                     )
-                    recent_decisions.append(decision)
-            except Exception as e:
-                logger.error(
-                    f"Neo4j error fetching recent decisions: {type(e).__name__}: {e}",
-                    exc_info=True,
-                )
-                errors.append("neo4j_recent_decisions")
-
-            # Count decisions needing human review
-            try:
-                result = await session.run(
-                    """
-                    MATCH (d:DecisionTrace)
-                    WHERE (d.user_id = $user_id OR d.user_id IS NULL)
-                      AND d.human_rationale IS NULL
-                    RETURN count(d) as count
-                    """,
-                    user_id=user_id,
-                )
-                record = await result.single()
-                needs_review = record["count"] if record else 0
-            except Exception as e:
-                logger.error(
-                    f"Neo4j error counting needs_review: {type(e).__name__}: {e}",
-                    exc_info=True,
-                )
-                errors.append("neo4j_needs_review")
+                    errors.append("neo4j_recent_decisions")
 
     except Neo4jServiceUnavailable as e:
         # Neo4j is not available - this is a critical infrastructure issue
@@ -186,20 +208,22 @@ async def get_dashboard_stats(
     if errors:
         logger.warning(f"Dashboard stats returned with partial failures: {errors}")
 
-    result = DashboardStats(
-        total_decisions=total_decisions,
-        total_entities=total_entities,
-        total_sessions=total_sessions,
-        needs_review=needs_review,
-        recent_decisions=recent_decisions,
-    )
+    # Built as a plain dict and returned directly; DashboardStats remains the
+    # documented response_model
+    result = {
+        "total_decisions": total_decisions,
+        "total_entities": total_entities,
+        "total_sessions": total_sessions,
+        "needs_review": needs_review,
+        "recent_decisions": recent_decisions,
+    }
 
     # SD-024: Cache the result for 30 seconds
     await set_cached(
         "dashboard_stats",
         user_id,
-        result.model_dump(),
+        result,
         ttl=30,
     )
 
-    return result
+    return ORJSONResponse(content=result)
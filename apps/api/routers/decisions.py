@@ -7,17 +7,22 @@ the "anonymous" user_id and not shared across sessions.
 SD-024: Cache invalidation added when decisions are created/deleted.
 """
 
+import base64
+import binascii
 from datetime import UTC, datetime
 from typing import Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from neo4j import AsyncSession
 from neo4j.exceptions import ClientError, DatabaseError, DriverError
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from db.neo4j import get_neo4j_session
+from db.neo4j import get_neo4j_db
 from models.schemas import Decision, DecisionCreate, DecisionUpdate, Entity
 from routers.auth import get_current_user_id
+from services.extractor import get_extractor
 from utils.cache import invalidate_user_caches
 from utils.logging import get_logger
 
@@ -31,10 +36,44 @@ ALLOWED_UPDATE_FIELDS = frozenset({
     "human_decision", "human_rationale",
 })
 
+# Response header carrying the keyset cursor for the next page of decisions
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Serializes a page of decisions in one pass, skipping response_model checks
+_DECISION_LIST_ADAPTER = TypeAdapter(list[Decision])
+
+
+def _encode_cursor(created_at: str, decision_id: str) -> str:
+    """Encode the keyset position of a decision as an opaque page cursor.
+
+    Uses the stored created_at string rather than the serialized response
+    value, so comparisons in Cypher match the stored format exactly.
+    """
+    return base64.urlsafe_b64encode(f"{created_at}\n{decision_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    """Decode a page cursor into its (created_at, decision_id) position.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        created_at, decision_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("\n")
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, decision_id
+
 
 def _decision_from_record(d, entities) -> Decision:
-    """Build a Decision from a Neo4j node dict and entity list."""
-    return Decision(
+    """Build a Decision from a Neo4j node dict and entity list.
+
+    Nodes were validated when they were written, so the models are
+    constructed without re-running field validation for every row.
+    """
+    return Decision.model_construct(
         id=d["id"],
         trigger=d.get("trigger") or "(untitled)",
         context=d.get("context") or "(no context)",
@@ -44,9 +83,12 @@ def _decision_from_record(d, entities) -> Decision:
         human_decision=d.get("human_decision"),
         human_rationale=d.get("human_rationale"),
         confidence=d.get("confidence", 0.0),
-        created_at=d.get("created_at", ""),
+        # Stored as ISO strings; parse here since construct won't
+        created_at=datetime.fromisoformat(d["created_at"]),
         entities=[
-            Entity(id=e["id"], name=e["name"], type=e.get("type", "concept"))
+            Entity.model_construct(
+                id=e["id"], name=e["name"], type=e.get("type", "concept")
+            )
             for e in entities
             if e
         ],
@@ -70,40 +112,58 @@ class ManualDecisionInput(BaseModel):
 async def get_decisions(
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Get all decisions for the current user with pagination.
 
     Users can only see their own decisions. For backward compatibility,
     decisions without a user_id are visible to all users.
+
+    Pages can be requested by offset or, for deep pages, by keyset: pass the
+    X-Next-Cursor header of the previous page as `cursor`. Keyset pages only
+    read `limit` rows, while SKIP still walks every row before the offset.
     """
+    cursor_created_at, cursor_id = _decode_cursor(cursor) if cursor else (None, None)
+
     try:
-        session = await get_neo4j_session()
-        async with session:
-            result = await session.run(
-                """
-                MATCH (d:DecisionTrace)
-                WHERE d.user_id = $user_id OR d.user_id IS NULL
+        # The user's rows and legacy unowned rows are matched separately,
+        # so the user_id branch can seek the index instead of the OR
+        # forcing a label scan. Paginate before collecting entities so
+        # only the returned page is expanded; the subquery keeps row order
+        result = await session.run(
+            """
+            CALL () {
+                MATCH (d:DecisionTrace) WHERE d.user_id = $user_id
+                RETURN d
+                UNION ALL
+                MATCH (d:DecisionTrace) WHERE d.user_id IS NULL
+                RETURN d
+            }
+            WITH d
+            WHERE ($cursor_created_at IS NULL
+                   OR d.created_at < $cursor_created_at
+                   OR (d.created_at = $cursor_created_at
+                       AND d.id < $cursor_id))
+            WITH d
+            ORDER BY d.created_at DESC, d.id DESC
+            SKIP $offset
+            LIMIT $limit
+            CALL (d) {
                 OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
-                WITH d, collect(e) as entities
-                ORDER BY d.created_at DESC
-                SKIP $offset
-                LIMIT $limit
-                RETURN d, entities
-                """,
-                user_id=user_id,
-                offset=offset,
-                limit=limit,
-            )
-
-            decisions = []
-            async for record in result:
-                d = record["d"]
-                entities = record["entities"]
-
-                decisions.append(_decision_from_record(d, entities))
-
-            return decisions
+                RETURN collect(e) as entities
+            }
+            RETURN d, entities
+            """,
+            user_id=user_id,
+            cursor_created_at=cursor_created_at,
+            cursor_id=cursor_id,
+            offset=offset,
+            limit=limit,
+        )
+        # Fetch the page in one call rather than iterating record by record
+        records = await result.data()
     except DriverError as e:
         logger.error(f"Database connection error: {e}")
         raise HTTPException(status_code=503, detail="Database unavailable")
@@ -111,12 +171,29 @@ async def get_decisions(
         logger.error(f"Error fetching decisions: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch decisions")
 
+    decisions = [
+        _decision_from_record(record["d"], record["entities"]) for record in records
+    ]
+    response = ORJSONResponse(
+        content=_DECISION_LIST_ADAPTER.dump_python(decisions, mode="json")
+    )
+
+    # A full page may have more after it
+    if len(records) == limit:
+        last = records[-1]["d"]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(
+            last["created_at"], last["id"]
+        )
+
+    return response
+
 
 @router.get("/needs-review", response_model=dict)
 async def get_needs_review(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Get decisions that need human review (missing human_rationale).
 
@@ -124,46 +201,43 @@ async def get_needs_review(
     agent decisions are easiest to quickly confirm or override.
     """
     try:
-        session = await get_neo4j_session()
-        async with session:
-            # Get total count
-            count_result = await session.run(
-                """
-                MATCH (d:DecisionTrace)
-                WHERE (d.user_id = $user_id OR d.user_id IS NULL)
-                  AND d.human_rationale IS NULL
-                RETURN count(d) as total
-                """,
-                user_id=user_id,
-            )
-            count_record = await count_result.single()
-            total = count_record["total"]
-
-            # Get paginated decisions
-            result = await session.run(
-                """
-                MATCH (d:DecisionTrace)
-                WHERE (d.user_id = $user_id OR d.user_id IS NULL)
-                  AND d.human_rationale IS NULL
-                OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
-                WITH d, collect(e) as entities
-                ORDER BY d.confidence DESC
-                SKIP $offset
-                LIMIT $limit
-                RETURN d, entities
-                """,
-                user_id=user_id,
-                offset=offset,
-                limit=limit,
-            )
+        # Get total count
+        count_result = await session.run(
+            """
+            MATCH (d:DecisionTrace)
+            WHERE (d.user_id = $user_id OR d.user_id IS NULL)
+              AND d.human_rationale IS NULL
+            RETURN count(d) as total
+            """,
+            user_id=user_id,
+        )
+        count_record = await count_result.single()
+        total = count_record["total"]
 
-            decisions = []
-            async for record in result:
-                d = record["d"]
-                entities = record["entities"]
-                decisions.append(_decision_from_record(d, entities))
+        # Get paginated decisions
+        result = await session.run(
+            """
+            MATCH (d:DecisionTrace)
+            WHERE (d.user_id = $user_id OR d.user_id IS NULL)
+              AND d.human_rationale IS NULL
+            OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
+            WITH d, collect(e) as entities
+            ORDER BY d.confidence DESC
+            SKIP $offset
+            LIMIT $limit
+            RETURN d, entities
+            """,
+            user_id=user_id,
+            offset=offset,
+            limit=limit,
+        )
 
-            return {"total_needs_review": total, "decisions": decisions}
+        decisions = [
+            _decision_from_record(record["d"], record["entities"])
+            for record in await result.data()
+        ]
+
+        return {"total_needs_review": total, "decisions": decisions}
     except DriverError as e:
         logger.error(f"Database connection error: {e}")
         raise HTTPException(status_code=503, detail="Database unavailable")
@@ -176,6 +250,7 @@ async def get_needs_review(
 async def delete_decision(
     decision_id: str,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Delete a decision by ID.
 
@@ -183,33 +258,22 @@ async def delete_decision(
     This removes the decision and all its relationships,
     but preserves the entities it was linked to.
     """
-    session = await get_neo4j_session()
-    async with session:
-        # Check if decision exists AND belongs to the user
-        result = await session.run(
-            """
-            MATCH (d:DecisionTrace {id: $id})
-            WHERE d.user_id = $user_id OR d.user_id IS NULL
-            RETURN d
-            """,
-            id=decision_id,
-            user_id=user_id,
-        )
-        record = await result.single()
-        if not record:
-            # Don't reveal if decision exists but belongs to another user
-            raise HTTPException(status_code=404, detail="Decision not found")
-
-        # Delete the decision (DETACH DELETE removes relationships but keeps entities)
-        await session.run(
-            """
-            MATCH (d:DecisionTrace {id: $id})
-            WHERE d.user_id = $user_id OR d.user_id IS NULL
-            DETACH DELETE d
-            """,
-            id=decision_id,
-            user_id=user_id,
-        )
+    # Check ownership and delete in one query; DETACH DELETE removes
+    # relationships but keeps entities
+    result = await session.run(
+        """
+        MATCH (d:DecisionTrace {id: $id})
+        WHERE d.user_id = $user_id OR d.user_id IS NULL
+        DETACH DELETE d
+        RETURN count(d) AS deleted
+        """,
+        id=decision_id,
+        user_id=user_id,
+    )
+    record = await result.single()
+    if not record or record["deleted"] == 0:
+        # Don't reveal if decision exists but belongs to another user
+        raise HTTPException(status_code=404, detail="Decision not found")
 
     logger.info(f"Deleted decision {decision_id} for user {user_id}")
 
@@ -223,34 +287,33 @@ async def delete_decision(
 async def get_decision(
     decision_id: str,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Get a single decision by ID.
 
     Users can only access their own decisions.
     """
-    session = await get_neo4j_session()
-    async with session:
-        result = await session.run(
-            """
-            MATCH (d:DecisionTrace {id: $id})
-            WHERE d.user_id = $user_id OR d.user_id IS NULL
-            OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
-            WITH d, collect(e) as entities
-            RETURN d, entities
-            """,
-            id=decision_id,
-            user_id=user_id,
-        )
+    result = await session.run(
+        """
+        MATCH (d:DecisionTrace {id: $id})
+        WHERE d.user_id = $user_id OR d.user_id IS NULL
+        OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
+        WITH d, collect(e) as entities
+        RETURN d, entities
+        """,
+        id=decision_id,
+        user_id=user_id,
+    )
 
-        record = await result.single()
-        if not record:
-            # Don't reveal if decision exists but belongs to another user
-            raise HTTPException(status_code=404, detail="Decision not found")
+    record = await result.single()
+    if not record:
+        # Don't reveal if decision exists but belongs to another user
+        raise HTTPException(status_code=404, detail="Decision not found")
 
-        d = record["d"]
-        entities = record["entities"]
+    d = record["d"]
+    entities = record["entities"]
 
-        return _decision_from_record(d, entities)
+    return _decision_from_record(d, entities)
 
 
 @router.put("/{decision_id}", response_model=Decision)
@@ -258,6 +321,7 @@ async def update_decision(
     decision_id: str,
     update: DecisionUpdate,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Update an existing decision.
 
@@ -267,87 +331,86 @@ async def update_decision(
 
     Edit history is tracked via edited_at timestamp and edit_count.
     """
-    session = await get_neo4j_session()
-    async with session:
-        # First verify the decision exists and belongs to the user
-        result = await session.run(
-            """
-            MATCH (d:DecisionTrace {id: $id})
-            WHERE d.user_id = $user_id OR d.user_id IS NULL
-            RETURN d
-            """,
-            id=decision_id,
-            user_id=user_id,
+    # First verify the decision exists and belongs to the user
+    result = await session.run(
+        """
+        MATCH (d:DecisionTrace {id: $id})
+        WHERE d.user_id = $user_id OR d.user_id IS NULL
+        RETURN d
+        """,
+        id=decision_id,
+        user_id=user_id,
+    )
+    record = await result.single()
+    if not record:
+        raise HTTPException(status_code=404, detail="Decision not found")
+
+    # Build the SET clause dynamically based on provided fields
+    update_data = update.model_dump(exclude_none=True)
+    if not update_data:
+        raise HTTPException(
+            status_code=400,
+            detail="No fields to update. Provide at least one field.",
         )
-        record = await result.single()
-        if not record:
-            raise HTTPException(status_code=404, detail="Decision not found")
 
-        # Build the SET clause dynamically based on provided fields
-        update_data = update.model_dump(exclude_none=True)
-        if not update_data:
-            raise HTTPException(
-                status_code=400,
-                detail="No fields to update. Provide at least one field.",
-            )
+    # Track edit history
+    edited_at = datetime.now(UTC).isoformat()
 
-        # Track edit history
-        edited_at = datetime.now(UTC).isoformat()
+    # Build Cypher SET clause
+    set_parts = [
+        "d.edited_at = $edited_at",
+        "d.edit_count = COALESCE(d.edit_count, 0) + 1",
+    ]
+    params = {"id": decision_id, "user_id": user_id, "edited_at": edited_at}
 
-        # Build Cypher SET clause
-        set_parts = [
-            "d.edited_at = $edited_at",
-            "d.edit_count = COALESCE(d.edit_count, 0) + 1",
-        ]
-        params = {"id": decision_id, "user_id": user_id, "edited_at": edited_at}
-
-        for field, value in update_data.items():
-            if field not in ALLOWED_UPDATE_FIELDS:
-                raise HTTPException(
-                    status_code=400, detail=f"Field '{field}' cannot be updated"
-                )
-            set_parts.append(f"d.{field} = ${field}")
-            params[field] = value
-
-        set_clause = ", ".join(set_parts)
-
-        # Update the decision
-        await session.run(
-            f"""
-            MATCH (d:DecisionTrace {{id: $id}})
-            WHERE d.user_id = $user_id OR d.user_id IS NULL
-            SET {set_clause}
-            """,
-            **params,
-        )
+    for field, value in update_data.items():
+        if field not in ALLOWED_UPDATE_FIELDS:
+            raise HTTPException(
+                status_code=400, detail=f"Field '{field}' cannot be updated"
+            )
+        set_parts.append(f"d.{field} = ${field}")
+        params[field] = value
+
+    set_clause = ", ".join(set_parts)
+
+    # Update the decision
+    await session.run(
+        f"""
+        MATCH (d:DecisionTrace {{id: $id}})
+        WHERE d.user_id = $user_id OR d.user_id IS NULL
+        SET {set_clause}
+        """,
+        **params,
+    )
 
-        # Fetch and return the updated decision with entities
-        result = await session.run(
-            """
-            MATCH (d:DecisionTrace {id: $id})
-            OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
-            WITH d, collect(e) as entities
-            RETURN d, entities
-            """,
-            id=decision_id,
-        )
+    # Fetch and return the updated decision with entities
+    result = await session.run(
+        """
+        MATCH (d:DecisionTrace {id: $id})
+        OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
+        WITH d, collect(e) as entities
+        RETURN d, entities
+        """,
+        id=decision_id,
+    )
 
-        record = await result.single()
-        d = record["d"]
-        entities = record["entities"]
+    record = await result.single()
+    d = record["d"]
+    entities = record["entities"]
 
-        logger.info(f"Updated decision {decision_id} for user {user_id}")
+    logger.info(f"Updated decision {decision_id} for user {user_id}")
 
-        # SD-024: Invalidate caches since data changed (e.g. needs_review count)
-        await invalidate_user_caches(user_id)
+    # SD-024: Invalidate caches since data changed (e.g. needs_review count)
+    await invalidate_user_caches(user_id)
 
-        return _decision_from_record(d, entities)
+    return _decision_from_record(d, entities)
 
 
 @router.post("", response_model=Decision)
 async def create_decision(
     input: ManualDecisionInput,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Create a decision with automatic entity extraction.
 
@@ -359,8 +422,6 @@ async def create_decision(
     - Automatic embedding generation
     - Relationship extraction between entities
     """
-    from services.extractor import get_extractor
-
     # Create DecisionCreate object
     decision_create = DecisionCreate(
         trigger=input.trigger,
@@ -379,67 +440,11 @@ async def create_decision(
             decision_create,
             source="manual",
             user_id=user_id,
-            project_name=input.project_name
+            project_name=input.project_name,
+            session=session,
         )
-    else:
-        # Manual creation without extraction
-        decision_id = str(uuid4())
-        created_at = datetime.now(UTC).isoformat()
 
-        session = await get_neo4j_session()
-        async with session:
-            await session.run(
-                """
-                CREATE (d:DecisionTrace {
-                    id: $id,
-                    trigger: $trigger,
-                    context: $context,
-                    options: $options,
-                    agent_decision: $agent_decision,
-                    agent_rationale: $agent_rationale,
-                    confidence: 1.0,
-                    created_at: $created_at,
-                    source: 'manual',
-                    user_id: $user_id,
-                    project_name: $project_name
-                })
-                """,
-                id=decision_id,
-                trigger=input.trigger,
-                context=input.context,
-                options=input.options,
-                agent_decision=input.decision,
-                agent_rationale=input.rationale,
-                created_at=created_at,
-                user_id=user_id,
-                project_name=input.project_name,
-            )
-
-            # Create and link manually specified entities
-            for entity_name in input.entities:
-                if entity_name.strip():
-                    entity_id = str(uuid4())
-                    await session.run(
-                        """
-                        MERGE (e:Entity {name: $name})
-                        ON CREATE SET e.id = $id, e.type = 'concept'
-                        WITH e
-                        MATCH (d:DecisionTrace {id: $decision_id})
-                        MERGE (d)-[:INVOLVES]->(e)
-                        """,
-                        id=entity_id,
-                        name=entity_name.strip(),
-                        decision_id=decision_id,
-                    )
-
-    logger.info(f"Created decision {decision_id} for user {user_id}")
-
-    # SD-024: Invalidate caches since data changed
-    await invalidate_user_caches(user_id)
-
-    # Fetch and return the created decision with its entities
-    session = await get_neo4j_session()
-    async with session:
+        # Fetch the created decision with its entities on the same session
         result = await session.run(
             """
             MATCH (d:DecisionTrace {id: $id})
@@ -449,9 +454,58 @@ async def create_decision(
             """,
             id=decision_id,
         )
+        record = await result.single()
+    else:
+        # Manual creation without extraction: create the decision, link the
+        # manually specified entities and return both in a single query
+        decision_id = str(uuid4())
+        created_at = datetime.now(UTC).isoformat()
+        entity_names = dict.fromkeys(
+            name.strip() for name in input.entities if name.strip()
+        )
+        entity_rows = [{"name": name, "id": str(uuid4())} for name in entity_names]
 
+        result = await session.run(
+            """
+            CREATE (d:DecisionTrace {
+                id: $id,
+                trigger: $trigger,
+                context: $context,
+                options: $options,
+                agent_decision: $agent_decision,
+                agent_rationale: $agent_rationale,
+                confidence: 1.0,
+                created_at: $created_at,
+                source: 'manual',
+                user_id: $user_id,
+                project_name: $project_name
+            })
+            WITH d
+            CALL (d) {
+                UNWIND $entities AS row
+                MERGE (e:Entity {name: row.name})
+                ON CREATE SET e.id = row.id, e.type = 'concept'
+                MERGE (d)-[:INVOLVES]->(e)
+                RETURN collect(e) AS entities
+            }
+            RETURN d, entities
+            """,
+            id=decision_id,
+            trigger=input.trigger,
+            context=input.context,
+            options=input.options,
+            agent_decision=input.decision,
+            agent_rationale=input.rationale,
+            created_at=created_at,
+            user_id=user_id,
+            project_name=input.project_name,
+            entities=entity_rows,
+        )
         record = await result.single()
-        d = record["d"]
-        entities = record["entities"]
 
-        return _decision_from_record(d, entities)
+    logger.info(f"Created decision {decision_id} for user {user_id}")
+
+    # SD-024: Invalidate caches since data changed
+    await invalidate_user_caches(user_id)
+
+    return _decision_from_record(record["d"], record["entities"])
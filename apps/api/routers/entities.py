@@ -6,12 +6,14 @@ Users can only access entities that are connected to their own decisions.
 SD-011: Entity lookup cache invalidation on create/update/delete.
 """
 
+from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from neo4j import AsyncSession
 from neo4j.exceptions import ClientError, DatabaseError, DriverError
 
-from db.neo4j import get_neo4j_session
+from db.neo4j import get_neo4j_db
 from models.schemas import (
     Entity,
     LinkEntityRequest,
@@ -84,6 +86,7 @@ async def _decision_exists(session, decision_id: str) -> bool:
 async def link_entity(
     request: LinkEntityRequest,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Link an entity to a decision.
 
@@ -93,32 +96,30 @@ async def link_entity(
     - Both the decision and entity exist before linking
     - User owns the decision being linked to
     """
-    session = await get_neo4j_session()
-    async with session:
-        # SEC-005: Verify decision exists
-        if not await _decision_exists(session, request.decision_id):
-            raise HTTPException(status_code=404, detail="Decision not found")
-
-        # SEC-004: Verify decision belongs to user
-        if not await _verify_decision_access(session, request.decision_id, user_id):
-            # Don't reveal if decision exists but belongs to another user
-            raise HTTPException(status_code=404, detail="Decision not found")
-
-        # SEC-005: Verify entity exists
-        if not await _entity_exists(session, request.entity_id):
-            raise HTTPException(status_code=404, detail="Entity not found")
-
-        # Create the relationship (relationship type is already validated by Pydantic)
-        await session.run(
-            """
-            MATCH (d:DecisionTrace {id: $decision_id})
-            MATCH (e:Entity {id: $entity_id})
-            MERGE (d)-[:INVOLVES {relationship: $relationship}]->(e)
-            """,
-            decision_id=request.decision_id,
-            entity_id=request.entity_id,
-            relationship=request.relationship,
-        )
+    # SEC-005: Verify decision exists
+    if not await _decision_exists(session, request.decision_id):
+        raise HTTPException(status_code=404, detail="Decision not found")
+
+    # SEC-004: Verify decision belongs to user
+    if not await _verify_decision_access(session, request.decision_id, user_id):
+        # Don't reveal if decision exists but belongs to another user
+        raise HTTPException(status_code=404, detail="Decision not found")
+
+    # SEC-005: Verify entity exists
+    if not await _entity_exists(session, request.entity_id):
+        raise HTTPException(status_code=404, detail="Entity not found")
+
+    # Create the relationship (relationship type is already validated by Pydantic)
+    await session.run(
+        """
+        MATCH (d:DecisionTrace {id: $decision_id})
+        MATCH (e:Entity {id: $entity_id})
+        MERGE (d)-[:INVOLVES {relationship: $relationship}]->(e)
+        """,
+        decision_id=request.decision_id,
+        entity_id=request.entity_id,
+        relationship=request.relationship,
+    )
 
     logger.info(f"Linked entity {request.entity_id} to decision {request.decision_id}")
     return {"status": "linked"}
@@ -128,6 +129,7 @@ async def link_entity(
 async def suggest_entities(
     request: SuggestEntitiesRequest,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Suggest entities to link based on text content.
 
@@ -152,74 +154,95 @@ async def suggest_entities(
         else:
             entities.append(e)
 
-    # Find existing entities that match (scoped to user's entities)
-    session = await get_neo4j_session()
-    async with session:
-        suggestions = []
-
-        for entity in entities:
-            # Look for similar existing entities connected to user's decisions
-            result = await session.run(
-                """
-                MATCH (d:DecisionTrace)-[:INVOLVES]->(e:Entity)
-                WHERE (d.user_id = $user_id OR d.user_id IS NULL)
-                AND toLower(e.name) CONTAINS toLower($name)
-                RETURN DISTINCT e
-                LIMIT 3
-                """,
-                name=entity.name,
-                user_id=user_id,
-            )
+    if not entities:
+        return []
 
-            async for record in result:
-                e = record["e"]
-                suggestions.append(
-                    Entity(
-                        id=e["id"],
-                        name=e["name"],
-                        type=e.get("type", "concept"),
-                    )
-                )
+    # Find existing entities that match (scoped to user's entities), for all
+    # extracted names in one query instead of one round-trip per name
+    result = await session.run(
+        """
+        UNWIND range(0, size($names) - 1) AS idx
+        CALL (idx) {
+            MATCH (d:DecisionTrace)-[:INVOLVES]->(e:Entity)
+            WHERE (d.user_id = $user_id OR d.user_id IS NULL)
+            AND toLower(e.name) CONTAINS toLower($names[idx])
+            RETURN DISTINCT e
+            LIMIT 3
+        }
+        RETURN e
+        ORDER BY idx
+        """,
+        names=[entity.name for entity in entities],
+        user_id=user_id,
+    )
+
+    suggestions = []
+    suggested_names = set()
+    async for record in result:
+        e = record["e"]
+        suggestions.append(
+            Entity(
+                id=e["id"],
+                name=e["name"],
+                type=e.get("type", "concept"),
+            )
+        )
+        suggested_names.add(e["name"].lower())
 
-        # Add new entities if not found in suggestions
-        for entity in entities:
-            if not any(s.name.lower() == entity.name.lower() for s in suggestions):
-                suggestions.append(entity)
+    # Add new entities if not found in suggestions
+    for entity in entities:
+        name = entity.name.lower()
+        if name not in suggested_names:
+            suggestions.append(entity)
+            suggested_names.add(name)
 
-        return suggestions
+    return suggestions
 
 
 @router.get("", response_model=list[Entity])
 async def get_all_entities(
+    limit: int = Query(default=100, ge=1, le=500),
+    after_name: Optional[str] = None,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
-    """Get all entities connected to the user's decisions."""
+    """Get entities connected to the user's decisions, ordered by name.
+
+    Pages are keyed by name: pass the name of the last entity of the
+    previous page as `after_name` to fetch the next one.
+    """
     try:
-        session = await get_neo4j_session()
-        async with session:
-            result = await session.run(
-                """
-                MATCH (d:DecisionTrace)-[:INVOLVES]->(e:Entity)
-                WHERE d.user_id = $user_id OR d.user_id IS NULL
-                RETURN DISTINCT e
-                ORDER BY e.name
-                LIMIT 100
-                """,
-                user_id=user_id,
-            )
+        # Walk entities in entity_name index order and stop at the limit,
+        # instead of collecting every reachable entity and sorting it
+        result = await session.run(
+            """
+            MATCH (e:Entity)
+            WHERE e.name > $after_name
+              AND EXISTS {
+                  MATCH (d:DecisionTrace)-[:INVOLVES]->(e)
+                  WHERE d.user_id = $user_id OR d.user_id IS NULL
+              }
+            RETURN e
+            ORDER BY e.name
+            LIMIT $limit
+            """,
+            user_id=user_id,
+            after_name=after_name or "",
+            limit=limit,
+        )
 
-            entities = []
-            async for record in result:
-                e = record["e"]
-                entities.append(
-                    Entity(
-                        id=e["id"],
-                        name=e["name"],
-                        type=e.get("type", "concept"),
-                    )
+        entities = []
+        async for record in result:
+            e = record["e"]
+            entities.append(
+                Entity(
+                    id=e["id"],
+                    name=e["name"],
+                    type=e.get("type", "concept"),
                 )
+            )
 
-            return entities
+        return entities
     except DriverError as e:
         logger.error(f"Database connection error: {e}")
         raise HTTPException(status_code=503, detail="Database unavailable")
@@ -232,6 +255,7 @@ async def get_all_entities(
 async def create_entity(
     entity: Entity,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Create a new entity.
 
@@ -242,47 +266,45 @@ async def create_entity(
     SD-011: Invalidates entity cache on creation.
     """
     cache = get_entity_cache()
-    session = await get_neo4j_session()
-    async with session:
-        # Generate ID if not provided
-        entity_id = entity.id or str(uuid4())
+    # Generate ID if not provided
+    entity_id = entity.id or str(uuid4())
 
-        # Check if entity with same name exists
-        result = await session.run(
-            """
-            MATCH (e:Entity)
-            WHERE toLower(e.name) = toLower($name)
-            RETURN e
-            """,
-            name=entity.name,
-        )
-        existing = await result.single()
-        if existing:
-            # Return existing entity instead of creating duplicate
-            e = existing["e"]
-            return Entity(id=e["id"], name=e["name"], type=e.get("type", "concept"))
+    # Check if entity with same name exists
+    result = await session.run(
+        """
+        MATCH (e:Entity)
+        WHERE toLower(e.name) = toLower($name)
+        RETURN e
+        """,
+        name=entity.name,
+    )
+    existing = await result.single()
+    if existing:
+        # Return existing entity instead of creating duplicate
+        e = existing["e"]
+        return Entity(id=e["id"], name=e["name"], type=e.get("type", "concept"))
 
-        await session.run(
-            """
-            CREATE (e:Entity {
-                id: $id,
-                name: $name,
-                type: $type
-            })
-            """,
-            id=entity_id,
-            name=entity.name,
-            type=entity.type,
-        )
+    await session.run(
+        """
+        CREATE (e:Entity {
+            id: $id,
+            name: $name,
+            type: $type
+        })
+        """,
+        id=entity_id,
+        name=entity.name,
+        type=entity.type,
+    )
 
-        # SD-011: Invalidate cache for any cached lookups with this name
-        # This ensures new entity is discoverable
-        await cache.invalidate_entity(
-            user_id=user_id,
-            entity_id=entity_id,
-            entity_name=entity.name,
-        )
-        logger.debug(f"Entity cache invalidated for new entity: {entity.name}")
+    # SD-011: Invalidate cache for any cached lookups with this name
+    # This ensures new entity is discoverable
+    await cache.invalidate_entity(
+        user_id=user_id,
+        entity_id=entity_id,
+        entity_name=entity.name,
+    )
+    logger.debug(f"Entity cache invalidated for new entity: {entity.name}")
 
     return Entity(id=entity_id, name=entity.name, type=entity.type)
 
@@ -291,34 +313,33 @@ async def create_entity(
 async def get_entity(
     entity_id: str,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Get a single entity by ID.
 
     Users can only access entities connected to their decisions.
     """
-    session = await get_neo4j_session()
-    async with session:
-        # Check if entity is accessible to user
-        result = await session.run(
-            """
-            MATCH (d:DecisionTrace)-[:INVOLVES]->(e:Entity {id: $id})
-            WHERE d.user_id = $user_id OR d.user_id IS NULL
-            RETURN DISTINCT e
-            """,
-            id=entity_id,
-            user_id=user_id,
-        )
-
-        record = await result.single()
-        if not record:
-            raise HTTPException(status_code=404, detail="Entity not found")
+    # Check if entity is accessible to user
+    result = await session.run(
+        """
+        MATCH (d:DecisionTrace)-[:INVOLVES]->(e:Entity {id: $id})
+        WHERE d.user_id = $user_id OR d.user_id IS NULL
+        RETURN DISTINCT e
+        """,
+        id=entity_id,
+        user_id=user_id,
+    )
 
-        e = record["e"]
-        return Entity(
-            id=e["id"],
-            name=e["name"],
-            type=e.get("type", "concept"),
-        )
+    record = await result.single()
+    if not record:
+        raise HTTPException(status_code=404, detail="Entity not found")
+
+    e = record["e"]
+    return Entity(
+        id=e["id"],
+        name=e["name"],
+        type=e.get("type", "concept"),
+    )
 
 
 @router.put("/{entity_id}", response_model=Entity)
@@ -326,6 +347,7 @@ async def update_entity(
     entity_id: str,
     entity: Entity,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Update an entity by ID.
 
@@ -333,50 +355,48 @@ async def update_entity(
     SD-011: Invalidates entity cache on update.
     """
     cache = get_entity_cache()
-    session = await get_neo4j_session()
-    async with session:
-        # Check if entity exists and is accessible to user
-        result = await session.run(
-            """
-            MATCH (d:DecisionTrace)-[:INVOLVES]->(e:Entity {id: $id})
-            WHERE d.user_id = $user_id OR d.user_id IS NULL
-            RETURN DISTINCT e
-            """,
-            id=entity_id,
-            user_id=user_id,
-        )
+    # Check if entity exists and is accessible to user
+    result = await session.run(
+        """
+        MATCH (d:DecisionTrace)-[:INVOLVES]->(e:Entity {id: $id})
+        WHERE d.user_id = $user_id OR d.user_id IS NULL
+        RETURN DISTINCT e
+        """,
+        id=entity_id,
+        user_id=user_id,
+    )
 
-        record = await result.single()
-        if not record:
-            raise HTTPException(status_code=404, detail="Entity not found")
+    record = await result.single()
+    if not record:
+        raise HTTPException(status_code=404, detail="Entity not found")
 
-        old_entity = record["e"]
-        old_name = old_entity.get("name", "")
+    old_entity = record["e"]
+    old_name = old_entity.get("name", "")
 
-        # Update the entity
-        await session.run(
-            """
-            MATCH (e:Entity {id: $id})
-            SET e.name = $name, e.type = $type
-            """,
-            id=entity_id,
-            name=entity.name,
-            type=entity.type,
-        )
+    # Update the entity
+    await session.run(
+        """
+        MATCH (e:Entity {id: $id})
+        SET e.name = $name, e.type = $type
+        """,
+        id=entity_id,
+        name=entity.name,
+        type=entity.type,
+    )
 
-        # SD-011: Invalidate cache for both old and new names
+    # SD-011: Invalidate cache for both old and new names
+    await cache.invalidate_entity(
+        user_id=user_id,
+        entity_id=entity_id,
+        entity_name=old_name,
+    )
+    if entity.name.lower() != old_name.lower():
         await cache.invalidate_entity(
             user_id=user_id,
             entity_id=entity_id,
-            entity_name=old_name,
+            entity_name=entity.name,
         )
-        if entity.name.lower() != old_name.lower():
-            await cache.invalidate_entity(
-                user_id=user_id,
-                entity_id=entity_id,
-                entity_name=entity.name,
-            )
-        logger.debug(f"Entity cache invalidated for updated entity: {entity_id}")
+    logger.debug(f"Entity cache invalidated for updated entity: {entity_id}")
 
     return Entity(id=entity_id, name=entity.name, type=entity.type)
 
@@ -386,6 +406,7 @@ async def delete_entity(
     entity_id: str,
     force: bool = False,
     user_id: str = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_neo4j_db),
 ):
     """Delete an entity by ID.
 
@@ -400,74 +421,58 @@ async def delete_entity(
                If False (default), only delete orphan entities.
     """
     cache = get_entity_cache()
-    session = await get_neo4j_session()
-    async with session:
-        # Check if entity exists and is connected to user's decisions
-        result = await session.run(
-            """
-            MATCH (d:DecisionTrace)-[:INVOLVES]->(e:Entity {id: $id})
-            WHERE d.user_id = $user_id OR d.user_id IS NULL
-            RETURN DISTINCT e
-            """,
-            id=entity_id,
-            user_id=user_id,
+    # Check access, ownership and relationships and delete in one round
+    # trip; the node is only deleted when every check below would pass
+    result = await session.run(
+        """
+        MATCH (d:DecisionTrace)-[r:INVOLVES]->(e:Entity {id: $id})
+        WITH e,
+             count(CASE WHEN d.user_id = $user_id OR d.user_id IS NULL
+                        THEN r END) AS rel_count,
+             count(CASE WHEN d.user_id <> $user_id
+                        THEN d END) AS other_user_count
+        WHERE rel_count > 0
+        WITH e, e {.name, .aliases} AS entity, rel_count, other_user_count
+        CALL (e, rel_count, other_user_count) {
+            WITH e
+            WHERE other_user_count = 0 AND ($force OR rel_count = 0)
+            DETACH DELETE e
+        }
+        RETURN entity, rel_count, other_user_count
+        """,
+        id=entity_id,
+        user_id=user_id,
+        force=force,
+    )
+    record = await result.single()
+    if not record:
+        raise HTTPException(status_code=404, detail="Entity not found")
+
+    # Entity is connected to other users' decisions
+    if record["other_user_count"] > 0:
+        raise HTTPException(
+            status_code=403,
+            detail="Cannot delete entity that is connected to other users' decisions",
         )
-        record = await result.single()
-        if not record:
-            raise HTTPException(status_code=404, detail="Entity not found")
-
-        entity_data = record["e"]
-        entity_name = entity_data.get("name", "")
-        entity_aliases = entity_data.get("aliases", [])
 
-        # Check if entity is connected to other users' decisions
-        result = await session.run(
-            """
-            MATCH (d:DecisionTrace)-[:INVOLVES]->(e:Entity {id: $id})
-            WHERE d.user_id IS NOT NULL AND d.user_id <> $user_id
-            RETURN count(d) as other_user_count
-            """,
-            id=entity_id,
-            user_id=user_id,
+    # Entity has relationships with user's decisions and not forcing
+    if not force and record["rel_count"] > 0:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Entity has {record['rel_count']} relationships. Use force=true to delete anyway.",
         )
-        record = await result.single()
-        if record and record["other_user_count"] > 0:
-            raise HTTPException(
-                status_code=403,
-                detail="Cannot delete entity that is connected to other users' decisions",
-            )
-
-        # Check for relationships with user's decisions if not forcing
-        if not force:
-            result = await session.run(
-                """
-                MATCH (d:DecisionTrace)-[r:INVOLVES]->(e:Entity {id: $id})
-                WHERE d.user_id = $user_id OR d.user_id IS NULL
-                RETURN count(r) as rel_count
-                """,
-                id=entity_id,
-                user_id=user_id,
-            )
-            record = await result.single()
-            if record and record["rel_count"] > 0:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Entity has {record['rel_count']} relationships. Use force=true to delete anyway.",
-                )
 
-        # Delete the entity (DETACH DELETE removes all relationships too)
-        await session.run(
-            "MATCH (e:Entity {id: $id}) DETACH DELETE e",
-            id=entity_id,
-        )
+    entity_data = record["entity"]
+    entity_name = entity_data.get("name") or ""
+    entity_aliases = entity_data.get("aliases") or []
 
-        # SD-011: Invalidate cache for deleted entity
-        await cache.invalidate_entity(
-            user_id=user_id,
-            entity_id=entity_id,
-            entity_name=entity_name,
-            aliases=entity_aliases if entity_aliases else None,
-        )
-        logger.debug(f"Entity cache invalidated for deleted entity: {entity_id}")
+    # SD-011: Invalidate cache for deleted entity
+    await cache.invalidate_entity(
+        user_id=user_id,
+        entity_id=entity_id,
+        entity_name=entity_name,
+        aliases=entity_aliases if entity_aliases else None,
+    )
+    logger.debug(f"Entity cache invalidated for deleted entity: {entity_id}")
 
     return {"status": "deleted", "id": entity_id}
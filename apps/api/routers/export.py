@@ -8,8 +8,9 @@ from datetime import UTC, datetime
 from typing import Optional
 from uuid import uuid4
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from neo4j.exceptions import ClientError, DatabaseError, DriverError
 from pydantic import BaseModel, Field, field_validator
 
@@ -41,13 +42,17 @@ class DecisionImportItem(BaseModel):
         """Validate each option string."""
         if not v:
             raise ValueError("At least one option is required")
-        validated = []
-        for opt in v:
-            if not opt or len(opt) > 1000:
-                raise ValueError("Each option must be 1-1000 characters")
-            validated.append(opt.strip())
+        validated = [opt.strip() for opt in v if opt and len(opt) <= 1000]
+        if len(validated) != len(v):
+            raise ValueError("Each option must be 1-1000 characters")
         return validated
 
+    @field_validator("source")
+    @classmethod
+    def default_empty_source(cls, v: str) -> str:
+        """Treat an empty source as an import."""
+        return v or "import"
+
 
 class BulkImportRequest(BaseModel):
     """Request body for bulk import."""
@@ -91,6 +96,85 @@ class BulkExportResult(BaseModel):
     decisions: list[ExportDecision]
 
 
+async def _run_export_query(
+    session, user_id: str, source_filter: Optional[str], limit: int
+):
+    """Run the export query and return the result cursor.
+
+    Args:
+        session: Open Neo4j session or transaction to run the query on.
+        user_id: The user whose decisions are exported.
+        source_filter: Optional source to restrict the export to.
+        limit: Maximum number of decisions to return.
+
+    Returns:
+        The Neo4j result, yielding one record per decision with its entities.
+    """
+    # Owned and legacy (NULL user_id) decisions are fetched in separate
+    # branches so the owned branch can walk the (user_id, created_at) index
+    # in order and stop at the limit instead of scanning and sorting the label
+    query = """
+        CALL () {
+            MATCH (d:DecisionTrace)
+            WHERE d.user_id = $user_id
+              AND ($source_filter IS NULL OR d.source = $source_filter)
+            RETURN d ORDER BY d.created_at DESC LIMIT $limit
+            UNION ALL
+            MATCH (d:DecisionTrace)
+            WHERE d.user_id IS NULL
+              AND ($source_filter IS NULL OR d.source = $source_filter)
+            RETURN d ORDER BY d.created_at DESC LIMIT $limit
+        }
+        WITH d
+        ORDER BY d.created_at DESC
+        LIMIT $limit
+        RETURN d, COLLECT { MATCH (d)-[:INVOLVES]->(e:Entity) RETURN e } AS entities
+    """
+
+    return await session.run(
+        query, user_id=user_id, source_filter=source_filter or None, limit=limit
+    )
+
+
+def _export_record(record) -> dict:
+    """Convert an export query record into the portable export format."""
+    d = record["d"]
+    return {
+        "trigger": d.get("trigger", ""),
+        "context": d.get("context", ""),
+        "options": d.get("options", []),
+        "decision": d.get("decision", ""),
+        "rationale": d.get("rationale", ""),
+        "confidence": d.get("confidence", 0.0),
+        "source": d.get("source", "unknown"),
+        "created_at": d.get("created_at", ""),
+        "entities": [
+            {"name": e["name"], "type": e.get("type", "concept")}
+            for e in record["entities"]
+            if e
+        ],
+    }
+
+
+class _SessionStreamingResponse(StreamingResponse):
+    """Streaming response that owns the Neo4j session its body reads from.
+
+    The session is closed once the response finishes, however it finishes,
+    including client disconnects before or during streaming, where the body
+    generator may never run its own cleanup.
+    """
+
+    def __init__(self, content, session, **kwargs):
+        super().__init__(content, **kwargs)
+        self.session = session
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.session.close()
+
+
 @router.post("/import", response_model=BulkImportResult)
 async def bulk_import_decisions(
     request: BulkImportRequest,
@@ -105,97 +189,115 @@ async def bulk_import_decisions(
     - Optionally skips duplicates (matched by trigger + decision text)
     - All imported decisions are owned by the current user
     """
-    imported_count = 0
-    skipped_count = 0
     errors = []
-    decision_ids = []
+    rows = []
+
+    async def import_batch(tx) -> list[dict]:
+        """Filter out duplicates and create the remaining decisions."""
+        # Fetch every (trigger, decision) pair that already exists in one
+        # round-trip instead of probing per item
+        existing: set[tuple[str, str]] = set()
+        if request.skip_duplicates:
+            result = await tx.run(
+                """
+                UNWIND $pairs AS p
+                MATCH (d:DecisionTrace)
+                WHERE d.user_id = $user_id
+                  AND d.trigger = p.trigger
+                  AND COALESCE(d.agent_decision, d.decision) = p.decision
+                RETURN DISTINCT p.trigger AS trigger, p.decision AS decision
+                """,
+                pairs=[
+                    {"trigger": item.trigger, "decision": item.decision}
+                    for item in request.decisions
+                ],
+                user_id=user_id,
+            )
+            async for record in result:
+                existing.add((record["trigger"], record["decision"]))
+
+        batch = []
+        created_at = datetime.now(UTC).isoformat()
+        for item in request.decisions:
+            if request.skip_duplicates:
+                key = (item.trigger, item.decision)
+                if key in existing:
+                    continue
+                # Repeats within the same payload count as duplicates too
+                existing.add(key)
+
+            batch.append(
+                {
+                    "id": str(uuid4()),
+                    "trigger": item.trigger,
+                    "context": item.context,
+                    "options": item.options,
+                    "decision": item.decision,
+                    "rationale": item.rationale,
+                    "confidence": item.confidence,
+                    "created_at": created_at,
+                    "source": item.source,
+                    "entities": list(
+                        dict.fromkeys(
+                            name.strip() for name in item.entities if name.strip()
+                        )
+                    ),
+                }
+            )
+
+        if batch:
+            # One UNWIND creates every decision and links its entities;
+            # entity ids are generated server-side with randomUUID()
+            await tx.run(
+                """
+                UNWIND $rows AS r
+                CREATE (d:DecisionTrace {
+                    id: r.id,
+                    trigger: r.trigger,
+                    context: r.context,
+                    options: r.options,
+                    decision: r.decision,
+                    rationale: r.rationale,
+                    confidence: r.confidence,
+                    created_at: r.created_at,
+                    source: r.source,
+                    user_id: $user_id
+                })
+                WITH d, r
+                UNWIND r.entities AS name
+                MERGE (e:Entity {name: name})
+                ON CREATE SET e.id = randomUUID(), e.type = 'concept'
+                MERGE (d)-[:INVOLVES]->(e)
+                """,
+                rows=batch,
+                user_id=user_id,
+            )
+        return batch
 
     session = await get_neo4j_session()
     async with session:
-        for idx, item in enumerate(request.decisions):
-            try:
-                # Check for duplicates if skip_duplicates is enabled
-                if request.skip_duplicates:
-                    result = await session.run(
-                        """
-                        MATCH (d:DecisionTrace)
-                        WHERE d.user_id = $user_id
-                          AND d.trigger = $trigger
-                          AND COALESCE(d.agent_decision, d.decision) = $decision
-                        RETURN d.id as id
-                        LIMIT 1
-                        """,
-                        user_id=user_id,
-                        trigger=item.trigger,
-                        decision=item.decision,
-                    )
-                    record = await result.single()
-                    if record:
-                        skipped_count += 1
-                        continue
-
-                # Create the decision
-                decision_id = str(uuid4())
-                created_at = datetime.now(UTC).isoformat()
-
-                await session.run(
-                    """
-                    CREATE (d:DecisionTrace {
-                        id: $id,
-                        trigger: $trigger,
-                        context: $context,
-                        options: $options,
-                        decision: $decision,
-                        rationale: $rationale,
-                        confidence: $confidence,
-                        created_at: $created_at,
-                        source: $source,
-                        user_id: $user_id
-                    })
-                    """,
-                    id=decision_id,
-                    trigger=item.trigger,
-                    context=item.context,
-                    options=item.options,
-                    decision=item.decision,
-                    rationale=item.rationale,
-                    confidence=item.confidence,
-                    created_at=created_at,
-                    source=item.source or "import",
-                    user_id=user_id,
-                )
-
-                # Create and link entities
-                for entity_name in item.entities:
-                    if entity_name.strip():
-                        entity_id = str(uuid4())
-                        await session.run(
-                            """
-                            MERGE (e:Entity {name: $name})
-                            ON CREATE SET e.id = $id, e.type = 'concept'
-                            WITH e
-                            MATCH (d:DecisionTrace {id: $decision_id})
-                            MERGE (d)-[:INVOLVES]->(e)
-                            """,
-                            id=entity_id,
-                            name=entity_name.strip(),
-                            decision_id=decision_id,
-                        )
-
-                decision_ids.append(decision_id)
-                imported_count += 1
-
-            except Exception as e:
-                logger.error(f"Error importing decision at index {idx}: {e}")
-                errors.append(
-                    {
-                        "index": idx,
-                        "trigger": item.trigger[:50] + "..."
-                        if len(item.trigger) > 50
-                        else item.trigger,
-                        "error": str(e),
-                    }
-                )
+        try:
+            # The duplicate check and all writes commit (or roll back) together;
+            # the managed transaction is retried on transient errors
+            rows = await session.execute_write(import_batch)
+        except (ClientError, DatabaseError, DriverError) as e:
+            logger.error(f"Error importing decisions: {e}")
+            rows = []
+            errors = [
+                {
+                    "index": idx,
+                    "trigger": item.trigger[:50] + "..."
+                    if len(item.trigger) > 50
+                    else item.trigger,
+                    "error": str(e),
+                }
+                for idx, item in enumerate(request.decisions)
+            ]
+
+    decision_ids = [row["id"] for row in rows]
+    # Nothing is committed on failure, so every item is reported as an error
+    skipped_count = 0 if errors else len(request.decisions) - len(rows)
+    imported_count = len(decision_ids)
 
     # Invalidate caches since data changed
     if imported_count > 0:
@@ -236,60 +338,25 @@ async def bulk_export_decisions(
     try:
         session = await get_neo4j_session()
         async with session:
-            # Build query with optional source filter
-            where_clause = "WHERE d.user_id = $user_id OR d.user_id IS NULL"
-            if source_filter:
-                where_clause += " AND d.source = $source_filter"
+            # Records go straight to orjson; BulkExportResult only documents
+            # the response schema
+            async def fetch_decisions(tx) -> list[dict]:
+                """Read the export rows inside a retryable read transaction."""
+                result = await _run_export_query(tx, user_id, source_filter, limit)
+                return [_export_record(record) async for record in result]
 
-            query = f"""
-                MATCH (d:DecisionTrace)
-                {where_clause}
-                OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
-                WITH d, collect(e) as entities
-                ORDER BY d.created_at DESC
-                LIMIT $limit
-                RETURN d, entities
-            """
-
-            params = {
-                "user_id": user_id,
-                "limit": limit,
-            }
-            if source_filter:
-                params["source_filter"] = source_filter
-
-            result = await session.run(query, **params)
-
-            decisions = []
-            async for record in result:
-                d = record["d"]
-                entities = record["entities"]
-
-                export_decision = ExportDecision(
-                    trigger=d.get("trigger", ""),
-                    context=d.get("context", ""),
-                    options=d.get("options", []),
-                    decision=d.get("decision", ""),
-                    rationale=d.get("rationale", ""),
-                    confidence=d.get("confidence", 0.0),
-                    source=d.get("source", "unknown"),
-                    created_at=d.get("created_at", ""),
-                    entities=[
-                        {"name": e["name"], "type": e.get("type", "concept")}
-                        for e in entities
-                        if e
-                    ],
-                )
-                decisions.append(export_decision)
+            decisions = await session.execute_read(fetch_decisions)
 
             logger.info(
                 f"Bulk export for user {user_id}: exported={len(decisions)} decisions"
             )
 
-            return BulkExportResult(
-                exported_at=datetime.now(UTC).isoformat(),
-                total_decisions=len(decisions),
-                decisions=decisions,
+            return ORJSONResponse(
+                content={
+                    "exported_at": datetime.now(UTC).isoformat(),
+                    "total_decisions": len(decisions),
+                    "decisions": decisions,
+                }
             )
 
     except DriverError as e:
@@ -308,19 +375,43 @@ async def download_export(
     """Download decisions as a JSON file.
 
     Returns the export with Content-Disposition header for file download.
+    The document is streamed from the Neo4j cursor one decision at a time, so
+    memory use does not grow with the size of the export.
     """
-    export_result = await bulk_export_decisions(
-        source_filter=source_filter,
-        limit=10000,
-        user_id=user_id,
-    )
+    session = await get_neo4j_session()
+    try:
+        result = await _run_export_query(session, user_id, source_filter, 10000)
+    except DriverError as e:
+        await session.close()
+        logger.error(f"Database connection error during export: {e}")
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    except (ClientError, DatabaseError) as e:
+        await session.close()
+        logger.error(f"Error exporting decisions: {e}")
+        raise HTTPException(status_code=500, detail="Failed to export decisions")
+
+    async def generate():
+        """Yield the export document one decision at a time."""
+        total = 0
+        try:
+            exported_at = orjson.dumps(datetime.now(UTC).isoformat())
+            yield b'{"exported_at":' + exported_at + b',"decisions":['
+            async for record in result:
+                if total:
+                    yield b","
+                yield orjson.dumps(_export_record(record))
+                total += 1
+            yield b'],"total_decisions":' + str(total).encode() + b"}"
+        finally:
+            logger.info(
+                f"Export download for user {user_id}: exported={total} decisions"
+            )
 
     filename = f"continuum-decisions-{datetime.now(UTC).strftime('%Y%m%d-%H%M%S')}.json"
 
-    return JSONResponse(
-        content=export_result.model_dump(),
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Type": "application/json",
-        },
+    return _SessionStreamingResponse(
+        generate(),
+        session=session,
+        media_type="application/json",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
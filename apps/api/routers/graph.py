@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from neo4j.exceptions import ClientError, DatabaseError, DriverError
 from pydantic import BaseModel
 
-from db.neo4j import get_neo4j_session
+from db.neo4j import VECTOR_SEARCH_CANDIDATES, get_neo4j_session
 from models.schemas import (
     GraphData,
     GraphEdge,
@@ -82,6 +82,17 @@ class AnalyzeRelationshipsResponse(BaseModel):
     contradicts_created: int
 
 
+def _similar_decision(record, similarity: float) -> SimilarDecision:
+    """Build a SimilarDecision from a similarity query record."""
+    return SimilarDecision(
+        id=record["id"],
+        trigger=record["trigger"] or "",
+        decision=record["decision"] or "",
+        similarity=similarity,
+        shared_entities=record["shared_entities"] or [],
+    )
+
+
 def _user_filter_clause(alias: str = "d") -> str:
     """Return a Cypher WHERE clause for user isolation.
 
@@ -1107,7 +1118,40 @@ async def get_similar_nodes(
         if not embedding:
             raise HTTPException(status_code=400, detail="Decision has no embedding")
 
-        # Find similar decisions within user's data (try GDS first, fall back to manual)
+        # Find similar decisions within user's data: decision_embedding HNSW
+        # index first, then GDS, then manual calculation
+        try:
+            result = await session.run(
+                """
+                CALL db.index.vector.queryNodes('decision_embedding', $candidates, $embedding)
+                YIELD node AS d, score
+                WITH d, 2 * score - 1 AS similarity
+                WHERE d.id <> $id
+                AND (d.user_id = $user_id OR d.user_id IS NULL)
+                AND similarity > $threshold
+                OPTIONAL MATCH (d)-[:INVOLVES]->(e:Entity)
+                RETURN d.id as id, d.trigger as trigger,
+                       COALESCE(d.agent_decision, d.decision) as decision,
+                       similarity, collect(e.name) as shared_entities
+                ORDER BY similarity DESC
+                LIMIT $top_k
+                """,
+                id=node_id,
+                embedding=embedding,
+                threshold=threshold,
+                top_k=top_k,
+                user_id=user_id,
+                candidates=max(VECTOR_SEARCH_CANDIDATES, top_k * 4),
+            )
+            similar = [_similar_decision(r, r["similarity"]) async for r in result]
+            # The index ranks every user's decisions before the scope filter,
+            # so other tenants can fill the candidate page; a short page falls
+            # through to the user-scoped scan below
+            if len(similar) >= top_k:
+                return similar
+        except (ClientError, DatabaseError) as e:
+            logger.debug(f"Decision vector index query failed, trying GDS: {e}")
+
         try:
             result = await session.run(
                 """
@@ -1129,6 +1173,7 @@ async def get_similar_nodes(
                 top_k=top_k,
                 user_id=user_id,
             )
+            return [_similar_decision(r, r["similarity"]) async for r in result]
         except (ClientError, DatabaseError):
             # Fall back to manual similarity calculation (GDS not installed)
             result = await session.run(
@@ -1147,36 +1192,13 @@ async def get_similar_nodes(
 
             similar = []
             async for r in result:
-                other_embedding = r["other_embedding"]
-                similarity = cosine_similarity(embedding, other_embedding)
+                similarity = cosine_similarity(embedding, r["other_embedding"])
                 if similarity > threshold:
-                    similar.append(
-                        SimilarDecision(
-                            id=r["id"],
-                            trigger=r["trigger"] or "",
-                            decision=r["decision"] or "",
-                            similarity=similarity,
-                            shared_entities=r["shared_entities"] or [],
-                        )
-                    )
+                    similar.append(_similar_decision(r, similarity))
 
             similar.sort(key=lambda x: x.similarity, reverse=True)
             return similar[:top_k]
 
-        similar = []
-        async for r in result:
-            similar.append(
-                SimilarDecision(
-                    id=r["id"],
-                    trigger=r["trigger"] or "",
-                    decision=r["decision"] or "",
-                    similarity=r["similarity"],
-                    shared_entities=r["shared_entities"] or [],
-                )
-            )
-
-        return similar
-
 
 @router.post("/search/hybrid", response_model=list[HybridSearchResult])
 async def hybrid_search(
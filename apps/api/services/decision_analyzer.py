@@ -9,6 +9,7 @@ from json import JSONDecodeError
 from typing import Optional
 
 from services.llm import get_llm_client
+from utils.json_extraction import strip_code_fence
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -81,10 +82,7 @@ Return ONLY valid JSON, no markdown or explanation."""
         try:
             response = await self.llm.generate(prompt, temperature=0.3)
 
-            text = response.strip()
-            if text.startswith("```"):
-                text = text.split("\n", 1)[1]
-                text = text.rsplit("```", 1)[0]
+            text = strip_code_fence(response.strip())
 
             result = json.loads(text)
 
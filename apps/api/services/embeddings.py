@@ -128,6 +128,53 @@ class EmbeddingService:
         except Exception as e:
             logger.warning(f"Cache write error: {e}")
 
+    async def _get_cached_embeddings(
+        self, cache_keys: dict[int, str]
+    ) -> dict[int, List[float]]:
+        """Get several embeddings from cache with a single MGET.
+
+        Args:
+            cache_keys: Mapping of text index to cache key
+
+        Returns:
+            Mapping of text index to cached embedding, for cache hits only
+        """
+        if not cache_keys:
+            return {}
+        redis_client = await self._get_redis()
+        if redis_client is None:
+            return {}
+
+        try:
+            indices = list(cache_keys)
+            values = await redis_client.mget([cache_keys[i] for i in indices])
+            return {
+                i: json.loads(value)
+                for i, value in zip(indices, values)
+                if value is not None
+            }
+        except Exception as e:
+            logger.warning(f"Cache read error: {e}")
+            return {}
+
+    async def _set_cached_embeddings(self, embeddings: dict[str, List[float]]) -> None:
+        """Store several embeddings in cache with one pipelined round-trip."""
+        if not embeddings:
+            return
+        redis_client = await self._get_redis()
+        if redis_client is None:
+            return
+
+        try:
+            ttl = self._settings.embedding_cache_ttl
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for cache_key, embedding in embeddings.items():
+                    pipe.setex(cache_key, ttl, json.dumps(embedding))
+                await pipe.execute()
+            logger.debug(f"Cached {len(embeddings)} embeddings")
+        except Exception as e:
+            logger.warning(f"Cache write error: {e}")
+
     async def embed_text(self, text: str, input_type: str = "passage") -> List[float]:
         """
         Generate embedding for a single text with caching and circuit breaker.
@@ -206,14 +253,20 @@ class EmbeddingService:
         results: List[List[float] | None] = [None] * len(texts)
         texts_to_embed: List[tuple[int, str]] = []  # (original_index, text)
 
+        min_length = self._settings.embedding_cache_min_text_length
+        cache_keys = {
+            i: self._get_cache_key(text, input_type)
+            for i, text in enumerate(texts)
+            if len(text) >= min_length
+        }
+        cached_embeddings = await self._get_cached_embeddings(cache_keys)
+
         for i, text in enumerate(texts):
-            if len(text) >= self._settings.embedding_cache_min_text_length:
-                cache_key = self._get_cache_key(text, input_type)
-                cached = await self._get_cached_embedding(cache_key)
-                if cached is not None:
-                    results[i] = cached
-                    continue
-            texts_to_embed.append((i, text))
+            cached = cached_embeddings.get(i)
+            if cached is not None:
+                results[i] = cached
+            else:
+                texts_to_embed.append((i, text))
 
         # Log cache stats
         cache_hits = len(texts) - len(texts_to_embed)
@@ -239,15 +292,15 @@ class EmbeddingService:
                     )
 
                     # Store results and cache them
+                    to_cache: dict[str, List[float]] = {}
                     for j, embedding_data in enumerate(response.data):
                         original_idx, text = batch[j]
                         embedding = embedding_data.embedding
                         results[original_idx] = embedding
+                        if original_idx in cache_keys:
+                            to_cache[cache_keys[original_idx]] = embedding
 
-                        # Cache the result
-                        if len(text) >= self._settings.embedding_cache_min_text_length:
-                            cache_key = self._get_cache_key(text, input_type)
-                            await self._set_cached_embedding(cache_key, embedding)
+                    await self._set_cached_embeddings(to_cache)
 
                 # SD-006: Record success after all batches complete
                 await self._circuit_breaker._record_success()
@@ -29,8 +29,9 @@ from neo4j.exceptions import ClientError, DatabaseError
 from rapidfuzz import fuzz
 
 from config import get_settings
+from db.neo4j import VECTOR_SEARCH_CANDIDATES
 from models.ontology import (
-    CANONICAL_NAMES,
+    CANONICAL_ALIASES,
     ResolvedEntity,
     get_canonical_name,
     normalize_entity_name,
@@ -497,7 +498,35 @@ class EntityResolver:
         self, embedding: list[float], threshold: float
     ) -> Optional[dict]:
         """Find entity by embedding similarity, preferring user's entities."""
-        # Try user's entities first with GDS
+        # Primary: HNSW lookup on the entity_embedding vector index. One query
+        # ranks the user's entities ahead of global ones, replacing the two
+        # linear GDS scans below.
+        try:
+            result = await self.session.run(
+                """
+                CALL db.index.vector.queryNodes('entity_embedding', $candidates, $embedding)
+                YIELD node AS e, score
+                WITH e, 2 * score - 1 AS similarity
+                WHERE similarity > $threshold
+                WITH e, similarity, EXISTS {
+                    MATCH (d:DecisionTrace)-[:INVOLVES]->(e)
+                    WHERE d.user_id = $user_id OR d.user_id IS NULL
+                } AS is_user_entity
+                RETURN e.id AS id, e.name AS name, e.type AS type, similarity
+                ORDER BY is_user_entity DESC, similarity DESC
+                LIMIT 1
+                """,
+                embedding=embedding,
+                threshold=threshold,
+                user_id=self.user_id,
+                candidates=VECTOR_SEARCH_CANDIDATES,
+            )
+            record = await result.single()
+            return dict(record) if record else None
+        except (ClientError, DatabaseError) as e:
+            logger.debug(f"Entity vector index query failed, trying GDS: {e}")
+
+        # Secondary: user's entities first with GDS
         try:
             result = await self.session.run(
                 """
@@ -642,7 +671,7 @@ class EntityResolver:
             # Keep the entity with the canonical name or the first one
             canonical_entity = None
             for entity in group:
-                if entity["name"] in CANONICAL_NAMES.values():
+                if entity["name"] in CANONICAL_ALIASES:
                     canonical_entity = entity
                     break
 
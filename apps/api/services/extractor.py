@@ -17,7 +17,7 @@ import redis.asyncio as redis
 from neo4j.exceptions import ClientError, DatabaseError
 
 from config import get_settings
-from db.neo4j import get_neo4j_session
+from db.neo4j import VECTOR_SEARCH_CANDIDATES, neo4j_session
 from models.ontology import (
     ENTITY_ONLY_RELATIONSHIPS,
     get_canonical_name,
@@ -39,6 +39,9 @@ from utils.vectors import cosine_similarity
 
 logger = get_logger(__name__)
 
+# Maximum SIMILAR_TO edges created for a newly saved decision
+SIMILAR_DECISION_LINK_LIMIT = 5
+
 # Default values for missing decision fields (ML-QW-3)
 DEFAULT_DECISION_FIELDS = {
     "confidence": 0.5,
@@ -1132,6 +1135,7 @@ class DecisionExtractor:
         source_path: Optional[str] = None,
         message_index: Optional[int] = None,
         project_name: Optional[str] = None,
+        session=None,
     ) -> str:
         """Save a decision to Neo4j with embeddings, rich relationships, and provenance (KG-P2-4).
 
@@ -1147,6 +1151,8 @@ class DecisionExtractor:
             source_path: Optional path to source file for provenance tracking
             message_index: Optional index of message in conversation
             project_name: Optional project this decision belongs to
+            session: Optional Neo4j session to write with; a pooled one is
+                opened and closed here if not given
 
         Returns:
             The ID of the created decision
@@ -1201,8 +1207,7 @@ class DecisionExtractor:
             logger.warning(f"Invalid embedding input: {e}")
             embedding = None
 
-        session = await get_neo4j_session()
-        async with session:
+        async with neo4j_session(session) as session:
             # Create decision node with embedding, user_id, and provenance (KG-P2-4)
             if embedding:
                 await session.run(
@@ -1524,25 +1529,57 @@ class DecisionExtractor:
         Uses configurable similarity threshold from settings.
         """
         try:
-            # Use Neo4j vector search to find similar decisions within user scope
-            result = await session.run(
-                """
-                MATCH (d:DecisionTrace)
-                WHERE d.id <> $id AND d.embedding IS NOT NULL
-                  AND (d.user_id = $user_id OR d.user_id IS NULL)
-                WITH d, gds.similarity.cosine(d.embedding, $embedding) AS similarity
-                WHERE similarity > $threshold
-                RETURN d.id AS similar_id, similarity
-                ORDER BY similarity DESC
-                LIMIT 5
-                """,
-                id=decision_id,
-                embedding=embedding,
-                threshold=self.similarity_threshold,
-                user_id=user_id,
-            )
-
-            records = [r async for r in result]
+            # Use the decision_embedding HNSW index to find similar decisions
+            # within user scope; fall back to a GDS linear scan if unavailable
+            records = None
+            try:
+                result = await session.run(
+                    """
+                    CALL db.index.vector.queryNodes('decision_embedding', $candidates, $embedding)
+                    YIELD node AS d, score
+                    WITH d, 2 * score - 1 AS similarity
+                    WHERE d.id <> $id
+                      AND (d.user_id = $user_id OR d.user_id IS NULL)
+                      AND similarity > $threshold
+                    RETURN d.id AS similar_id, similarity
+                    ORDER BY similarity DESC
+                    LIMIT $limit
+                    """,
+                    id=decision_id,
+                    embedding=embedding,
+                    threshold=self.similarity_threshold,
+                    user_id=user_id,
+                    limit=SIMILAR_DECISION_LINK_LIMIT,
+                    candidates=VECTOR_SEARCH_CANDIDATES,
+                )
+                records = [r async for r in result]
+                # The index ranks every user's decisions before the scope
+                # filter, so other tenants can fill the candidate page; a
+                # short page is redone with the user-scoped scan
+                if len(records) < SIMILAR_DECISION_LINK_LIMIT:
+                    records = None
+            except (ClientError, DatabaseError) as e:
+                logger.debug(f"Decision vector index query failed, trying GDS: {e}")
+
+            if records is None:
+                result = await session.run(
+                    """
+                    MATCH (d:DecisionTrace)
+                    WHERE d.id <> $id AND d.embedding IS NOT NULL
+                      AND (d.user_id = $user_id OR d.user_id IS NULL)
+                    WITH d, gds.similarity.cosine(d.embedding, $embedding) AS similarity
+                    WHERE similarity > $threshold
+                    RETURN d.id AS similar_id, similarity
+                    ORDER BY similarity DESC
+                    LIMIT $limit
+                    """,
+                    id=decision_id,
+                    embedding=embedding,
+                    threshold=self.similarity_threshold,
+                    user_id=user_id,
+                    limit=SIMILAR_DECISION_LINK_LIMIT,
+                )
+                records = [r async for r in result]
 
             for record in records:
                 similar_id = record["similar_id"]
@@ -1572,7 +1609,7 @@ class DecisionExtractor:
                 )
 
         except (ClientError, DatabaseError) as e:
-            # GDS library may not be installed, fall back to manual calculation
+            # Neither vector index nor GDS available, fall back to manual calculation
             logger.debug(f"Vector search failed (GDS may not be installed): {e}")
             await self._link_similar_decisions_manual(
                 session, decision_id, embedding, user_id
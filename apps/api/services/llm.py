@@ -39,6 +39,23 @@ DEFAULT_RATE_LIMIT_WINDOW = 60  # Window in seconds
 ANONYMOUS_RATE_LIMIT_REQUESTS = 10  # Stricter limit for anonymous users
 
 
+def estimate_tokens(text: str) -> int:
+    """Estimate token count for a piece of text (ML-P1-3).
+
+    Approximately 4 characters per token, which is conservative for English
+    and much cheaper than running a tokenizer on every pre-flight check.
+
+    Args:
+        text: The text to estimate tokens for
+
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+    return len(text) // 4 + 1
+
+
 class PromptTooLargeError(ValueError):
     """Raised when the prompt exceeds the maximum allowed token count."""
 
@@ -270,11 +287,7 @@ class LLMClient:
         Returns:
             Estimated token count
         """
-        if not text:
-            return 0
-        # Rough estimate: 4 characters per token (conservative for English)
-        # This is faster than actual tokenization and sufficient for pre-flight checks
-        return len(text) // 4 + 1
+        return estimate_tokens(text)
 
     def _estimate_messages_tokens(self, messages: list[dict]) -> int:
         """Estimate total tokens for a list of messages.
@@ -298,6 +311,7 @@ class LLMClient:
         prompt: str,
         system_prompt: str = "",
         max_prompt_tokens: int | None = None,
+        history: list[dict] | None = None,
     ) -> int:
         """Validate that the prompt size is within limits.
 
@@ -305,6 +319,7 @@ class LLMClient:
             prompt: The user prompt
             system_prompt: Optional system prompt
             max_prompt_tokens: Override for max token limit (default: from settings)
+            history: Optional prior conversation turns sent ahead of the prompt
 
         Returns:
             Estimated token count
@@ -316,10 +331,7 @@ class LLMClient:
             max_prompt_tokens = self.settings.max_prompt_tokens
 
         # Build messages to estimate
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_prompt, history)
 
         estimated_tokens = self._estimate_messages_tokens(messages)
 
@@ -341,6 +353,52 @@ class LLMClient:
 
         return estimated_tokens
 
+    def _build_messages(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        history: list[dict] | None = None,
+    ) -> list[dict]:
+        """Build the chat messages list sent to the API.
+
+        The system prompt always comes first and prior turns come before the
+        new user prompt, so static content forms a stable prefix that the
+        provider can reuse across turns (prompt caching).
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            history: Optional prior turns as dicts with 'role' and 'content'
+
+        Returns:
+            List of message dicts
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        if history:
+            messages.extend(
+                {"role": m["role"], "content": m["content"]} for m in history
+            )
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _sanitize_history(self, history: list[dict]) -> list[dict]:
+        """Sanitize user turns in prior conversation history (ML-P1-1).
+
+        Args:
+            history: Prior turns as dicts with 'role' and 'content'
+
+        Returns:
+            History with user-authored content sanitized
+        """
+        return [
+            {"role": m["role"], "content": self._sanitize_user_prompt(m["content"])}
+            if m["role"] == "user"
+            else m
+            for m in history
+        ]
+
     def _sanitize_user_prompt(
         self,
         prompt: str,
@@ -570,6 +628,7 @@ class LLMClient:
         validate_size: bool = True,
         user_id: str | None = None,
         sanitize_input: bool = True,
+        history: list[dict] | None = None,
     ) -> str:
         """Generate a completion (non-streaming) with retry logic and model fallback.
 
@@ -582,6 +641,8 @@ class LLMClient:
             validate_size: Whether to validate prompt size before sending
             user_id: User ID for per-user rate limiting (SEC-009)
             sanitize_input: Whether to sanitize prompt for injection attacks (ML-P1-1)
+            history: Optional prior turns sent as chat messages between the
+                system prompt and the user prompt
 
         Returns:
             The generated text with thinking tags stripped
@@ -598,10 +659,12 @@ class LLMClient:
         # Sanitize prompt for injection attempts (ML-P1-1)
         if sanitize_input:
             prompt = self._sanitize_user_prompt(prompt)
+            if history:
+                history = self._sanitize_history(history)
 
         # Validate prompt size before making API call (ML-P1-3)
         if validate_size:
-            self._validate_prompt_size(prompt, system_prompt)
+            self._validate_prompt_size(prompt, system_prompt, history=history)
 
         # Get per-user rate limiter (SEC-009)
         rate_limiter = await self._get_rate_limiter(user_id)
@@ -610,10 +673,7 @@ class LLMClient:
             remaining, retry_after = await rate_limiter.get_remaining()
             raise RateLimitExceededError(user_id or "anonymous", retry_after)
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_prompt, history)
 
         # Try primary model first
         try:
@@ -669,6 +729,7 @@ class LLMClient:
         validate_size: bool = True,
         user_id: str | None = None,
         sanitize_input: bool = True,
+        history: list[dict] | None = None,
     ) -> AsyncIterator[str]:
         """Generate a streaming completion with retry logic.
 
@@ -681,6 +742,8 @@ class LLMClient:
             validate_size: Whether to validate prompt size before sending
             user_id: User ID for per-user rate limiting (SEC-009)
             sanitize_input: Whether to sanitize prompt for injection attacks (ML-P1-1)
+            history: Optional prior turns sent as chat messages between the
+                system prompt and the user prompt
 
         Yields:
             Generated text chunks with thinking tags stripped
@@ -697,10 +760,12 @@ class LLMClient:
         # Sanitize prompt for injection attempts (ML-P1-1)
         if sanitize_input:
             prompt = self._sanitize_user_prompt(prompt)
+            if history:
+                history = self._sanitize_history(history)
 
         # Validate prompt size before making API call (ML-P1-3)
         if validate_size:
-            self._validate_prompt_size(prompt, system_prompt)
+            self._validate_prompt_size(prompt, system_prompt, history=history)
 
         # Get per-user rate limiter (SEC-009)
         rate_limiter = await self._get_rate_limiter(user_id)
@@ -709,10 +774,7 @@ class LLMClient:
             remaining, retry_after = await rate_limiter.get_remaining()
             raise RateLimitExceededError(user_id or "anonymous", retry_after)
 
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_prompt, history)
 
         last_error: Exception | None = None
 
@@ -227,6 +227,18 @@ class MessageQueueManager:
         queue = await self.get_queue(session_id)
         return await queue.add_message(db, role, content, extracted_entities)
 
+    def get_pending_messages(self, session_id: str) -> list[QueuedMessage]:
+        """Get a snapshot of a session's messages that are not yet flushed.
+
+        Args:
+            session_id: Capture session ID
+
+        Returns:
+            Queued messages in the order they were added
+        """
+        queue = self._queues.get(session_id)
+        return list(queue.messages) if queue else []
+
     async def flush_session(self, db: AsyncSession, session_id: str):
         """Flush all pending messages for a session.
 
@@ -0,0 +1,178 @@
+"""Semantic cache for LLM responses with Redis.
+
+The exact-match LLM cache (KG-P0-2) only helps when the input text is
+byte-identical. Interview syntheses for similar sessions are usually only
+near-duplicates, so this cache embeds the input and reuses a cached response
+when the cosine similarity with a previous input exceeds a threshold.
+
+Features:
+- Off by default (semantic_cache_enabled); callers must verify that a hit
+  fits the current input before using it
+- User-scoped entries for multi-tenant isolation
+- Keys include the caller's prompt version so prompt changes invalidate entries
+- Uses the shared Redis connection pool from db.redis
+- Bounded per-user entry list (most recent first) with configurable TTL
+- Long inputs are never cached to avoid false positives
+- Graceful degradation when Redis or the embedding API is unavailable
+"""
+
+import json
+from typing import Any
+
+from config import get_settings
+from db.redis import get_redis
+from services.embeddings import get_embedding_service
+from utils.logging import get_logger
+from utils.vectors import best_cosine_match
+
+logger = get_logger(__name__)
+
+
+class SemanticCache:
+    """Redis-backed similarity cache for LLM responses.
+
+    Cache key format: semcache:{prompt_version}:{kind}:{user_id}
+
+    Each key holds a list of {"embedding": [...], "response": ...} entries,
+    newest first, trimmed to semantic_cache_max_entries. Lookups compare the
+    query embedding against every entry in the user's list.
+
+    Callers embed the input once with embed() and pass the vector to both
+    get() and set(); embed() returns None whenever the cache would not be
+    used, so a None embedding skips the cache entirely.
+    """
+
+    def __init__(self):
+        self._settings = get_settings()
+
+    @property
+    def _enabled(self) -> bool:
+        return self._settings.semantic_cache_enabled
+
+    def _get_redis(self):
+        """Get the shared Redis client (None if Redis is not initialized)."""
+        return get_redis()
+
+    def _get_cache_key(self, kind: str, prompt_version: str, user_id: str) -> str:
+        """Generate the cache key holding a user's entries for a response kind.
+
+        Format: semcache:{prompt_version}:{kind}:{user_id}
+        """
+        return f"semcache:{prompt_version}:{kind}:{user_id}"
+
+    def _is_cacheable(self, text: str) -> bool:
+        """Check whether text is short enough to match reliably."""
+        max_length = self._settings.semantic_cache_max_text_length
+        return bool(text) and len(text) <= max_length
+
+    async def embed(self, text: str) -> list[float] | None:
+        """Embed text for a cache lookup.
+
+        Args:
+            text: The LLM input text (e.g. the formatted conversation)
+
+        Returns:
+            The embedding, or None if the cache is disabled, the text is not
+            cacheable or the embedding service fails
+        """
+        if not self._enabled or not self._is_cacheable(text):
+            return None
+        try:
+            return await get_embedding_service().embed_text(text, input_type="query")
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None
+
+    async def get(
+        self,
+        embedding: list[float],
+        kind: str,
+        prompt_version: str,
+        user_id: str,
+    ) -> Any | None:
+        """Get a cached response for an input similar to a previous one.
+
+        Args:
+            embedding: Embedding of the LLM input, from embed()
+            kind: Response kind, e.g. "synthesis"
+            prompt_version: Version of the prompt that produced the responses
+            user_id: Owner of the cache entries
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        redis_client = self._get_redis()
+        if redis_client is None:
+            return None
+
+        try:
+            cache_key = self._get_cache_key(kind, prompt_version, user_id)
+            raw_entries = await redis_client.lrange(
+                cache_key, 0, self._settings.semantic_cache_max_entries - 1
+            )
+            if not raw_entries:
+                return None
+
+            entries = [json.loads(raw) for raw in raw_entries]
+            match = best_cosine_match(
+                embedding,
+                (entry.get("embedding") for entry in entries),
+                threshold=self._settings.semantic_cache_threshold,
+            )
+            if match is not None:
+                index, similarity = match
+                logger.debug(
+                    f"Semantic cache hit for {kind} (similarity={similarity:.3f})"
+                )
+                return entries[index].get("response")
+        except Exception as e:
+            logger.warning(f"Semantic cache read error: {e}")
+
+        return None
+
+    async def set(
+        self,
+        embedding: list[float],
+        kind: str,
+        prompt_version: str,
+        user_id: str,
+        response: Any,
+    ) -> None:
+        """Cache a response for an input.
+
+        Args:
+            embedding: Embedding of the LLM input, from embed()
+            kind: Response kind, e.g. "synthesis"
+            prompt_version: Version of the prompt that produced the response
+            user_id: Owner of the cache entry
+            response: JSON-serializable response to cache
+        """
+        redis_client = self._get_redis()
+        if redis_client is None:
+            return
+
+        try:
+            cache_key = self._get_cache_key(kind, prompt_version, user_id)
+            entry = json.dumps({"embedding": embedding, "response": response})
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.lpush(cache_key, entry)
+                pipe.ltrim(
+                    cache_key, 0, self._settings.semantic_cache_max_entries - 1
+                )
+                pipe.expire(cache_key, self._settings.llm_cache_ttl)
+                await pipe.execute()
+            logger.debug(f"Semantic cache set for {kind}")
+        except Exception as e:
+            logger.warning(f"Semantic cache write error: {e}")
+
+
+# Singleton instance
+_semantic_cache: SemanticCache | None = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get the semantic cache singleton."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache()
+    return _semantic_cache
@@ -155,9 +155,7 @@ class TestIngestWorkflow:
                 return_value=mock_embedding_service,
             ),
             patch("services.extractor.get_settings", return_value=mock_settings),
-            patch(
-                "services.extractor.get_neo4j_session", return_value=mock_neo4j_session
-            ),
+            patch("db.neo4j._open_session", return_value=mock_neo4j_session),
             patch("services.entity_resolver.get_settings", return_value=mock_settings),
         ):
             from services.extractor import DecisionExtractor
@@ -324,27 +322,15 @@ class TestCaptureSessionWorkflow:
         mock_session_obj.id = session_id
         mock_session_obj.status = SessionStatus.ACTIVE
         mock_session_obj.user_id = user_id
+        mock_session_obj.messages = []
 
-        # Configure mock to return session
+        # Configure mock to return session (messages are eagerly loaded)
         mock_session_result = MagicMock()
+        mock_session_result.unique = MagicMock(return_value=mock_session_result)
         mock_session_result.scalar_one_or_none = MagicMock(
             return_value=mock_session_obj
         )
-
-        mock_messages_result = MagicMock()
-        mock_messages_result.scalars = MagicMock(
-            return_value=MagicMock(all=MagicMock(return_value=[]))
-        )
-
-        call_count = [0]
-
-        async def mock_execute(query):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_session_result
-            return mock_messages_result
-
-        mock_postgres_session.execute = mock_execute
+        mock_postgres_session.execute = AsyncMock(return_value=mock_session_result)
 
         # Mock AI response
         mock_ai_message = MagicMock()
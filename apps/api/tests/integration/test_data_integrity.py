@@ -10,8 +10,9 @@ This test suite verifies data integrity across the application:
 - Embedding dimension correctness
 """
 
+import json
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -31,7 +32,7 @@ def mock_neo4j_session():
 
 
 def create_async_result_mock(records):
-    """Create a mock Neo4j result that works as an async iterator."""
+    """Create a mock Neo4j result that supports async iteration and data()."""
     result = MagicMock()
 
     async def async_iter():
@@ -39,6 +40,7 @@ def create_async_result_mock(records):
             yield r
 
     result.__aiter__ = lambda self: async_iter()
+    result.data = AsyncMock(return_value=list(records))
     result.single = AsyncMock(return_value=records[0] if records else None)
     return result
 
@@ -87,17 +89,14 @@ class TestDecisionEntityRelationshipConsistency:
         )
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import get_decision
+        from routers.decisions import get_decision
 
-            result = await get_decision(decision_id, user_id="test-user")
+        result = await get_decision(
+            decision_id, user_id="test-user", session=mock_neo4j_session
+        )
 
-            assert len(result.entities) == 3
-            assert result.entities[0].name == "PostgreSQL"
+        assert len(result.entities) == 3
+        assert result.entities[0].name == "PostgreSQL"
 
     @pytest.mark.asyncio
     async def test_decision_with_empty_entities_list(self, mock_neo4j_session):
@@ -114,17 +113,14 @@ class TestDecisionEntityRelationshipConsistency:
         )
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import get_decision
+        from routers.decisions import get_decision
 
-            result = await get_decision(decision_id, user_id="test-user")
+        result = await get_decision(
+            decision_id, user_id="test-user", session=mock_neo4j_session
+        )
 
-            assert result.entities == []
-            assert result.trigger == "Test trigger"
+        assert result.entities == []
+        assert result.trigger == "Test trigger"
 
     @pytest.mark.asyncio
     async def test_entity_link_requires_both_exist(self, mock_neo4j_session):
@@ -134,26 +130,21 @@ class TestDecisionEntityRelationshipConsistency:
         mock_result.single = AsyncMock(return_value={"exists": False})
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from models.schemas import LinkEntityRequest
-            from routers.entities import link_entity
+        from models.schemas import LinkEntityRequest
+        from routers.entities import link_entity
 
-            request = LinkEntityRequest(
-                decision_id=str(uuid4()),
-                entity_id=str(uuid4()),
-                relationship="INVOLVES",
-            )
+        request = LinkEntityRequest(
+            decision_id=str(uuid4()),
+            entity_id=str(uuid4()),
+            relationship="INVOLVES",
+        )
 
-            with pytest.raises(HTTPException) as exc_info:
-                await link_entity(request, user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await link_entity(request, user_id="test-user", session=mock_neo4j_session)
 
-            assert exc_info.value.status_code == 404
+        assert exc_info.value.status_code == 404
 
 
 # ============================================================================
@@ -201,19 +192,16 @@ class TestDuplicateEntityDetection:
         mock_result.single = AsyncMock(return_value=existing_entity)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from models.schemas import Entity
-            from routers.entities import create_entity
+        from models.schemas import Entity
+        from routers.entities import create_entity
 
-            entity = Entity(name="PostgreSQL", type="technology")
-            result = await create_entity(entity, user_id="test-user")
+        entity = Entity(name="PostgreSQL", type="technology")
+        result = await create_entity(
+            entity, user_id="test-user", session=mock_neo4j_session
+        )
 
-            # Should return existing entity, not create duplicate
-            assert result.id == "existing-id"
+        # Should return existing entity, not create duplicate
+        assert result.id == "existing-id"
 
     @pytest.mark.asyncio
     async def test_new_entity_created_when_no_duplicate(self, mock_neo4j_session):
@@ -224,20 +212,17 @@ class TestDuplicateEntityDetection:
 
         mock_neo4j_session.run = AsyncMock(return_value=mock_no_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from models.schemas import Entity
-            from routers.entities import create_entity
+        from models.schemas import Entity
+        from routers.entities import create_entity
 
-            entity = Entity(name="NewTech", type="technology")
-            result = await create_entity(entity, user_id="test-user")
+        entity = Entity(name="NewTech", type="technology")
+        result = await create_entity(
+            entity, user_id="test-user", session=mock_neo4j_session
+        )
 
-            # Should create new entity with a new ID
-            assert result.name == "NewTech"
-            assert result.id is not None
+        # Should create new entity with a new ID
+        assert result.name == "NewTech"
+        assert result.id is not None
 
 
 # ============================================================================
@@ -256,20 +241,17 @@ class TestUserIsolation:
         mock_result.single = AsyncMock(return_value=None)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from routers.decisions import get_decision
+        from routers.decisions import get_decision
 
-            # Try to access user A's decision as user B
-            with pytest.raises(HTTPException) as exc_info:
-                await get_decision("user-a-decision-id", user_id="user-b")
+        # Try to access user A's decision as user B
+        with pytest.raises(HTTPException) as exc_info:
+            await get_decision(
+                "user-a-decision-id", user_id="user-b", session=mock_neo4j_session
+            )
 
-            assert exc_info.value.status_code == 404
+        assert exc_info.value.status_code == 404
 
     @pytest.mark.asyncio
     async def test_user_decisions_query_includes_user_id(self, mock_neo4j_session):
@@ -285,19 +267,16 @@ class TestUserIsolation:
         mock_result = create_async_result_mock(user_decisions)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import get_decisions
+        from routers.decisions import get_decisions
 
-            results = await get_decisions(limit=50, offset=0, user_id="current-user")
+        response = await get_decisions(
+            limit=50, offset=0, user_id="current-user", session=mock_neo4j_session
+        )
 
-            assert len(results) == 1
-            # Verify query included user_id filter
-            call_args = mock_neo4j_session.run.call_args
-            assert "user_id" in call_args.kwargs
+        assert len(json.loads(response.body)) == 1
+        # Verify query included user_id filter
+        call_args = mock_neo4j_session.run.call_args
+        assert "user_id" in call_args.kwargs
 
     @pytest.mark.asyncio
     async def test_user_cannot_delete_other_user_decision(self, mock_neo4j_session):
@@ -307,20 +286,19 @@ class TestUserIsolation:
         mock_result.single = AsyncMock(return_value=None)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from routers.decisions import delete_decision
+        from routers.decisions import delete_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await delete_decision("other-user-decision", user_id="attacker-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_decision(
+                "other-user-decision",
+                user_id="attacker-user",
+                session=mock_neo4j_session,
+            )
 
-            # Returns 404 to prevent enumeration attacks
-            assert exc_info.value.status_code == 404
+        # Returns 404 to prevent enumeration attacks
+        assert exc_info.value.status_code == 404
 
     @pytest.mark.asyncio
     async def test_user_entities_scoped_to_decisions(self, mock_neo4j_session):
@@ -332,18 +310,15 @@ class TestUserIsolation:
         mock_result = create_async_result_mock(user_entities)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.entities import get_all_entities
+        from routers.entities import get_all_entities
 
-            _results = await get_all_entities(user_id="current-user")
+        _results = await get_all_entities(
+            user_id="current-user", session=mock_neo4j_session
+        )
 
-            # Verify query filters by user_id
-            call_args = mock_neo4j_session.run.call_args
-            assert "user_id" in call_args.kwargs
+        # Verify query filters by user_id
+        call_args = mock_neo4j_session.run.call_args
+        assert "user_id" in call_args.kwargs
 
 
 # ============================================================================
@@ -359,36 +334,29 @@ class TestCascadingDeleteBehavior:
         """Deleting a decision should preserve linked entities."""
         decision_id = str(uuid4())
 
-        # Mock: decision exists
-        mock_exists_result = AsyncMock()
-        mock_exists_result.single = AsyncMock(return_value={"d": {"id": decision_id}})
-
-        # Mock: delete succeeds
+        # Mock: the decision exists and is deleted
         mock_delete_result = AsyncMock()
-        mock_delete_result.single = AsyncMock(return_value=None)
+        mock_delete_result.single = AsyncMock(return_value={"deleted": 1})
 
-        call_count = [0]
+        queries = []
 
         async def mock_run(query, **params):
-            call_count[0] += 1
-            if "DETACH DELETE" in query:
-                return mock_delete_result
-            return mock_exists_result
+            queries.append(query)
+            return mock_delete_result
 
         mock_neo4j_session.run = mock_run
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import delete_decision
+        from routers.decisions import delete_decision
 
-            result = await delete_decision(decision_id, user_id="test-user")
+        result = await delete_decision(
+            decision_id, user_id="test-user", session=mock_neo4j_session
+        )
 
-            assert result["status"] == "deleted"
-            # DETACH DELETE removes relationships but not the entity nodes
-            # This is verified by the Cypher query using DETACH DELETE on decision only
+        assert result["status"] == "deleted"
+        # DETACH DELETE removes relationships but not the entity nodes
+        assert len(queries) == 1
+        assert "DETACH DELETE d" in queries[0]
+        assert "DELETE e" not in queries[0]
 
     @pytest.mark.asyncio
     async def test_force_delete_entity_removes_all_relationships(
@@ -397,47 +365,27 @@ class TestCascadingDeleteBehavior:
         """Force deleting entity should remove all relationships."""
         entity_id = str(uuid4())
 
-        # Mock entity accessible
-        mock_accessible_result = AsyncMock()
-        mock_accessible_result.single = AsyncMock(return_value={"e": {"id": entity_id}})
-
-        # Mock no other users
-        mock_no_other_users = AsyncMock()
-        mock_no_other_users.single = AsyncMock(return_value={"other_user_count": 0})
-
-        # Mock has relationships
-        mock_has_rels = AsyncMock()
-        mock_has_rels.single = AsyncMock(return_value={"rel_count": 0})
-
-        # Mock delete
-        mock_delete = AsyncMock()
-        mock_delete.single = AsyncMock(return_value=None)
-
-        call_count = [0]
-
-        async def mock_run(query, **params):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_accessible_result
-            elif call_count[0] == 2:
-                return mock_no_other_users
-            elif call_count[0] == 3:
-                return mock_has_rels
-            else:
-                return mock_delete
-
-        mock_neo4j_session.run = mock_run
+        # Mock entity accessible to the user only, with relationships
+        mock_result = AsyncMock()
+        mock_result.single = AsyncMock(
+            return_value={
+                "entity": {"name": "Tech", "aliases": None},
+                "rel_count": 2,
+                "other_user_count": 0,
+            }
+        )
+        mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.entities import delete_entity
+        from routers.entities import delete_entity
 
-            result = await delete_entity(entity_id, force=True, user_id="test-user")
+        result = await delete_entity(
+            entity_id, force=True, user_id="test-user", session=mock_neo4j_session
+        )
 
-            assert result["status"] == "deleted"
+        assert result["status"] == "deleted"
+        # DETACH DELETE runs in the same query as the access checks
+        query = mock_neo4j_session.run.call_args[0][0]
+        assert "DETACH DELETE e" in query
 
 
 # ============================================================================
@@ -463,17 +411,14 @@ class TestTimestampValidation:
         )
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import get_decision
+        from routers.decisions import get_decision
 
-            result = await get_decision(decision_id, user_id="test-user")
+        result = await get_decision(
+            decision_id, user_id="test-user", session=mock_neo4j_session
+        )
 
-            # Verify created_at is valid datetime (Pydantic coerces from string)
-            assert result.created_at is not None
+        # Verify created_at is valid datetime (Pydantic coerces from string)
+        assert result.created_at is not None
 
     def test_new_decision_schema_works(self):
         """New decisions should be creatable with required fields."""
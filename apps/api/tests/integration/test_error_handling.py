@@ -59,58 +59,41 @@ class TestBadRequest:
         mock_result.single = AsyncMock(return_value=None)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import get_decision
+        from routers.decisions import get_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_decision("invalid-not-uuid", user_id="test-user")
-            # Returns 404 because no record found
-            assert exc_info.value.status_code == 404
+        with pytest.raises(HTTPException) as exc_info:
+            await get_decision(
+                "invalid-not-uuid", user_id="test-user", session=mock_neo4j_session
+            )
+        # Returns 404 because no record found
+        assert exc_info.value.status_code == 404
 
     @pytest.mark.asyncio
     async def test_entity_delete_with_relationships(self, mock_neo4j_session):
         """Should return 400 when deleting entity with relationships."""
-        # Mock entity exists and is accessible
-        mock_entity_result = AsyncMock()
-        mock_entity_result.single = AsyncMock(return_value={"e": {"id": "test-id"}})
-
-        # Mock no other users have access
-        mock_other_users_result = AsyncMock()
-        mock_other_users_result.single = AsyncMock(return_value={"other_user_count": 0})
-
-        # Mock entity has relationships
-        mock_rel_result = AsyncMock()
-        mock_rel_result.single = AsyncMock(return_value={"rel_count": 5})
-
-        call_count = [0]
-
-        async def mock_run(query, **params):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_entity_result
-            elif call_count[0] == 2:
-                return mock_other_users_result
-            else:
-                return mock_rel_result
-
-        mock_neo4j_session.run = mock_run
-
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.entities import delete_entity
+        # Mock entity accessible to the user only, with relationships
+        mock_result = AsyncMock()
+        mock_result.single = AsyncMock(
+            return_value={
+                "entity": {"name": "Tech", "aliases": None},
+                "rel_count": 5,
+                "other_user_count": 0,
+            }
+        )
+        mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-            with pytest.raises(HTTPException) as exc_info:
-                await delete_entity("test-entity-id", force=False, user_id="test-user")
+        from routers.entities import delete_entity
 
-            assert exc_info.value.status_code == 400
-            assert "relationships" in exc_info.value.detail.lower()
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_entity(
+                "test-entity-id",
+                force=False,
+                user_id="test-user",
+                session=mock_neo4j_session,
+            )
+
+        assert exc_info.value.status_code == 400
+        assert "relationships" in exc_info.value.detail.lower()
 
 
 # ============================================================================
@@ -165,39 +148,29 @@ class TestForbidden:
     @pytest.mark.asyncio
     async def test_entity_delete_shared_with_other_users(self, mock_neo4j_session):
         """Should return 403 when deleting entity shared with other users."""
-        # Mock entity exists and is accessible
-        mock_entity_result = AsyncMock()
-        mock_entity_result.single = AsyncMock(
-            return_value={"e": {"id": "shared-entity"}}
+        # Mock entity accessible, but also linked to other users' decisions
+        mock_result = AsyncMock()
+        mock_result.single = AsyncMock(
+            return_value={
+                "entity": {"name": "Shared", "aliases": None},
+                "rel_count": 1,
+                "other_user_count": 3,
+            }
         )
+        mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        # Mock other users have access
-        mock_other_users_result = AsyncMock()
-        mock_other_users_result.single = AsyncMock(return_value={"other_user_count": 3})
-
-        call_count = [0]
-
-        async def mock_run(query, **params):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_entity_result
-            else:
-                return mock_other_users_result
-
-        mock_neo4j_session.run = mock_run
-
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.entities import delete_entity
+        from routers.entities import delete_entity
 
-            with pytest.raises(HTTPException) as exc_info:
-                await delete_entity("shared-entity", force=True, user_id="user-a")
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_entity(
+                "shared-entity",
+                force=True,
+                user_id="user-a",
+                session=mock_neo4j_session,
+            )
 
-            assert exc_info.value.status_code == 403
-            assert "other users" in exc_info.value.detail.lower()
+        assert exc_info.value.status_code == 403
+        assert "other users" in exc_info.value.detail.lower()
 
 
 # ============================================================================
@@ -215,18 +188,15 @@ class TestNotFound:
         mock_result.single = AsyncMock(return_value=None)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import get_decision
+        from routers.decisions import get_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_decision(str(uuid4()), user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_decision(
+                str(uuid4()), user_id="test-user", session=mock_neo4j_session
+            )
 
-            assert exc_info.value.status_code == 404
-            assert exc_info.value.detail == "Decision not found"
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Decision not found"
 
     @pytest.mark.asyncio
     async def test_entity_not_found(self, mock_neo4j_session):
@@ -235,18 +205,15 @@ class TestNotFound:
         mock_result.single = AsyncMock(return_value=None)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.entities import get_entity
+        from routers.entities import get_entity
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_entity(str(uuid4()), user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_entity(
+                str(uuid4()), user_id="test-user", session=mock_neo4j_session
+            )
 
-            assert exc_info.value.status_code == 404
-            assert exc_info.value.detail == "Entity not found"
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Entity not found"
 
     @pytest.mark.asyncio
     async def test_delete_nonexistent_decision(self, mock_neo4j_session):
@@ -255,17 +222,14 @@ class TestNotFound:
         mock_result.single = AsyncMock(return_value=None)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import delete_decision
+        from routers.decisions import delete_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await delete_decision(str(uuid4()), user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_decision(
+                str(uuid4()), user_id="test-user", session=mock_neo4j_session
+            )
 
-            assert exc_info.value.status_code == 404
+        assert exc_info.value.status_code == 404
 
     @pytest.mark.asyncio
     async def test_link_entity_nonexistent_decision(self, mock_neo4j_session):
@@ -274,24 +238,19 @@ class TestNotFound:
         mock_result.single = AsyncMock(return_value={"exists": False})
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from models.schemas import LinkEntityRequest
-            from routers.entities import link_entity
+        from models.schemas import LinkEntityRequest
+        from routers.entities import link_entity
 
-            request = LinkEntityRequest(
-                decision_id=str(uuid4()),
-                entity_id=str(uuid4()),
-                relationship="INVOLVES",
-            )
+        request = LinkEntityRequest(
+            decision_id=str(uuid4()),
+            entity_id=str(uuid4()),
+            relationship="INVOLVES",
+        )
 
-            with pytest.raises(HTTPException) as exc_info:
-                await link_entity(request, user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await link_entity(request, user_id="test-user", session=mock_neo4j_session)
 
-            assert exc_info.value.status_code == 404
+        assert exc_info.value.status_code == 404
 
 
 # ============================================================================
@@ -360,18 +319,15 @@ class TestInternalServerError:
         """Should return 500 for database query errors."""
         mock_neo4j_session.run = AsyncMock(side_effect=DatabaseError("Query failed"))
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import get_decisions
+        from routers.decisions import get_decisions
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_decisions(limit=50, offset=0, user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_decisions(
+                limit=50, offset=0, user_id="test-user", session=mock_neo4j_session
+            )
 
-            assert exc_info.value.status_code == 500
-            assert "failed to fetch" in exc_info.value.detail.lower()
+        assert exc_info.value.status_code == 500
+        assert "failed to fetch" in exc_info.value.detail.lower()
 
     @pytest.mark.asyncio
     async def test_client_error_returns_500(self, mock_neo4j_session):
@@ -380,17 +336,12 @@ class TestInternalServerError:
             side_effect=ClientError("Invalid Cypher syntax")
         )
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.entities import get_all_entities
+        from routers.entities import get_all_entities
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_all_entities(user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_all_entities(user_id="test-user", session=mock_neo4j_session)
 
-            assert exc_info.value.status_code == 500
+        assert exc_info.value.status_code == 500
 
 
 # ============================================================================
@@ -408,18 +359,15 @@ class TestServiceUnavailable:
             side_effect=DriverError("Connection refused")
         )
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import get_decisions
+        from routers.decisions import get_decisions
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_decisions(limit=50, offset=0, user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_decisions(
+                limit=50, offset=0, user_id="test-user", session=mock_neo4j_session
+            )
 
-            assert exc_info.value.status_code == 503
-            assert "database unavailable" in exc_info.value.detail.lower()
+        assert exc_info.value.status_code == 503
+        assert "database unavailable" in exc_info.value.detail.lower()
 
     @pytest.mark.asyncio
     async def test_entity_fetch_connection_failure(self, mock_neo4j_session):
@@ -428,17 +376,12 @@ class TestServiceUnavailable:
             side_effect=DriverError("Connection timeout")
         )
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.entities import get_all_entities
+        from routers.entities import get_all_entities
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_all_entities(user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_all_entities(user_id="test-user", session=mock_neo4j_session)
 
-            assert exc_info.value.status_code == 503
+        assert exc_info.value.status_code == 503
 
 
 # ============================================================================
@@ -467,19 +410,16 @@ class TestErrorResponseSchema:
         mock_result.single = AsyncMock(return_value=None)
         mock_neo4j_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_neo4j_session,
-        ):
-            from routers.decisions import get_decision
+        from routers.decisions import get_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_decision(str(uuid4()), user_id="test-user")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_decision(
+                str(uuid4()), user_id="test-user", session=mock_neo4j_session
+            )
 
-            assert exc_info.value.detail is not None
-            assert isinstance(exc_info.value.detail, str)
-            assert len(exc_info.value.detail) > 0
+        assert exc_info.value.detail is not None
+        assert isinstance(exc_info.value.detail, str)
+        assert len(exc_info.value.detail) > 0
 
 
 # ============================================================================
@@ -496,20 +496,17 @@ class TestDecisionEdit:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from models.schemas import DecisionUpdate
-            from routers.decisions import update_decision
+        from models.schemas import DecisionUpdate
+        from routers.decisions import update_decision
 
-            update_data = DecisionUpdate(trigger="Updated trigger")
-            await update_decision(decision_id, update_data, user_id="test-user")
+        update_data = DecisionUpdate(trigger="Updated trigger")
+        await update_decision(
+            decision_id, update_data, user_id="test-user", session=mock_session
+        )
 
-            assert update_query_captured[0] is not None
-            assert "edited_at" in update_query_captured[0]
-            assert "edit_count" in update_query_captured[0]
+        assert update_query_captured[0] is not None
+        assert "edited_at" in update_query_captured[0]
+        assert "edit_count" in update_query_captured[0]
 
     @pytest.mark.asyncio
     async def test_update_increments_edit_count(self):
@@ -566,19 +563,14 @@ class TestDecisionEdit:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from models.schemas import DecisionUpdate
-            from routers.decisions import update_decision
+        from models.schemas import DecisionUpdate
+        from routers.decisions import update_decision
 
-            update_data = DecisionUpdate(trigger="New trigger")
-            result = await update_decision(
-                decision_id, update_data, user_id="test-user"
-            )
-            assert result.trigger == "New trigger"
+        update_data = DecisionUpdate(trigger="New trigger")
+        result = await update_decision(
+            decision_id, update_data, user_id="test-user", session=mock_session
+        )
+        assert result.trigger == "New trigger"
 
     @pytest.mark.asyncio
     async def test_update_requires_at_least_one_field(self):
@@ -592,23 +584,18 @@ class TestDecisionEdit:
         mock_result.single = AsyncMock(return_value=original_data)
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from models.schemas import DecisionUpdate
-            from routers.decisions import update_decision
+        from models.schemas import DecisionUpdate
+        from routers.decisions import update_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await update_decision(
-                    decision_id, DecisionUpdate(), user_id="test-user"
-                )
+        with pytest.raises(HTTPException) as exc_info:
+            await update_decision(
+                decision_id, DecisionUpdate(), user_id="test-user", session=mock_session
+            )
 
-            assert exc_info.value.status_code == 400
-            assert "No fields to update" in exc_info.value.detail
+        assert exc_info.value.status_code == 400
+        assert "No fields to update" in exc_info.value.detail
 
 
 # ============================================================================
@@ -975,6 +962,52 @@ class TestSimilarDecisions:
             assert result.similarity >= 0.5
             assert hasattr(result, "shared_entities")
 
+    @pytest.mark.asyncio
+    async def test_similar_decisions_rescans_when_ann_page_is_short(self):
+        """Should rescan in user scope when other tenants fill the ANN page."""
+        mock_session = create_neo4j_session_mock()
+        own_decision = {
+            "id": str(uuid4()),
+            "trigger": "Own decision",
+            "decision": "PostgreSQL",
+            "similarity": 0.7,
+            "shared_entities": [],
+        }
+        queries = []
+
+        async def mock_run(query, **params):
+            queries.append(query)
+            if len(queries) == 1:
+                result = MagicMock()
+                result.single = AsyncMock(
+                    return_value={"embedding": [0.1] * 8, "trigger": "Source"}
+                )
+                return result
+            if "queryNodes" in query:
+                # Every ANN candidate belonged to another user
+                return create_async_result_mock([])
+            return create_async_result_mock([own_decision])
+
+        mock_session.run = mock_run
+
+        with patch(
+            "routers.graph.get_neo4j_session",
+            new_callable=AsyncMock,
+            return_value=mock_session,
+        ):
+            from routers.graph import get_similar_nodes
+
+            results = await get_similar_nodes(
+                node_id=str(uuid4()),
+                top_k=5,
+                threshold=0.5,
+                user_id="test-user",
+            )
+
+        assert [r.id for r in results] == [own_decision["id"]]
+        assert "queryNodes" in queries[1]
+        assert "gds.similarity.cosine" in queries[2]
+
     @pytest.mark.asyncio
     async def test_similar_decisions_not_found(self):
         """Should return 404 when decision not found."""
@@ -16,15 +16,7 @@ class TestStartCaptureSession:
         session = AsyncMock()
         session.add = MagicMock()
         session.commit = AsyncMock()
-
-        # Mock refresh to set timestamp fields
-        async def mock_refresh(obj):
-            if not hasattr(obj, "created_at") or obj.created_at is None:
-                obj.created_at = datetime.now(UTC)
-            if not hasattr(obj, "updated_at") or obj.updated_at is None:
-                obj.updated_at = datetime.now(UTC)
-
-        session.refresh = mock_refresh
+        session.refresh = AsyncMock()
         return session
 
     @pytest.mark.asyncio
@@ -39,7 +31,9 @@ class TestStartCaptureSession:
 
             assert result.id is not None
             assert result.status == "active"
+            assert result.created_at == result.updated_at
             mock_db_session.add.assert_called_once()
+            mock_db_session.refresh.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_start_session_uses_anonymous_user(self, mock_db_session):
@@ -75,28 +69,14 @@ class TestGetCaptureSession:
         mock_session_obj.status.value = "active"
         mock_session_obj.created_at = datetime.now(UTC)
         mock_session_obj.updated_at = datetime.now(UTC)
+        mock_session_obj.messages = []
 
+        # Session and messages are loaded in a single query
         mock_result = MagicMock()
+        mock_result.unique = MagicMock(return_value=mock_result)
         mock_result.scalar_one_or_none = MagicMock(return_value=mock_session_obj)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
 
-        # Mock messages query
-        mock_messages_result = MagicMock()
-        mock_messages_result.scalars = MagicMock(
-            return_value=MagicMock(all=MagicMock(return_value=[]))
-        )
-
-        call_count = [0]
-
-        async def mock_execute(query):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_result
-            else:
-                return mock_messages_result
-
-        mock_db_session.execute = mock_execute
-
         with patch("routers.capture.get_db", return_value=mock_db_session):
             from routers.capture import get_capture_session
 
@@ -104,11 +84,49 @@ class TestGetCaptureSession:
 
             assert result.id == session_id
             assert result.status == "active"
+            mock_db_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_session_builds_stored_messages(self, mock_db_session):
+        """Should return stored messages with their extracted entities."""
+        session_id = str(uuid4())
+
+        mock_message = MagicMock()
+        mock_message.id = str(uuid4())
+        mock_message.role = "assistant"
+        mock_message.content = "Why PostgreSQL?"
+        mock_message.timestamp = datetime.now(UTC)
+        mock_message.extracted_entities = [
+            {"id": None, "name": "PostgreSQL", "type": "technology"}
+        ]
+
+        mock_session_obj = MagicMock()
+        mock_session_obj.id = session_id
+        mock_session_obj.status.value = "active"
+        mock_session_obj.created_at = datetime.now(UTC)
+        mock_session_obj.updated_at = datetime.now(UTC)
+        mock_session_obj.messages = [mock_message]
+
+        mock_result = MagicMock()
+        mock_result.unique = MagicMock(return_value=mock_result)
+        mock_result.scalar_one_or_none = MagicMock(return_value=mock_session_obj)
+        mock_db_session.execute = AsyncMock(return_value=mock_result)
+
+        from routers.capture import get_capture_session
+
+        result = await get_capture_session(session_id, db=mock_db_session)
+
+        assert len(result.messages) == 1
+        message = result.messages[0]
+        assert message.content == "Why PostgreSQL?"
+        assert message.extracted_entities[0].name == "PostgreSQL"
+        assert message.extracted_entities[0].type == "technology"
 
     @pytest.mark.asyncio
     async def test_get_session_not_found(self, mock_db_session):
         """Should raise 404 when session not found."""
         mock_result = MagicMock()
+        mock_result.unique = MagicMock(return_value=mock_result)
         mock_result.scalar_one_or_none = MagicMock(return_value=None)
         mock_db_session.execute = AsyncMock(return_value=mock_result)
 
@@ -145,27 +163,17 @@ class TestSendCaptureMessage:
         mock_session_obj = MagicMock()
         mock_session_obj.id = session_id
         mock_session_obj.status = SessionStatus.ACTIVE
+        mock_session_obj.messages = [
+            MagicMock(role="assistant", content="What decision are you facing?")
+        ]
 
+        # Session and history are loaded in a single query
         mock_session_result = MagicMock()
+        mock_session_result.unique = MagicMock(return_value=mock_session_result)
         mock_session_result.scalar_one_or_none = MagicMock(
             return_value=mock_session_obj
         )
-
-        mock_messages_result = MagicMock()
-        mock_messages_result.scalars = MagicMock(
-            return_value=MagicMock(all=MagicMock(return_value=[]))
-        )
-
-        call_count = [0]
-
-        async def mock_execute(query):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_session_result
-            else:
-                return mock_messages_result
-
-        mock_db_session.execute = mock_execute
+        mock_db_session.execute = AsyncMock(return_value=mock_session_result)
 
         # Mock AI message creation
         mock_ai_message = MagicMock()
@@ -202,6 +210,13 @@ class TestSendCaptureMessage:
 
             assert result.role == "assistant"
             assert result.content == "AI response"
+            mock_db_session.execute.assert_awaited_once()
+            mock_interview_agent.process_message.assert_awaited_once_with(
+                user_message="User message",
+                history=[
+                    {"role": "assistant", "content": "What decision are you facing?"}
+                ],
+            )
 
     @pytest.mark.asyncio
     async def test_send_message_to_inactive_session(self, mock_db_session):
@@ -301,7 +316,7 @@ class TestCompleteCaptureSession:
         with (
             patch("routers.capture.get_db", return_value=mock_db_session),
             patch("routers.capture.InterviewAgent", return_value=mock_interview_agent),
-            patch("services.extractor.DecisionExtractor", return_value=mock_extractor),
+            patch("routers.capture.get_extractor", return_value=mock_extractor),
         ):
             from routers.capture import complete_capture_session
 
@@ -1,5 +1,6 @@
 """Tests for the dashboard router."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -18,6 +19,22 @@ def create_async_result_mock(records):
     return result
 
 
+def create_stats_result(
+    total_decisions=0, total_entities=0, needs_review=0, recent=()
+):
+    """Create a mock result for the combined dashboard stats query."""
+    result = MagicMock()
+    result.single = AsyncMock(
+        return_value={
+            "total_decisions": total_decisions,
+            "total_entities": total_entities,
+            "needs_review": needs_review,
+            "recent": list(recent),
+        }
+    )
+    return result
+
+
 def create_neo4j_session_mock():
     """Create a mock Neo4j session that works as an async context manager."""
     session = AsyncMock()
@@ -45,10 +62,7 @@ class TestGetDashboardStats:
         mock_pg_result.scalar = MagicMock(return_value=15)
         mock_postgres_session.execute = AsyncMock(return_value=mock_pg_result)
 
-        # Mock Neo4j queries - the router makes 3 queries:
-        # 1. Count decisions
-        # 2. Count entities
-        # 3. Get recent decisions with entities
+        # Mock Neo4j - the router fetches all stats in a single query
         recent_decisions = [
             {
                 "d": {
@@ -80,29 +94,11 @@ class TestGetDashboardStats:
             },
         ]
 
-        call_count = [0]
-
-        async def mock_neo4j_run(query, **params):
-            call_count[0] += 1
-            result = MagicMock()
-
-            if "count(d)" in query.lower():
-                # Decision count
-                result.single = AsyncMock(return_value={"count": 25})
-            elif "count(e)" in query.lower():
-                # Entity count
-                result.single = AsyncMock(return_value={"count": 50})
-            else:
-                # Recent decisions - return async iterator
-                async def async_iter():
-                    for r in recent_decisions:
-                        yield r
-
-                result.__aiter__ = lambda self: async_iter()
-
-            return result
-
-        mock_neo4j_session.run = mock_neo4j_run
+        mock_neo4j_session.run = AsyncMock(
+            return_value=create_stats_result(
+                total_decisions=25, total_entities=50, recent=recent_decisions
+            )
+        )
 
         with (
             patch(
@@ -117,12 +113,14 @@ class TestGetDashboardStats:
         ):
             from routers.dashboard import get_dashboard_stats
 
-            result = await get_dashboard_stats(db=mock_postgres_session)
+            response = await get_dashboard_stats(db=mock_postgres_session)
+            result = json.loads(response.body)
 
-            assert result.total_decisions == 25
-            assert result.total_entities == 50
-            assert result.total_sessions == 15
-            assert len(result.recent_decisions) == 2
+            assert result["total_decisions"] == 25
+            assert result["total_entities"] == 50
+            assert result["total_sessions"] == 15
+            assert len(result["recent_decisions"]) == 2
+            mock_neo4j_session.run.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_get_dashboard_stats_empty(self, mock_postgres_session):
@@ -134,24 +132,36 @@ class TestGetDashboardStats:
         mock_pg_result.scalar = MagicMock(return_value=0)
         mock_postgres_session.execute = AsyncMock(return_value=mock_pg_result)
 
-        async def mock_neo4j_run(query, **params):
-            result = MagicMock()
+        mock_neo4j_session.run = AsyncMock(return_value=create_stats_result())
 
-            if "count(d)" in query.lower():
-                result.single = AsyncMock(return_value={"count": 0})
-            elif "count(e)" in query.lower():
-                result.single = AsyncMock(return_value={"count": 0})
-            else:
+        with patch(
+            "routers.dashboard.get_neo4j_session",
+            new_callable=AsyncMock,
+            return_value=mock_neo4j_session,
+        ):
+            from routers.dashboard import get_dashboard_stats
 
-                async def empty_iter():
-                    return
-                    yield
+            response = await get_dashboard_stats(db=mock_postgres_session)
+            result = json.loads(response.body)
 
-                result.__aiter__ = lambda self: empty_iter()
+            assert result["total_decisions"] == 0
+            assert result["total_entities"] == 0
+            assert result["total_sessions"] == 0
+            assert result["recent_decisions"] == []
 
-            return result
+    @pytest.mark.asyncio
+    async def test_get_dashboard_stats_null_session_count(self, mock_postgres_session):
+        """Should handle null session count gracefully."""
+        mock_neo4j_session = create_neo4j_session_mock()
 
-        mock_neo4j_session.run = mock_neo4j_run
+        # Mock PostgreSQL returning None
+        mock_pg_result = AsyncMock()
+        mock_pg_result.scalar = MagicMock(return_value=None)
+        mock_postgres_session.execute = AsyncMock(return_value=mock_pg_result)
+
+        mock_neo4j_session.run = AsyncMock(
+            return_value=create_stats_result(total_decisions=5, total_entities=10)
+        )
 
         with patch(
             "routers.dashboard.get_neo4j_session",
@@ -160,41 +170,53 @@ class TestGetDashboardStats:
         ):
             from routers.dashboard import get_dashboard_stats
 
-            result = await get_dashboard_stats(db=mock_postgres_session)
+            response = await get_dashboard_stats(db=mock_postgres_session)
+            result = json.loads(response.body)
 
-            assert result.total_decisions == 0
-            assert result.total_entities == 0
-            assert result.total_sessions == 0
-            assert result.recent_decisions == []
+            # Should default to 0 when None
+            assert result["total_sessions"] == 0
 
     @pytest.mark.asyncio
-    async def test_get_dashboard_stats_null_session_count(self, mock_postgres_session):
-        """Should handle null session count gracefully."""
+    async def test_get_dashboard_stats_needs_review(self, mock_postgres_session):
+        """Should report the review backlog from the combined query."""
         mock_neo4j_session = create_neo4j_session_mock()
 
-        # Mock PostgreSQL returning None
         mock_pg_result = AsyncMock()
-        mock_pg_result.scalar = MagicMock(return_value=None)
+        mock_pg_result.scalar = MagicMock(return_value=0)
         mock_postgres_session.execute = AsyncMock(return_value=mock_pg_result)
 
-        async def mock_neo4j_run(query, **params):
-            result = MagicMock()
+        mock_neo4j_session.run = AsyncMock(
+            return_value=create_stats_result(total_decisions=7, needs_review=3)
+        )
 
-            if "count(d)" in query.lower():
-                result.single = AsyncMock(return_value={"count": 5})
-            elif "count(e)" in query.lower():
-                result.single = AsyncMock(return_value={"count": 10})
-            else:
+        with patch(
+            "routers.dashboard.get_neo4j_session",
+            new_callable=AsyncMock,
+            return_value=mock_neo4j_session,
+        ):
+            from routers.dashboard import get_dashboard_stats
 
-                async def empty_iter():
-                    return
-                    yield
+            response = await get_dashboard_stats(db=mock_postgres_session)
+            result = json.loads(response.body)
 
-                result.__aiter__ = lambda self: empty_iter()
+            assert result["needs_review"] == 3
+            _, params = mock_neo4j_session.run.call_args
+            assert params == {"user_id": "anonymous"}
 
-            return result
+    @pytest.mark.asyncio
+    async def test_get_dashboard_stats_neo4j_query_failure(
+        self, mock_postgres_session
+    ):
+        """Should return 503 when the combined Neo4j query fails."""
+        from fastapi import HTTPException
 
-        mock_neo4j_session.run = mock_neo4j_run
+        mock_neo4j_session = create_neo4j_session_mock()
+
+        mock_pg_result = AsyncMock()
+        mock_pg_result.scalar = MagicMock(return_value=0)
+        mock_postgres_session.execute = AsyncMock(return_value=mock_pg_result)
+
+        mock_neo4j_session.run = AsyncMock(side_effect=Exception("query failed"))
 
         with patch(
             "routers.dashboard.get_neo4j_session",
@@ -203,10 +225,10 @@ class TestGetDashboardStats:
         ):
             from routers.dashboard import get_dashboard_stats
 
-            result = await get_dashboard_stats(db=mock_postgres_session)
+            with pytest.raises(HTTPException) as exc_info:
+                await get_dashboard_stats(db=mock_postgres_session)
 
-            # Should default to 0 when None
-            assert result.total_sessions == 0
+            assert exc_info.value.status_code == 503
 
 
 class TestRecentDecisions:
@@ -255,24 +277,99 @@ class TestRecentDecisions:
             },
         ]
 
-        async def mock_run(query, **params):
-            result = MagicMock()
+        mock_neo4j_session.run = AsyncMock(
+            return_value=create_stats_result(
+                total_decisions=2, recent=recent_decisions
+            )
+        )
+
+        with patch(
+            "routers.dashboard.get_neo4j_session",
+            new_callable=AsyncMock,
+            return_value=mock_neo4j_session,
+        ):
+            from routers.dashboard import get_dashboard_stats
+
+            response = await get_dashboard_stats(db=mock_postgres_session)
+            result = json.loads(response.body)
+
+            assert len(result["recent_decisions"]) == 2
+            # First should be the newest
+            assert result["recent_decisions"][0]["trigger"] == "Newest"
+
+    @pytest.mark.asyncio
+    async def test_recent_decisions_fill_null_projected_fields(
+        self, mock_postgres_session
+    ):
+        """Missing properties come back as null from map projections."""
+        mock_neo4j_session = create_neo4j_session_mock()
+
+        recent_decisions = [
+            {
+                "d": {
+                    "id": "1",
+                    "trigger": None,
+                    "context": None,
+                    "options": None,
+                    "agent_decision": None,
+                    "decision": "Legacy choice",
+                    "agent_rationale": None,
+                    "rationale": None,
+                    "human_decision": None,
+                    "human_rationale": None,
+                    "confidence": None,
+                    "created_at": "2024-01-20T00:00:00Z",
+                },
+                "entities": [{"id": "e1", "name": "Redis", "type": None}],
+            },
+        ]
+
+        mock_neo4j_session.run = AsyncMock(
+            return_value=create_stats_result(total_decisions=1, recent=recent_decisions)
+        )
 
-            if "count(d)" in query.lower():
-                result.single = AsyncMock(return_value={"count": 2})
-            elif "count(e)" in query.lower():
-                result.single = AsyncMock(return_value={"count": 0})
-            else:
+        with patch(
+            "routers.dashboard.get_neo4j_session",
+            new_callable=AsyncMock,
+            return_value=mock_neo4j_session,
+        ):
+            from routers.dashboard import get_dashboard_stats
 
-                async def async_iter():
-                    for r in recent_decisions:
-                        yield r
+            response = await get_dashboard_stats(db=mock_postgres_session)
+            result = json.loads(response.body)
 
-                result.__aiter__ = lambda self: async_iter()
+            decision = result["recent_decisions"][0]
+            assert decision["trigger"] == "(untitled)"
+            assert decision["options"] == []
+            assert decision["agent_decision"] == "Legacy choice"
+            assert decision["agent_rationale"] == "(not recorded)"
+            assert decision["confidence"] == 0.0
+            assert decision["entities"][0]["type"] == "concept"
 
-            return result
+    @pytest.mark.asyncio
+    async def test_recent_decisions_created_at_matches_decision_model(
+        self, mock_postgres_session
+    ):
+        """created_at should serialize the same way as on /api/decisions."""
+        from routers.decisions import _decision_from_record as decision_from_record
+
+        mock_neo4j_session = create_neo4j_session_mock()
 
-        mock_neo4j_session.run = mock_run
+        stored = {
+            "id": "1",
+            "trigger": "Pick a cache",
+            "context": "Context",
+            "options": ["Redis"],
+            "decision": "Redis",
+            "rationale": "Reason",
+            "confidence": 0.9,
+            "created_at": "2024-01-01T00:00:00+00:00",
+        }
+        mock_neo4j_session.run = AsyncMock(
+            return_value=create_stats_result(
+                total_decisions=1, recent=[{"d": stored, "entities": []}]
+            )
+        )
 
         with patch(
             "routers.dashboard.get_neo4j_session",
@@ -281,8 +378,9 @@ class TestRecentDecisions:
         ):
             from routers.dashboard import get_dashboard_stats
 
-            result = await get_dashboard_stats(db=mock_postgres_session)
+            response = await get_dashboard_stats(db=mock_postgres_session)
+            result = json.loads(response.body)
 
-            assert len(result.recent_decisions) == 2
-            # First should be the newest
-            assert result.recent_decisions[0].trigger == "Newest"
+        expected = decision_from_record(stored, []).model_dump(mode="json")
+        assert result["recent_decisions"][0]["created_at"] == expected["created_at"]
+        assert expected["created_at"] == "2024-01-01T00:00:00Z"
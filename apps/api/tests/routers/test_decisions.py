@@ -1,5 +1,6 @@
 """Tests for the decisions router."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -7,7 +8,7 @@ import pytest
 
 
 def create_async_result_mock(records):
-    """Create a mock Neo4j result that works as an async iterator."""
+    """Create a mock Neo4j result that supports async iteration and data()."""
     result = MagicMock()
 
     async def async_iter():
@@ -15,6 +16,7 @@ def create_async_result_mock(records):
             yield r
 
     result.__aiter__ = lambda self: async_iter()
+    result.data = AsyncMock(return_value=list(records))
     return result
 
 
@@ -73,16 +75,13 @@ class TestGetDecisions:
             return_value=create_async_result_mock(sample_decisions)
         )
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.decisions import get_decisions
+        from routers.decisions import get_decisions
 
-            results = await get_decisions(limit=50, offset=0)
-            assert len(results) == 2
-            assert results[0].trigger == "Choosing a database"
+        response = await get_decisions(limit=50, offset=0, session=mock_session)
+        results = json.loads(response.body)
+        assert len(results) == 2
+        assert results[0]["trigger"] == "Choosing a database"
+        assert results[0]["source"] == "manual"
 
     @pytest.mark.asyncio
     async def test_get_decisions_empty(self):
@@ -90,15 +89,10 @@ class TestGetDecisions:
         mock_session = create_neo4j_session_mock()
         mock_session.run = AsyncMock(return_value=create_async_result_mock([]))
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.decisions import get_decisions
+        from routers.decisions import get_decisions
 
-            results = await get_decisions(limit=50, offset=0)
-            assert results == []
+        response = await get_decisions(limit=50, offset=0, session=mock_session)
+        assert json.loads(response.body) == []
 
     @pytest.mark.asyncio
     async def test_get_decisions_with_pagination(self):
@@ -106,19 +100,61 @@ class TestGetDecisions:
         mock_session = create_neo4j_session_mock()
         mock_session.run = AsyncMock(return_value=create_async_result_mock([]))
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.decisions import get_decisions
+        from routers.decisions import get_decisions
 
-            await get_decisions(limit=10, offset=20)
+        await get_decisions(limit=10, offset=20, session=mock_session)
 
-            # Verify query was called with pagination params
-            call_args = mock_session.run.call_args
-            assert call_args[1]["limit"] == 10
-            assert call_args[1]["offset"] == 20
+        # Verify query was called with pagination params
+        call_args = mock_session.run.call_args
+        assert call_args[1]["limit"] == 10
+        assert call_args[1]["offset"] == 20
+
+    @pytest.mark.asyncio
+    async def test_get_decisions_sets_next_cursor_on_full_page(
+        self, sample_decisions
+    ):
+        """A full page should return a cursor that resumes after its last row."""
+        mock_session = create_neo4j_session_mock()
+        mock_session.run = AsyncMock(
+            return_value=create_async_result_mock(sample_decisions)
+        )
+
+        from routers.decisions import get_decisions
+
+        response = await get_decisions(limit=2, offset=0, session=mock_session)
+        cursor = response.headers["X-Next-Cursor"]
+
+        await get_decisions(limit=2, offset=0, cursor=cursor, session=mock_session)
+
+        last = sample_decisions[-1]["d"]
+        params = mock_session.run.call_args[1]
+        assert params["cursor_created_at"] == last["created_at"]
+        assert params["cursor_id"] == last["id"]
+
+    @pytest.mark.asyncio
+    async def test_get_decisions_no_cursor_on_last_page(self, sample_decisions):
+        """A partial page is the last one, so no cursor is returned."""
+        mock_session = create_neo4j_session_mock()
+        mock_session.run = AsyncMock(
+            return_value=create_async_result_mock(sample_decisions)
+        )
+
+        from routers.decisions import get_decisions
+
+        response = await get_decisions(limit=50, offset=0, session=mock_session)
+
+        assert "X-Next-Cursor" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_get_decisions_invalid_cursor(self):
+        """Should reject a malformed cursor with 400."""
+        from fastapi import HTTPException
+
+        from routers.decisions import get_decisions
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_decisions(limit=50, offset=0, cursor="not-a-cursor")
+        assert exc_info.value.status_code == 400
 
 
 class TestGetDecision:
@@ -148,16 +184,11 @@ class TestGetDecision:
         mock_result.single = AsyncMock(return_value=decision_data)
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.decisions import get_decision
+        from routers.decisions import get_decision
 
-            result = await get_decision(decision_id)
-            assert result.id == decision_id
-            assert result.trigger == "Test decision"
+        result = await get_decision(decision_id, session=mock_session)
+        assert result.id == decision_id
+        assert result.trigger == "Test decision"
 
     @pytest.mark.asyncio
     async def test_get_decision_not_found(self):
@@ -167,18 +198,13 @@ class TestGetDecision:
         mock_result.single = AsyncMock(return_value=None)
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from routers.decisions import get_decision
+        from routers.decisions import get_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_decision("nonexistent-id")
-            assert exc_info.value.status_code == 404
+        with pytest.raises(HTTPException) as exc_info:
+            await get_decision("nonexistent-id", session=mock_session)
+        assert exc_info.value.status_code == 404
 
 
 class TestDeleteDecision:
@@ -189,51 +215,32 @@ class TestDeleteDecision:
         """Should delete decision when it exists."""
         mock_session = create_neo4j_session_mock()
         decision_id = str(uuid4())
-        decision_data = {"d": {"id": decision_id}}
-
-        call_count = [0]
-
-        async def mock_run(query, **params):
-            call_count[0] += 1
-            result = AsyncMock()
-            if call_count[0] == 1:
-                result.single = AsyncMock(return_value=decision_data)
-            else:
-                result.single = AsyncMock(return_value=None)
-            return result
-
-        mock_session.run = mock_run
+        mock_result = AsyncMock()
+        mock_result.single = AsyncMock(return_value={"deleted": 1})
+        mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.decisions import delete_decision
+        from routers.decisions import delete_decision
 
-            result = await delete_decision(decision_id)
-            assert result["status"] == "deleted"
+        result = await delete_decision(decision_id, session=mock_session)
+        assert result["status"] == "deleted"
+        # Ownership check and delete happen in a single round-trip
+        mock_session.run.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_delete_decision_not_found(self):
         """Should raise 404 when decision doesn't exist."""
         mock_session = create_neo4j_session_mock()
         mock_result = AsyncMock()
-        mock_result.single = AsyncMock(return_value=None)
+        mock_result.single = AsyncMock(return_value={"deleted": 0})
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from routers.decisions import delete_decision
+        from routers.decisions import delete_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await delete_decision("nonexistent-id")
-            assert exc_info.value.status_code == 404
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_decision("nonexistent-id", session=mock_session)
+        assert exc_info.value.status_code == 404
 
 
 class TestCreateDecision:
@@ -273,11 +280,95 @@ class TestCreateDecision:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
+        from routers.decisions import ManualDecisionInput, create_decision
+
+        input_data = ManualDecisionInput(
+            trigger="Test",
+            context="Context",
+            options=["A"],
+            decision="A",
+            rationale="Because",
+            auto_extract=False,
+        )
+        result = await create_decision(input_data, session=mock_session)
+        assert result.trigger == "Test"
+        assert result.source == "manual"
+
+    @pytest.mark.asyncio
+    async def test_create_decision_manual_single_query(self):
+        """Should create, link unique entities and read back in a single query."""
+        mock_session = create_neo4j_session_mock()
+        calls = []
+
+        async def mock_run(query, **params):
+            calls.append((query, params))
+            result = AsyncMock()
+            result.single = AsyncMock(
+                return_value={
+                    "d": {
+                        "id": params.get("id", "decision-id"),
+                        "trigger": "Test",
+                        "context": "Context",
+                        "options": ["A"],
+                        "decision": "A",
+                        "rationale": "Because",
+                        "confidence": 1.0,
+                        "created_at": "2024-01-01T00:00:00Z",
+                        "source": "manual",
+                    },
+                    "entities": [],
+                }
+            )
+            return result
+
+        mock_session.run = mock_run
+
+        from routers.decisions import ManualDecisionInput, create_decision
+
+        input_data = ManualDecisionInput(
+            trigger="Test",
+            context="Context",
+            options=["A"],
+            decision="A",
+            rationale="Because",
+            auto_extract=False,
+            entities=["Redis", "  ", " PostgreSQL ", "Redis "],
+        )
+        await create_decision(input_data, session=mock_session)
+
+        assert len(calls) == 1
+        assert [row["name"] for row in calls[0][1]["entities"]] == [
+            "Redis",
+            "PostgreSQL",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_decision_auto_extract_reuses_session(self):
+        """The extractor should write on the request's session."""
+        mock_session = create_neo4j_session_mock()
+        mock_result = AsyncMock()
+        mock_result.single = AsyncMock(
+            return_value={
+                "d": {
+                    "id": "decision-id",
+                    "trigger": "Test",
+                    "context": "Context",
+                    "options": ["A"],
+                    "agent_decision": "A",
+                    "agent_rationale": "Because",
+                    "confidence": 0.8,
+                    "created_at": "2024-01-01T00:00:00Z",
+                    "source": "manual",
+                },
+                "entities": [],
+            }
+        )
+        mock_session.run = AsyncMock(return_value=mock_result)
+
+        mock_extractor = MagicMock()
+        mock_extractor.save_decision = AsyncMock(return_value="decision-id")
+
+        with patch("routers.decisions.get_extractor", return_value=mock_extractor):
             from routers.decisions import ManualDecisionInput, create_decision
 
             input_data = ManualDecisionInput(
@@ -286,11 +377,12 @@ class TestCreateDecision:
                 options=["A"],
                 decision="A",
                 rationale="Because",
-                auto_extract=False,
             )
-            result = await create_decision(input_data)
-            assert result.trigger == "Test"
-            assert result.source == "manual"
+            result = await create_decision(input_data, session=mock_session)
+
+        assert result.id == "decision-id"
+        assert mock_extractor.save_decision.call_args[1]["session"] is mock_session
+        assert mock_session.run.call_args[1]["id"] == "decision-id"
 
 
 class TestUpdateDecision:
@@ -349,18 +441,13 @@ class TestUpdateDecision:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from models.schemas import DecisionUpdate
-            from routers.decisions import update_decision
+        from models.schemas import DecisionUpdate
+        from routers.decisions import update_decision
 
-            update_data = DecisionUpdate(trigger="Updated trigger")
-            result = await update_decision(decision_id, update_data)
-            assert result.trigger == "Updated trigger"
-            assert result.id == decision_id
+        update_data = DecisionUpdate(trigger="Updated trigger")
+        result = await update_decision(decision_id, update_data, session=mock_session)
+        assert result.trigger == "Updated trigger"
+        assert result.id == decision_id
 
     @pytest.mark.asyncio
     async def test_update_decision_not_found(self):
@@ -370,22 +457,18 @@ class TestUpdateDecision:
         mock_result.single = AsyncMock(return_value=None)
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from models.schemas import DecisionUpdate
-            from routers.decisions import update_decision
+        from models.schemas import DecisionUpdate
+        from routers.decisions import update_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await update_decision(
-                    "nonexistent-id",
-                    DecisionUpdate(trigger="New trigger"),
-                )
-            assert exc_info.value.status_code == 404
+        with pytest.raises(HTTPException) as exc_info:
+            await update_decision(
+                "nonexistent-id",
+                DecisionUpdate(trigger="New trigger"),
+                session=mock_session,
+            )
+        assert exc_info.value.status_code == 404
 
     @pytest.mark.asyncio
     async def test_update_decision_no_fields(self):
@@ -397,20 +480,15 @@ class TestUpdateDecision:
         mock_result.single = AsyncMock(return_value=decision_data)
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from models.schemas import DecisionUpdate
-            from routers.decisions import update_decision
+        from models.schemas import DecisionUpdate
+        from routers.decisions import update_decision
 
-            with pytest.raises(HTTPException) as exc_info:
-                await update_decision(decision_id, DecisionUpdate())
-            assert exc_info.value.status_code == 400
-            assert "No fields to update" in exc_info.value.detail
+        with pytest.raises(HTTPException) as exc_info:
+            await update_decision(decision_id, DecisionUpdate(), session=mock_session)
+        assert exc_info.value.status_code == 400
+        assert "No fields to update" in exc_info.value.detail
 
     @pytest.mark.asyncio
     async def test_update_decision_multiple_fields(self):
@@ -450,20 +528,15 @@ class TestUpdateDecision:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.decisions.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from models.schemas import DecisionUpdate
-            from routers.decisions import update_decision
-
-            update_data = DecisionUpdate(
-                trigger="New trigger",
-                context="New context",
-                rationale="New reason",
-            )
-            result = await update_decision(decision_id, update_data)
-            assert result.trigger == "New trigger"
-            assert result.context == "New context"
-            assert result.rationale == "New reason"
+        from models.schemas import DecisionUpdate
+        from routers.decisions import update_decision
+
+        update_data = DecisionUpdate(
+            trigger="New trigger",
+            context="New context",
+            rationale="New reason",
+        )
+        result = await update_decision(decision_id, update_data, session=mock_session)
+        assert result.trigger == "New trigger"
+        assert result.context == "New context"
+        assert result.rationale == "New reason"
@@ -46,16 +46,11 @@ class TestGetAllEntities:
             return_value=create_async_result_mock([{"e": e} for e in sample_entities])
         )
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.entities import get_all_entities
+        from routers.entities import get_all_entities
 
-            results = await get_all_entities(user_id="test-user")
-            assert len(results) == 3
-            assert results[0].name == "PostgreSQL"
+        results = await get_all_entities(user_id="test-user", session=mock_session)
+        assert len(results) == 3
+        assert results[0].name == "PostgreSQL"
 
     @pytest.mark.asyncio
     async def test_get_all_entities_empty(self):
@@ -63,15 +58,29 @@ class TestGetAllEntities:
         mock_session = create_neo4j_session_mock()
         mock_session.run = AsyncMock(return_value=create_async_result_mock([]))
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.entities import get_all_entities
+        from routers.entities import get_all_entities
+
+        results = await get_all_entities(user_id="test-user", session=mock_session)
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_get_all_entities_pages_by_name(self, sample_entities):
+        """Should resume after the given name and pass the page size."""
+        mock_session = create_neo4j_session_mock()
+        mock_session.run = AsyncMock(
+            return_value=create_async_result_mock([{"e": sample_entities[1]}])
+        )
 
-            results = await get_all_entities(user_id="test-user")
-            assert results == []
+        from routers.entities import get_all_entities
+
+        results = await get_all_entities(
+            limit=1, after_name="PostgreSQL", user_id="test-user", session=mock_session
+        )
+
+        assert [e.name for e in results] == ["Redis"]
+        params = mock_session.run.call_args[1]
+        assert params["after_name"] == "PostgreSQL"
+        assert params["limit"] == 1
 
 
 class TestGetEntity:
@@ -88,16 +97,11 @@ class TestGetEntity:
         mock_result.single = AsyncMock(return_value={"e": entity_data})
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.entities import get_entity
+        from routers.entities import get_entity
 
-            result = await get_entity(entity_id, user_id="test-user")
-            assert result.id == entity_id
-            assert result.name == "PostgreSQL"
+        result = await get_entity(entity_id, user_id="test-user", session=mock_session)
+        assert result.id == entity_id
+        assert result.name == "PostgreSQL"
 
     @pytest.mark.asyncio
     async def test_get_entity_not_found(self):
@@ -107,18 +111,15 @@ class TestGetEntity:
         mock_result.single = AsyncMock(return_value=None)
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from routers.entities import get_entity
+        from routers.entities import get_entity
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_entity("nonexistent-id", user_id="test-user")
-            assert exc_info.value.status_code == 404
+        with pytest.raises(HTTPException) as exc_info:
+            await get_entity(
+                "nonexistent-id", user_id="test-user", session=mock_session
+            )
+        assert exc_info.value.status_code == 404
 
 
 class TestCreateEntity:
@@ -145,20 +146,17 @@ class TestCreateEntity:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from models.schemas import Entity
-            from routers.entities import create_entity
+        from models.schemas import Entity
+        from routers.entities import create_entity
 
-            new_entity = Entity(name="NewTech", type="technology")
-            result = await create_entity(new_entity, user_id="test-user")
+        new_entity = Entity(name="NewTech", type="technology")
+        result = await create_entity(
+            new_entity, user_id="test-user", session=mock_session
+        )
 
-            assert result.name == "NewTech"
-            assert result.type == "technology"
-            assert result.id is not None
+        assert result.name == "NewTech"
+        assert result.type == "technology"
+        assert result.id is not None
 
     @pytest.mark.asyncio
     async def test_create_entity_with_id(self):
@@ -177,66 +175,52 @@ class TestCreateEntity:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from models.schemas import Entity
-            from routers.entities import create_entity
+        from models.schemas import Entity
+        from routers.entities import create_entity
 
-            new_entity = Entity(id=entity_id, name="NewTech", type="technology")
-            result = await create_entity(new_entity, user_id="test-user")
+        new_entity = Entity(id=entity_id, name="NewTech", type="technology")
+        result = await create_entity(
+            new_entity, user_id="test-user", session=mock_session
+        )
 
-            assert result.id == entity_id
+        assert result.id == entity_id
 
 
 class TestDeleteEntity:
     """Tests for DELETE /{entity_id} endpoint."""
 
+    @staticmethod
+    def create_delete_result(rel_count, other_user_count=0, name="OldTech"):
+        """Create a mock result for the combined access-check-and-delete query."""
+        result = AsyncMock()
+        result.single = AsyncMock(
+            return_value={
+                "entity": {"name": name, "aliases": None},
+                "rel_count": rel_count,
+                "other_user_count": other_user_count,
+            }
+        )
+        return result
+
     @pytest.mark.asyncio
     async def test_delete_entity_success(self):
         """Should delete entity when it exists and user owns it."""
         mock_session = create_neo4j_session_mock()
         entity_id = str(uuid4())
-        entity_data = {"id": entity_id, "name": "OldTech", "type": "technology"}
+        mock_session.run = AsyncMock(return_value=self.create_delete_result(0))
 
-        # Calls: 1) check user access, 2) check other users, 3) check relationships, 4) delete
-        call_count = [0]
+        from routers.entities import delete_entity
 
-        async def mock_run(query, **params):
-            call_count[0] += 1
-            result = AsyncMock()
-            if (
-                "d:DecisionTrace" in query
-                and "INVOLVES" in query
-                and call_count[0] <= 2
-            ):
-                if "d.user_id IS NOT NULL AND d.user_id <>" in query:
-                    # Check for other users - none
-                    result.single = AsyncMock(return_value={"other_user_count": 0})
-                else:
-                    # Entity is accessible to user
-                    result.single = AsyncMock(return_value={"e": entity_data})
-            elif "rel_count" in query or "count(r)" in query:
-                # No relationships
-                result.single = AsyncMock(return_value={"rel_count": 0})
-            else:
-                # Delete successful
-                result.single = AsyncMock(return_value=None)
-            return result
-
-        mock_session.run = mock_run
-
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.entities import delete_entity
+        result = await delete_entity(
+            entity_id, user_id="test-user", session=mock_session
+        )
+        assert result["status"] == "deleted"
 
-            result = await delete_entity(entity_id, user_id="test-user")
-            assert result["status"] == "deleted"
+        # Checks and delete run as a single query
+        mock_session.run.assert_awaited_once()
+        query = mock_session.run.call_args[0][0]
+        assert "DETACH DELETE e" in query
+        assert mock_session.run.call_args[1]["force"] is False
 
     @pytest.mark.asyncio
     async def test_delete_entity_not_found(self):
@@ -246,94 +230,48 @@ class TestDeleteEntity:
         mock_result.single = AsyncMock(return_value=None)
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from routers.entities import delete_entity
+        from routers.entities import delete_entity
 
-            with pytest.raises(HTTPException) as exc_info:
-                await delete_entity("nonexistent-id", user_id="test-user")
-            assert exc_info.value.status_code == 404
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_entity(
+                "nonexistent-id", user_id="test-user", session=mock_session
+            )
+        assert exc_info.value.status_code == 404
 
     @pytest.mark.asyncio
     async def test_delete_entity_with_relationships_blocked(self):
         """Should block delete when entity has relationships."""
         mock_session = create_neo4j_session_mock()
         entity_id = str(uuid4())
-        entity_data = {"id": entity_id, "name": "LinkedTech", "type": "technology"}
-
-        call_count = [0]
+        mock_session.run = AsyncMock(return_value=self.create_delete_result(5))
 
-        async def mock_run(query, **params):
-            call_count[0] += 1
-            result = AsyncMock()
-            # Order matters - check most specific patterns first
-            if "count(r) as rel_count" in query:
-                # Relationship count check - has relationships
-                result.single = AsyncMock(return_value={"rel_count": 5})
-            elif "other_user_count" in query:
-                # Check for other users - none
-                result.single = AsyncMock(return_value={"other_user_count": 0})
-            elif "RETURN DISTINCT e" in query:
-                # Entity accessibility check
-                result.single = AsyncMock(return_value={"e": entity_data})
-            else:
-                result.single = AsyncMock(return_value=None)
-            return result
-
-        mock_session.run = mock_run
-
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from routers.entities import delete_entity
+        from routers.entities import delete_entity
 
-            with pytest.raises(HTTPException) as exc_info:
-                await delete_entity(entity_id, force=False, user_id="test-user")
-            assert exc_info.value.status_code == 400
-            assert "relationships" in exc_info.value.detail
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_entity(
+                entity_id, force=False, user_id="test-user", session=mock_session
+            )
+        assert exc_info.value.status_code == 400
+        assert "relationships" in exc_info.value.detail
 
     @pytest.mark.asyncio
     async def test_delete_entity_force(self):
         """Should force delete entity with relationships."""
         mock_session = create_neo4j_session_mock()
         entity_id = str(uuid4())
-        entity_data = {"id": entity_id, "name": "LinkedTech", "type": "technology"}
-
-        call_count = [0]
-
-        async def mock_run(query, **params):
-            call_count[0] += 1
-            result = AsyncMock()
-            if "d.user_id IS NOT NULL AND d.user_id <>" in query:
-                # Check for other users - none
-                result.single = AsyncMock(return_value={"other_user_count": 0})
-            elif "d:DecisionTrace" in query and "INVOLVES" in query:
-                # Entity is accessible
-                result.single = AsyncMock(return_value={"e": entity_data})
-            else:
-                result.single = AsyncMock(return_value=None)
-            return result
+        mock_session.run = AsyncMock(return_value=self.create_delete_result(5))
 
-        mock_session.run = mock_run
-
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from routers.entities import delete_entity
+        from routers.entities import delete_entity
 
-            result = await delete_entity(entity_id, force=True, user_id="test-user")
-            assert result["status"] == "deleted"
+        result = await delete_entity(
+            entity_id, force=True, user_id="test-user", session=mock_session
+        )
+        assert result["status"] == "deleted"
+        assert mock_session.run.call_args[1]["force"] is True
 
 
 class TestLinkEntity:
@@ -369,22 +307,17 @@ class TestLinkEntity:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from models.schemas import LinkEntityRequest
-            from routers.entities import link_entity
-
-            # SEC-005: Valid UUIDs and relationship type
-            request = LinkEntityRequest(
-                decision_id=decision_id,
-                entity_id=entity_id,
-                relationship="INVOLVES",  # Valid relationship type
-            )
-            result = await link_entity(request, user_id="test-user")
-            assert result["status"] == "linked"
+        from models.schemas import LinkEntityRequest
+        from routers.entities import link_entity
+
+        # SEC-005: Valid UUIDs and relationship type
+        request = LinkEntityRequest(
+            decision_id=decision_id,
+            entity_id=entity_id,
+            relationship="INVOLVES",  # Valid relationship type
+        )
+        result = await link_entity(request, user_id="test-user", session=mock_session)
+        assert result["status"] == "linked"
 
     @pytest.mark.asyncio
     async def test_link_entity_invalid_uuid_format(self):
@@ -404,6 +337,23 @@ class TestLinkEntity:
         errors = exc_info.value.errors()
         assert any("decision_id" in str(e) for e in errors)
 
+    @pytest.mark.asyncio
+    async def test_link_entity_rejects_wrong_length_uuid(self):
+        """SEC-005: Should reject ids that are not exactly 36 characters."""
+        from pydantic import ValidationError
+
+        from models.schemas import LinkEntityRequest
+
+        with pytest.raises(ValidationError) as exc_info:
+            LinkEntityRequest(
+                decision_id=str(uuid4()),
+                entity_id=str(uuid4()) + "0",  # One character too long
+                relationship="INVOLVES",
+            )
+
+        errors = exc_info.value.errors()
+        assert any("entity_id" in str(e) for e in errors)
+
     @pytest.mark.asyncio
     async def test_link_entity_invalid_relationship_type(self):
         """SEC-005: Should reject invalid relationship type."""
@@ -438,26 +388,21 @@ class TestLinkEntity:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from models.schemas import LinkEntityRequest
-            from routers.entities import link_entity
+        from models.schemas import LinkEntityRequest
+        from routers.entities import link_entity
 
-            request = LinkEntityRequest(
-                decision_id=decision_id,
-                entity_id=entity_id,
-                relationship="INVOLVES",
-            )
+        request = LinkEntityRequest(
+            decision_id=decision_id,
+            entity_id=entity_id,
+            relationship="INVOLVES",
+        )
 
-            with pytest.raises(HTTPException) as exc_info:
-                await link_entity(request, user_id="test-user")
-            assert exc_info.value.status_code == 404
-            assert "Decision not found" in exc_info.value.detail
+        with pytest.raises(HTTPException) as exc_info:
+            await link_entity(request, user_id="test-user", session=mock_session)
+        assert exc_info.value.status_code == 404
+        assert "Decision not found" in exc_info.value.detail
 
     @pytest.mark.asyncio
     async def test_link_entity_entity_not_found(self):
@@ -484,26 +429,21 @@ class TestLinkEntity:
 
         mock_session.run = mock_run
 
-        with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
-        ):
-            from fastapi import HTTPException
+        from fastapi import HTTPException
 
-            from models.schemas import LinkEntityRequest
-            from routers.entities import link_entity
+        from models.schemas import LinkEntityRequest
+        from routers.entities import link_entity
 
-            request = LinkEntityRequest(
-                decision_id=decision_id,
-                entity_id=entity_id,
-                relationship="INVOLVES",
-            )
+        request = LinkEntityRequest(
+            decision_id=decision_id,
+            entity_id=entity_id,
+            relationship="INVOLVES",
+        )
 
-            with pytest.raises(HTTPException) as exc_info:
-                await link_entity(request, user_id="test-user")
-            assert exc_info.value.status_code == 404
-            assert "Entity not found" in exc_info.value.detail
+        with pytest.raises(HTTPException) as exc_info:
+            await link_entity(request, user_id="test-user", session=mock_session)
+        assert exc_info.value.status_code == 404
+        assert "Entity not found" in exc_info.value.detail
 
     @pytest.mark.asyncio
     async def test_link_entity_case_insensitive_relationship(self):
@@ -548,23 +488,28 @@ class TestSuggestEntities:
         mock_session.run = AsyncMock(return_value=mock_result)
 
         with patch(
-            "routers.entities.get_neo4j_session",
-            new_callable=AsyncMock,
-            return_value=mock_session,
+            "routers.entities.DecisionExtractor",
+            return_value=mock_extractor,
         ):
-            with patch(
-                "routers.entities.DecisionExtractor",
-                return_value=mock_extractor,
-            ):
-                from models.schemas import SuggestEntitiesRequest
-                from routers.entities import suggest_entities
-
-                request = SuggestEntitiesRequest(
-                    text="Using PostgreSQL and Redis for data storage"
-                )
-                results = await suggest_entities(request, user_id="test-user")
-
-                # Should have both existing and new suggestions
-                assert len(results) >= 1
-                names = [e.name for e in results]
-                assert "PostgreSQL" in names
+            from models.schemas import SuggestEntitiesRequest
+            from routers.entities import suggest_entities
+
+            request = SuggestEntitiesRequest(
+                text="Using PostgreSQL and Redis for data storage"
+            )
+            results = await suggest_entities(
+                request, user_id="test-user", session=mock_session
+            )
+
+            # Should have both existing and new suggestions
+            assert len(results) >= 1
+            names = [e.name for e in results]
+            assert "PostgreSQL" in names
+            assert names.count("PostgreSQL") == 1
+            assert "Redis" in names
+            # All extracted names are looked up in a single query
+            mock_session.run.assert_awaited_once()
+            assert mock_session.run.call_args.kwargs["names"] == [
+                "PostgreSQL",
+                "Redis",
+            ]
@@ -0,0 +1,324 @@
+"""Tests for the bulk import/export router (PRODUCT-P2-5)."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from neo4j.exceptions import DatabaseError
+
+from routers.export import BulkImportRequest, DecisionImportItem
+
+
+def create_async_result_mock(records):
+    """Create a mock Neo4j result that works as an async iterator."""
+    result = MagicMock()
+
+    async def async_iter():
+        for r in records:
+            yield r
+
+    result.__aiter__ = lambda self: async_iter()
+    return result
+
+
+def create_neo4j_session_mock():
+    """Create a mock Neo4j session that works as an async context manager."""
+    session = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+
+    # Managed transactions run their work function against the session itself
+    async def run_managed(work):
+        return await work(session)
+
+    session.execute_read = AsyncMock(side_effect=run_managed)
+    session.execute_write = AsyncMock(side_effect=run_managed)
+    return session
+
+
+def make_item(trigger="Pick a database", decision="PostgreSQL", **kwargs):
+    """Build a valid import item with overridable fields."""
+    fields = {
+        "trigger": trigger,
+        "context": "Need persistence",
+        "options": ["PostgreSQL", "MySQL"],
+        "decision": decision,
+        "rationale": "Team familiarity",
+    }
+    fields.update(kwargs)
+    return DecisionImportItem(**fields)
+
+
+class TestBulkImport:
+    """Tests for POST /import endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def mock_cache(self):
+        """Avoid touching Redis when caches are invalidated."""
+        with patch(
+            "routers.export.invalidate_user_caches", new_callable=AsyncMock
+        ) as mock:
+            yield mock
+
+    async def _run_import(self, session, request):
+        from routers.export import bulk_import_decisions
+
+        with patch(
+            "routers.export.get_neo4j_session", AsyncMock(return_value=session)
+        ):
+            return await bulk_import_decisions(request=request, user_id="test-user")
+
+    @pytest.mark.asyncio
+    async def test_import_batches_writes(self):
+        """Should issue a constant number of queries regardless of item count."""
+        session = create_neo4j_session_mock()
+        session.run = AsyncMock(return_value=create_async_result_mock([]))
+        request = BulkImportRequest(
+            decisions=[
+                make_item(trigger=f"Trigger {i}", entities=["Redis", " Kafka ", ""])
+                for i in range(20)
+            ]
+        )
+
+        result = await self._run_import(session, request)
+
+        assert result.imported == 20
+        assert len(result.decision_ids) == 20
+        # Duplicate prefetch, then one UNWIND for decisions and entities
+        assert session.run.call_count == 2
+        rows = session.run.call_args_list[1].kwargs["rows"]
+        assert all(row["entities"] == ["Redis", "Kafka"] for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_import_skips_existing_and_repeated_duplicates(self):
+        """Should skip pairs already stored and repeats within the payload."""
+        session = create_neo4j_session_mock()
+        session.run = AsyncMock(
+            return_value=create_async_result_mock(
+                [{"trigger": "Existing", "decision": "PostgreSQL"}]
+            )
+        )
+        request = BulkImportRequest(
+            decisions=[
+                make_item(trigger="Existing"),
+                make_item(trigger="New"),
+                make_item(trigger="New"),
+            ]
+        )
+
+        result = await self._run_import(session, request)
+
+        assert result.imported == 1
+        assert result.skipped == 2
+        rows = session.run.call_args_list[1].kwargs["rows"]
+        assert [row["trigger"] for row in rows] == ["New"]
+
+    @pytest.mark.asyncio
+    async def test_import_reports_errors_when_write_fails(self):
+        """Should report every row as failed when the batch write fails."""
+        session = create_neo4j_session_mock()
+        session.run = AsyncMock(
+            side_effect=[create_async_result_mock([]), DatabaseError("boom")]
+        )
+        request = BulkImportRequest(
+            decisions=[make_item(trigger="One"), make_item(trigger="Two")]
+        )
+
+        result = await self._run_import(session, request)
+
+        assert result.imported == 0
+        assert result.skipped == 0
+        assert result.decision_ids == []
+        assert [e["index"] for e in result.errors] == [0, 1]
+        session.execute_write.assert_awaited_once()
+
+
+class TestBulkExport:
+    """Tests for GET /export endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_source_filter_applies_to_owned_and_legacy_decisions(self):
+        """Should filter both the owned and the legacy branch by source."""
+        session = create_neo4j_session_mock()
+        session.run = AsyncMock(return_value=create_async_result_mock([]))
+
+        from routers.export import bulk_export_decisions
+
+        with patch(
+            "routers.export.get_neo4j_session", AsyncMock(return_value=session)
+        ):
+            result = await bulk_export_decisions(
+                source_filter="manual", limit=10, user_id="test-user"
+            )
+
+        assert json.loads(result.body)["total_decisions"] == 0
+        query = session.run.call_args.args[0]
+        assert "OR d.user_id IS NULL" not in query
+        assert query.count("d.source = $source_filter") == 2
+        assert session.run.call_args.kwargs["source_filter"] == "manual"
+
+    @pytest.mark.asyncio
+    async def test_export_returns_records_as_json(self):
+        """Should serialize records directly, dropping empty entity slots."""
+        record = {
+            "d": {"trigger": "Pick a cache", "decision": "Redis", "source": "manual"},
+            "entities": [{"name": "Redis"}, None],
+        }
+        session = create_neo4j_session_mock()
+        session.run = AsyncMock(return_value=create_async_result_mock([record]))
+
+        from routers.export import bulk_export_decisions
+
+        with patch(
+            "routers.export.get_neo4j_session", AsyncMock(return_value=session)
+        ):
+            response = await bulk_export_decisions(
+                source_filter=None, limit=10, user_id="test-user"
+            )
+
+        payload = json.loads(response.body)
+        assert payload["total_decisions"] == 1
+        exported = payload["decisions"][0]
+        assert exported["trigger"] == "Pick a cache"
+        assert exported["confidence"] == 0.0
+        assert exported["entities"] == [{"name": "Redis", "type": "concept"}]
+
+    @pytest.mark.asyncio
+    async def test_query_text_is_static(self):
+        """Should send the same query text with or without a source filter."""
+        session = create_neo4j_session_mock()
+        session.run = AsyncMock(return_value=create_async_result_mock([]))
+
+        from routers.export import bulk_export_decisions
+
+        with patch(
+            "routers.export.get_neo4j_session", AsyncMock(return_value=session)
+        ):
+            await bulk_export_decisions(
+                source_filter=None, limit=10, user_id="test-user"
+            )
+            await bulk_export_decisions(
+                source_filter="manual", limit=10, user_id="test-user"
+            )
+
+        first, second = session.run.call_args_list
+        assert first.args[0] == second.args[0]
+        assert first.kwargs["source_filter"] is None
+
+
+class TestDownloadExport:
+    """Tests for GET /export/download endpoint."""
+
+    ASGI_SCOPE = {"type": "http", "asgi": {"spec_version": "2.4"}}
+
+    async def _stream(self, response, send=None):
+        """Run the response as an ASGI app and return the streamed body."""
+        chunks = []
+
+        async def collect(message):
+            if message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await response(self.ASGI_SCOPE, AsyncMock(), send or collect)
+        return b"".join(chunks)
+
+    @pytest.mark.asyncio
+    async def test_download_streams_valid_json(self):
+        """Should stream a JSON document with every decision and its entities."""
+        records = [
+            {
+                "d": {
+                    "trigger": f"Trigger {i}",
+                    "context": "Context",
+                    "options": ["A", "B"],
+                    "decision": "A",
+                    "rationale": "Because",
+                    "confidence": 0.9,
+                    "source": "manual",
+                    "created_at": "2026-01-01T00:00:00+00:00",
+                },
+                "entities": [{"name": "Redis", "type": "technology"}, None],
+            }
+            for i in range(3)
+        ]
+        session = create_neo4j_session_mock()
+        session.run = AsyncMock(return_value=create_async_result_mock(records))
+
+        from routers.export import download_export
+
+        with patch(
+            "routers.export.get_neo4j_session", AsyncMock(return_value=session)
+        ):
+            response = await download_export(source_filter=None, user_id="test-user")
+            body = await self._stream(response)
+
+        payload = json.loads(body)
+        assert payload["total_decisions"] == 3
+        assert [d["trigger"] for d in payload["decisions"]] == [
+            "Trigger 0",
+            "Trigger 1",
+            "Trigger 2",
+        ]
+        assert payload["decisions"][0]["entities"] == [
+            {"name": "Redis", "type": "technology"}
+        ]
+        assert "attachment" in response.headers["content-disposition"]
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_download_empty_export(self):
+        """Should stream an empty decision list when nothing matches."""
+        session = create_neo4j_session_mock()
+        session.run = AsyncMock(return_value=create_async_result_mock([]))
+
+        from routers.export import download_export
+
+        with patch(
+            "routers.export.get_neo4j_session", AsyncMock(return_value=session)
+        ):
+            response = await download_export(source_filter=None, user_id="test-user")
+            body = b"".join([chunk async for chunk in response.body_iterator])
+
+        payload = json.loads(body)
+        assert payload["decisions"] == []
+        assert payload["total_decisions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_download_closes_session_on_disconnect(self):
+        """Should close the session when the client goes away mid-response."""
+        session = create_neo4j_session_mock()
+        session.run = AsyncMock(return_value=create_async_result_mock([]))
+
+        from starlette.requests import ClientDisconnect
+
+        from routers.export import download_export
+
+        with patch(
+            "routers.export.get_neo4j_session", AsyncMock(return_value=session)
+        ):
+            response = await download_export(source_filter=None, user_id="test-user")
+
+        send = AsyncMock(side_effect=OSError("connection reset"))
+        with pytest.raises(ClientDisconnect):
+            await self._stream(response, send=send)
+
+        session.close.assert_awaited_once()
+
+
+class TestDecisionImportItem:
+    """Tests for import item validation."""
+
+    def test_options_are_stripped(self):
+        """Should strip whitespace around each option."""
+        item = make_item(options=[" PostgreSQL ", "MySQL"])
+        assert item.options == ["PostgreSQL", "MySQL"]
+
+    def test_empty_option_rejected(self):
+        """Should reject empty option strings."""
+        with pytest.raises(ValueError, match="1-1000 characters"):
+            make_item(options=["PostgreSQL", ""])
+
+    def test_empty_source_defaults_to_import(self):
+        """Should store an empty source as import."""
+        assert make_item(source="").source == "import"
+        assert make_item().source == "import"
@@ -16,7 +16,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from services.embeddings import EmbeddingService, get_embedding_service
-from utils.vectors import cosine_similarity
+from utils.vectors import best_cosine_match, cosine_similarity
 
 # ============================================================================
 # Test Fixtures
@@ -449,6 +449,30 @@ class TestCosineSimilarity:
         assert abs(result - 1.0) < 0.0001
 
 
+class TestBestCosineMatch:
+    """Test best-match selection over candidate vectors."""
+
+    def test_returns_most_similar_index(self):
+        """Should return the index and score of the closest candidate."""
+        query = [1.0, 0.0]
+        candidates = [[0.0, 1.0], [1.0, 0.1], [1.0, 1.0]]
+        index, similarity = best_cosine_match(query, candidates)
+
+        assert index == 1
+        assert abs(similarity - cosine_similarity(query, candidates[1])) < 0.0001
+
+    def test_threshold_filters_matches(self):
+        """Should return None when no candidate beats the threshold."""
+        assert best_cosine_match([1.0, 0.0], [[1.0, 1.0]], threshold=0.9) is None
+
+    def test_skips_missing_and_mismatched_vectors(self):
+        """Should ignore None, zero and wrong-dimension candidates."""
+        candidates = [None, [], [0.0, 0.0], [1.0, 0.0, 0.0], [0.5, 0.5]]
+        index, _ = best_cosine_match([1.0, 0.0], candidates)
+
+        assert index == 4
+
+
 # ============================================================================
 # Service Configuration Tests
 # ============================================================================
@@ -15,8 +15,15 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-
-from models.ontology import get_canonical_name, normalize_entity_name
+from neo4j.exceptions import ClientError
+
+from models.ontology import (
+    CANONICAL_ALIASES,
+    find_canonical_mentions,
+    fuzzy_canonical_name,
+    get_canonical_name,
+    normalize_entity_name,
+)
 from services.entity_resolver import EntityResolver, get_entity_resolver
 from tests.factories import EntityFactory, Neo4jRecordFactory
 from tests.mocks.llm_mock import MockEmbeddingService
@@ -471,8 +478,8 @@ class TestEntityResolverEmbeddingSimilarity:
                 and "embedding" not in query.lower()
             ):
                 return MockNeo4jResult(records=[])  # No entities for fuzzy
-            # Stage 5: Embedding similarity match
-            if "gds.similarity.cosine" in query:
+            # Stage 5: Embedding similarity match via the vector index
+            if "db.index.vector.queryNodes" in query:
                 return MockNeo4jResult(single_value=entity_record)
             return MockNeo4jResult(single_value=None)
 
@@ -490,6 +497,41 @@ class TestEntityResolverEmbeddingSimilarity:
         assert result.match_method == "embedding"
         assert result.confidence >= 0.9
 
+    @pytest.mark.asyncio
+    async def test_embedding_similarity_falls_back_to_gds(
+        self, mock_session, mock_embedding_service
+    ):
+        """Should use GDS when the vector index is unavailable."""
+        entity = EntityFactory.create(name="Machine Learning", entity_type="concept")
+        entity_record = {
+            "id": entity["id"],
+            "name": entity["name"],
+            "type": entity["type"],
+            "similarity": 0.95,
+        }
+
+        async def mock_run(query, **params):
+            if "db.index.vector.queryNodes" in query:
+                raise ClientError("There is no such vector schema index")
+            if "gds.similarity.cosine" in query:
+                return MockNeo4jResult(single_value=entity_record)
+            if "toLower(e.name)" in query or "ANY(alias IN" in query:
+                return MockNeo4jResult(single_value=None)
+            return MockNeo4jResult(records=[])
+
+        mock_session.run = mock_run
+
+        with patch(
+            "services.entity_resolver.get_embedding_service",
+            return_value=mock_embedding_service,
+        ):
+            resolver = EntityResolver(mock_session)
+            resolver.embedding_service = mock_embedding_service
+            result = await resolver.resolve("ML", "concept")
+
+        assert result.is_new is False
+        assert result.match_method == "embedding"
+
     @pytest.mark.asyncio
     async def test_embedding_similarity_fallback_manual(
         self, resolver_with_mocks, mock_session
@@ -815,6 +857,37 @@ class TestOntologyHelpers:
         """Should return original name for unknown aliases."""
         assert get_canonical_name("UnknownTech") == "UnknownTech"
 
+    def test_canonical_aliases_reverse_index(self):
+        """Should map each canonical name back to its aliases."""
+        assert "postgres" in CANONICAL_ALIASES["PostgreSQL"]
+        assert "k8s" in CANONICAL_ALIASES["Kubernetes"]
+
+    def test_fuzzy_canonical_name(self):
+        """Should resolve misspelled aliases and keep unknown names."""
+        assert fuzzy_canonical_name("Postgress") == "PostgreSQL"
+        assert fuzzy_canonical_name("kubernets") == "Kubernetes"
+        assert fuzzy_canonical_name("UnknownTech") == "UnknownTech"
+
+    def test_find_canonical_mentions(self):
+        """Should find aliases in text and map them to canonical names."""
+        text = "We moved from Postgres to Redis and deploy on K8s."
+        mentions = find_canonical_mentions(text)
+        assert [name for _, _, name in mentions] == [
+            "PostgreSQL",
+            "Redis",
+            "Kubernetes",
+        ]
+        start, end, _ = mentions[0]
+        assert text[start:end] == "Postgres"
+
+    def test_find_canonical_mentions_longest_alias_and_boundaries(self):
+        """Should prefer the longest alias and ignore matches inside words."""
+        assert find_canonical_mentions("Built with ASP.NET Core and C++") == [
+            (11, 23, "ASP.NET Core"),
+            (28, 31, "C++"),
+        ]
+        assert find_canonical_mentions("jsonify the response") == []
+
 
 # ============================================================================
 # Run tests
@@ -1059,6 +1059,58 @@ class TestConversationProcessing:
         assert not preview.endswith("...")
 
 
+# ============================================================================
+# Similar Decision Linking Tests
+# ============================================================================
+
+
+class TestSimilarDecisionLinking:
+    """Test SIMILAR_TO linking for newly saved decisions."""
+
+    @staticmethod
+    def _records(rows):
+        """Create a mock Neo4j result that iterates over rows."""
+        result = AsyncMock()
+
+        async def async_iter():
+            for row in rows:
+                yield row
+
+        result.__aiter__ = lambda self: async_iter()
+        return result
+
+    @pytest.mark.asyncio
+    async def test_short_ann_page_falls_back_to_user_scan(self, extractor_with_mocks):
+        """Should rescan in user scope when other tenants fill the ANN page."""
+        own_match = {"similar_id": "own-decision", "similarity": 0.9}
+        queries = []
+
+        async def mock_run(query, **params):
+            queries.append((query, params))
+            if "queryNodes" in query:
+                # Every ANN candidate belonged to another user
+                return self._records([])
+            if "gds.similarity.cosine" in query:
+                return self._records([own_match])
+            return self._records([])
+
+        session = AsyncMock()
+        session.run = mock_run
+
+        await extractor_with_mocks._link_similar_decisions(
+            session, "new-decision", [0.1] * 8, "user-1"
+        )
+
+        assert "queryNodes" in queries[0][0]
+        assert "gds.similarity.cosine" in queries[1][0]
+        assert queries[1][1]["user_id"] == "user-1"
+        link_params = queries[2][1]
+        assert (link_params["id1"], link_params["id2"]) == (
+            "new-decision",
+            "own-decision",
+        )
+
+
 # ============================================================================
 # Factory Function Tests
 # ============================================================================
@@ -101,6 +101,20 @@ class TestGetCurrentUserId:
             result = await get_current_user_id(authorization=f"Bearer {token}")
             assert result == "user-12345"
 
+    @pytest.mark.asyncio
+    async def test_valid_jwt_with_extra_spaces(self, mock_settings):
+        """Should tolerate repeated or surrounding spaces around the token."""
+        payload = {
+            "sub": "user-spaces",
+            "iat": datetime.now(timezone.utc),
+            "exp": datetime.now(timezone.utc) + timedelta(hours=1),
+        }
+        token = create_test_jwt(payload)
+
+        with patch("routers.auth.get_settings", return_value=mock_settings):
+            result = await get_current_user_id(authorization=f" Bearer  {token} ")
+            assert result == "user-spaces"
+
     @pytest.mark.asyncio
     async def test_valid_jwt_case_insensitive_bearer(self, mock_settings):
         """Should accept 'bearer' in any case (Bearer, bearer, BEARER)."""
@@ -38,7 +38,15 @@ class TestEmbeddingCache:
         redis.ping = AsyncMock(return_value=True)
         redis.get = AsyncMock(return_value=None)  # Cache miss by default
         redis.setex = AsyncMock(return_value=True)
+        redis.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
         redis.close = AsyncMock()
+
+        # Pipelined batch writes
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        redis.pipeline = MagicMock(return_value=pipe)
         return redis
 
     def test_cache_key_format(self):
@@ -149,9 +157,9 @@ class TestEmbeddingCache:
         self, mock_batch_embedding_response, mock_redis
     ):
         """Should handle batch caching correctly."""
-        # First text is cached, others are not
-        mock_redis.get = AsyncMock(
-            side_effect=[
+        # First text is cached, others are not (fetched in one MGET)
+        mock_redis.mget = AsyncMock(
+            return_value=[
                 json.dumps([0.9] * 2048),  # First text cached
                 None,  # Second text not cached
                 None,  # Third text not cached
@@ -191,6 +199,12 @@ class TestEmbeddingCache:
                 call_args = mock_client.embeddings.create.call_args
                 assert len(call_args.kwargs["input"]) == 2
 
+                # Cache reads and writes should each be a single round-trip
+                mock_redis.mget.assert_awaited_once()
+                pipe = mock_redis.pipeline.return_value
+                assert pipe.setex.call_count == 2
+                pipe.execute.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_embed_text_redis_failure_graceful(self, mock_embedding_response):
         """Should work gracefully when Redis is unavailable."""
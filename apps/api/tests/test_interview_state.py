@@ -1,8 +1,10 @@
 """Tests for interview state determination (ML-P2-2)."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from agents.interview import InterviewAgent, InterviewState
+from agents.interview import InterviewAgent, InterviewState, _trim_history
 
 
 class TestContentCoverageAnalysis:
@@ -132,6 +134,39 @@ class TestHeuristicStateDetermination:
         state = agent._determine_next_state_heuristic(history)
         assert state == InterviewState.TRIGGER  # Should still be at trigger
 
+    def test_count_tracks_appended_messages(self, agent):
+        """Appending to the same history list should update the cached count."""
+        history = [
+            {"role": "user", "content": "We had a performance problem with our API."}
+        ]
+        assert agent._determine_next_state_heuristic(history) == InterviewState.CONTEXT
+
+        history.append({"role": "assistant", "content": "Tell me more about it."})
+        history.append(
+            {"role": "user", "content": "We were using PostgreSQL with budget limits."}
+        )
+        assert agent._determine_next_state_heuristic(history) == InterviewState.OPTIONS
+
+        # A different list is counted from scratch
+        assert agent._determine_next_state_heuristic([]) == InterviewState.TRIGGER
+
+    def test_fast_reply_advances_state(self, agent):
+        """fast_reply should return the stage's pre-written response synchronously."""
+        history = [
+            {"role": "user", "content": "We had a performance problem with our API."}
+        ]
+        reply = agent.fast_reply("We had a performance problem with our API.", history)
+        assert isinstance(reply, str) and reply
+        assert agent.state == InterviewState.CONTEXT
+
+    def test_fast_reply_uses_given_state(self, agent):
+        """fast_reply should not re-determine a state the caller already has."""
+        with patch.object(agent, "_determine_next_state") as determine:
+            reply = agent.fast_reply("Redis or Memcached?", [], InterviewState.OPTIONS)
+        determine.assert_not_called()
+        assert isinstance(reply, str) and reply
+        assert agent.state == InterviewState.OPTIONS
+
 
 class TestEnhancedStateDetermination:
     """Test the enhanced content-based state determination."""
@@ -278,5 +313,60 @@ class TestFallbackResponses:
         )
 
 
+class TestInterviewStateEnum:
+    """Test the InterviewState enum."""
+
+    def test_label_is_lowercase_name(self):
+        """Should expose the user-facing stage name as label."""
+        assert InterviewState.TRIGGER.label == "trigger"
+        assert InterviewState.SUMMARIZING.label == "summarizing"
+
+    def test_states_ordered_by_progression(self):
+        """Should order states in interview progression order."""
+        assert list(InterviewState) == sorted(InterviewState)
+        assert InterviewState.OPENING < InterviewState.SUMMARIZING
+
+
+class TestHistoryTrimming:
+    """Test the token-budgeted history window (ML-P1-3)."""
+
+    def test_keeps_last_messages_within_count(self):
+        """Should keep at most max_messages recent messages."""
+        history = [{"role": "user", "content": f"message {i}"} for i in range(20)]
+        trimmed = _trim_history(history, max_messages=10, token_budget=10_000)
+        assert trimmed == history[-10:]
+
+    def test_stops_at_token_budget(self):
+        """Should drop older messages once the token budget is exceeded."""
+        history = [
+            {"role": "user", "content": "x" * 4000},
+            {"role": "assistant", "content": "short reply"},
+            {"role": "user", "content": "short answer"},
+        ]
+        trimmed = _trim_history(history, max_messages=10, token_budget=100)
+        assert trimmed == history[1:]
+
+    def test_oversize_last_message_drops_all(self):
+        """Should return no history if even the newest message is over budget."""
+        history = [{"role": "user", "content": "x" * 4000}]
+        assert _trim_history(history, max_messages=10, token_budget=100) == []
+
+    def test_build_prompt_uses_configured_budget(self):
+        """Should derive the budget from max_prompt_tokens and the threshold."""
+        agent = InterviewAgent(fast_mode=True)
+        agent.state = InterviewState.TRIGGER
+        settings = MagicMock(max_prompt_tokens=10_000, prompt_warning_threshold=0.5)
+        history = [
+            {"role": "user", "content": "x" * 40_000},
+            {"role": "assistant", "content": "What prompted this decision?"},
+        ]
+
+        with patch("agents.interview.get_settings", return_value=settings):
+            system_prompt, recent = agent._build_prompt(history, "We needed search")
+
+        assert "CURRENT STAGE: TRIGGER" in system_prompt
+        assert recent == history[1:]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -2,7 +2,11 @@
 
 import pytest
 
-from utils.json_extraction import extract_json_from_response, extract_json_or_default
+from utils.json_extraction import (
+    extract_json_from_response,
+    extract_json_or_default,
+    strip_code_fence,
+)
 
 
 class TestExtractJsonFromResponse:
@@ -148,6 +152,23 @@ class TestExtractJsonOrDefault:
         assert extract_json_or_default("invalid", None) is None
 
 
+class TestStripCodeFence:
+    """Test the strip_code_fence function."""
+
+    def test_strips_json_fence(self):
+        """Should return the body of a fenced block."""
+        assert strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}\n'
+
+    def test_unfenced_text_unchanged(self):
+        """Should leave text without a leading fence alone."""
+        assert strip_code_fence('{"a": 1}') == '{"a": 1}'
+
+    def test_malformed_fence_unchanged(self):
+        """Should not fail on a fence with no newline or closing fence."""
+        assert strip_code_fence("```") == "```"
+        assert strip_code_fence('```{"a": 1}') == '```{"a": 1}'
+
+
 # ============================================================================
 # Run tests
 # ============================================================================
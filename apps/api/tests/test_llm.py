@@ -252,6 +252,45 @@ class TestLLMClient:
                 assert messages[0]["role"] == "system"
                 assert messages[0]["content"] == "You are helpful"
 
+    @pytest.mark.asyncio
+    async def test_generate_with_history(self, mock_openai_response):
+        """Should send history as messages between system prompt and user prompt."""
+        with patch("services.llm.AsyncOpenAI") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.chat.completions.create = AsyncMock(
+                return_value=mock_openai_response
+            )
+            mock_client_class.return_value = mock_client
+
+            with patch("services.llm.redis") as mock_redis_module:
+                mock_redis = AsyncMock()
+                mock_pipe = AsyncMock()
+                mock_pipe.execute = AsyncMock(return_value=[None, 5, None, None])
+                mock_redis.pipeline = MagicMock(return_value=mock_pipe)
+                mock_redis_module.from_url = MagicMock(return_value=mock_redis)
+
+                client = LLMClient()
+                await client.generate(
+                    "Latest message",
+                    system_prompt="You are helpful",
+                    history=[
+                        {"role": "user", "content": "First message"},
+                        {"role": "assistant", "content": "First reply"},
+                    ],
+                )
+
+                messages = mock_client.chat.completions.create.call_args.kwargs[
+                    "messages"
+                ]
+                assert [m["role"] for m in messages] == [
+                    "system",
+                    "user",
+                    "assistant",
+                    "user",
+                ]
+                assert messages[1]["content"] == "First message"
+                assert messages[-1]["content"] == "Latest message"
+
     @pytest.mark.asyncio
     async def test_generate_rate_limited(self):
         """Should raise exception when rate limited."""
@@ -770,7 +809,15 @@ class TestInterviewAgent:
             "confidence": 0.85
         }"""
 
-        with patch("agents.interview.get_llm_client") as mock_get_client:
+        mock_cache = MagicMock()
+        mock_cache.embed = AsyncMock(return_value=[1.0, 0.0])
+        mock_cache.get = AsyncMock(return_value=None)
+        mock_cache.set = AsyncMock()
+
+        with (
+            patch("agents.interview.get_llm_client") as mock_get_client,
+            patch("agents.interview.get_semantic_cache", return_value=mock_cache),
+        ):
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
             mock_get_client.return_value = mock_client
@@ -787,7 +834,132 @@ class TestInterviewAgent:
             assert result["trigger"] == "Choose database"
             assert result["decision"] == "PostgreSQL"
             assert result["confidence"] == 0.85
+            # One embedding serves both the lookup and the store
+            mock_cache.embed.assert_awaited_once()
+            assert mock_cache.set.await_args.args[0] == [1.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_synthesize_decision_semantic_cache_hit(self):
+        """Should return a cached synthesis without calling the LLM."""
+        cached = {
+            "trigger": "Choose database",
+            "options": ["PostgreSQL", "MySQL"],
+            "decision": "PostgreSQL",
+        }
+        mock_cache = MagicMock()
+        mock_cache.embed = AsyncMock(return_value=[1.0, 0.0])
+        mock_cache.get = AsyncMock(return_value=cached)
+        mock_cache.set = AsyncMock()
+
+        with (
+            patch("agents.interview.get_llm_client") as mock_get_client,
+            patch("agents.interview.get_semantic_cache", return_value=mock_cache),
+        ):
+            mock_client = AsyncMock()
+            mock_get_client.return_value = mock_client
+
+            agent = InterviewAgent(user_id="user-1")
+            history = [
+                {"role": "user", "content": "PostgreSQL or MySQL? I chose PostgreSQL"}
+            ]
+
+            result = await agent.synthesize_decision(history)
+
+            assert result == cached
+            mock_client.generate.assert_not_called()
+            mock_cache.embed.assert_awaited_once_with(
+                "User: PostgreSQL or MySQL? I chose PostgreSQL"
+            )
+            args = mock_cache.get.await_args.args
+            assert args[0] == [1.0, 0.0]
+            assert args[1] == "synthesis"
+            assert args[3] == "user-1"
+
+    @pytest.mark.asyncio
+    async def test_synthesize_decision_ignores_mismatched_cache_hit(self):
+        """Should not reuse a cached synthesis whose decision is not in the chat."""
+        cached = {
+            "trigger": "Choose database",
+            "options": ["PostgreSQL", "MySQL"],
+            "decision": "PostgreSQL",
+        }
+        mock_cache = MagicMock()
+        mock_cache.embed = AsyncMock(return_value=[1.0, 0.0])
+        mock_cache.get = AsyncMock(return_value=cached)
+        mock_cache.set = AsyncMock()
+
+        with (
+            patch("agents.interview.get_llm_client") as mock_get_client,
+            patch("agents.interview.get_semantic_cache", return_value=mock_cache),
+        ):
+            mock_client = AsyncMock()
+            mock_client.generate = AsyncMock(
+                return_value='{"trigger": "Choose database", "decision": "MySQL"}'
+            )
+            mock_get_client.return_value = mock_client
+
+            agent = InterviewAgent(user_id="user-1")
+            history = [{"role": "user", "content": "I chose MySQL"}]
+
+            result = await agent.synthesize_decision(history)
+
+            assert result["decision"] == "MySQL"
+            mock_client.generate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_synthesize_decision_skips_cache_without_embedding(self):
+        """Should bypass get/set when the cache declines to embed the input."""
+        mock_cache = MagicMock()
+        mock_cache.embed = AsyncMock(return_value=None)
+        mock_cache.get = AsyncMock()
+        mock_cache.set = AsyncMock()
+
+        with (
+            patch("agents.interview.get_llm_client") as mock_get_client,
+            patch("agents.interview.get_semantic_cache", return_value=mock_cache),
+        ):
+            mock_client = AsyncMock()
+            mock_client.generate = AsyncMock(return_value='{"decision": "Redis"}')
+            mock_get_client.return_value = mock_client
+
+            result = await InterviewAgent().synthesize_decision(
+                [{"role": "user", "content": "I chose Redis"}]
+            )
+
+        assert result["decision"] == "Redis"
+        mock_cache.get.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_batch(self):
+        """Should synthesize each session and preserve input order."""
+        mock_cache = MagicMock()
+        mock_cache.embed = AsyncMock(return_value=None)
+        mock_cache.get = AsyncMock(return_value=None)
+        mock_cache.set = AsyncMock()
+
+        async def fake_generate(prompt, **kwargs):
+            choice = "PostgreSQL" if "PostgreSQL" in prompt else "Redis"
+            return f'{{"trigger": "Pick a store", "decision": "{choice}"}}'
+
+        with (
+            patch("agents.interview.get_llm_client") as mock_get_client,
+            patch("agents.interview.get_semantic_cache", return_value=mock_cache),
+        ):
+            mock_client = AsyncMock()
+            mock_client.generate = AsyncMock(side_effect=fake_generate)
+            mock_get_client.return_value = mock_client
+
+            agent = InterviewAgent()
+            results = await agent.process_batch(
+                [
+                    [{"role": "user", "content": "I chose PostgreSQL"}],
+                    [{"role": "user", "content": "I chose Redis"}],
+                ]
+            )
 
+            assert [r["decision"] for r in results] == ["PostgreSQL", "Redis"]
+            assert mock_client.generate.await_count == 2
 
 # ============================================================================
 # Integration Tests (requires running services)
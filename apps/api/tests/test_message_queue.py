@@ -205,6 +205,28 @@ class TestMessageQueueManager:
             assert stats["active_sessions"] == 1
             assert stats["total_pending_messages"] == 1
 
+    @pytest.mark.asyncio
+    async def test_get_pending_messages(self, mock_db_session, mock_settings):
+        """Should snapshot only the unflushed messages of the session."""
+        with patch("services.message_queue.get_settings", return_value=mock_settings):
+            manager = MessageQueueManager()
+            await manager.add_message(mock_db_session, "session-123", "user", "Hello")
+            await manager.add_message(
+                mock_db_session, "session-123", "assistant", "Hi"
+            )
+            await manager.add_message(mock_db_session, "session-456", "user", "World")
+
+            pending = manager.get_pending_messages("session-123")
+
+            assert [(m.role, m.content) for m in pending] == [
+                ("user", "Hello"),
+                ("assistant", "Hi"),
+            ]
+            assert manager.get_pending_messages("unknown-session") == []
+
+            await manager.flush_session(mock_db_session, "session-123")
+            assert manager.get_pending_messages("session-123") == []
+
     @pytest.mark.asyncio
     async def test_flush_session(self, mock_db_session, mock_settings):
         """Should flush a specific session's queue."""
@@ -0,0 +1,108 @@
+"""Tests for the semantic LLM response cache with Redis."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Test the semantic cache functionality."""
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Create a mock Redis client."""
+        redis = AsyncMock()
+        redis.lrange = AsyncMock(return_value=[])
+        return redis
+
+    @pytest.fixture
+    def cache(self, mock_redis):
+        """Create an enabled semantic cache wired to the mock Redis client."""
+        cache = SemanticCache()
+        cache._settings = cache._settings.model_copy(
+            update={"semantic_cache_enabled": True}
+        )
+        cache._get_redis = MagicMock(return_value=mock_redis)
+        return cache
+
+    def test_cache_key_format(self, cache):
+        """Should scope keys by prompt version, kind and user."""
+        key = cache._get_cache_key("synthesis", "abc123", "user-1")
+        assert key == "semcache:abc123:synthesis:user-1"
+
+    def test_uses_shared_redis_client(self):
+        """Should read and write through the shared db.redis client."""
+        shared = AsyncMock()
+        with patch("services.semantic_cache.get_redis", return_value=shared):
+            assert SemanticCache()._get_redis() is shared
+
+    @pytest.mark.asyncio
+    async def test_similar_text_hits(self, cache, mock_redis):
+        """Should return the response of a sufficiently similar entry."""
+        mock_redis.lrange = AsyncMock(
+            return_value=[
+                json.dumps({"embedding": [0.0, 1.0], "response": {"id": "other"}}),
+                json.dumps({"embedding": [1.0, 0.01], "response": {"id": "match"}}),
+            ]
+        )
+
+        result = await cache.get([1.0, 0.0], "synthesis", "v", "user-1")
+
+        assert result == {"id": "match"}
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_text_misses(self, cache, mock_redis):
+        """Should miss when no entry clears the similarity threshold."""
+        mock_redis.lrange = AsyncMock(
+            return_value=[
+                json.dumps({"embedding": [0.0, 1.0], "response": {"id": "other"}})
+            ]
+        )
+
+        result = await cache.get([1.0, 0.0], "synthesis", "v", "user-1")
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """Should not embed anything unless semantic_cache_enabled is set."""
+        cache = SemanticCache()
+        assert cache._settings.semantic_cache_enabled is False
+
+        with patch("services.semantic_cache.get_embedding_service") as mock_service:
+            assert await cache.embed("conversation") is None
+
+        mock_service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_long_text_not_embedded(self, cache):
+        """Should skip embedding text over the configured length."""
+        text = "x" * (cache._settings.semantic_cache_max_text_length + 1)
+
+        with patch("services.semantic_cache.get_embedding_service") as mock_service:
+            assert await cache.embed(text) is None
+
+        mock_service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_pushes_bounded_entry(self, cache, mock_redis):
+        """Should push the entry, trim the list and refresh its TTL."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        await cache.set([1.0, 0.0], "synthesis", "v", "user-1", {"id": "x"})
+
+        key = cache._get_cache_key("synthesis", "v", "user-1")
+        entry = json.loads(pipe.lpush.call_args[0][1])
+        assert entry == {"embedding": [1.0, 0.0], "response": {"id": "x"}}
+        pipe.ltrim.assert_called_once_with(
+            key, 0, cache._settings.semantic_cache_max_entries - 1
+        )
+        pipe.expire.assert_called_once_with(key, cache._settings.llm_cache_ttl)
+        pipe.execute.assert_awaited_once()
@@ -8,7 +8,11 @@ from utils.circuit_breaker import (
     get_circuit_breaker,
     get_circuit_breaker_stats,
 )
-from utils.json_extraction import extract_json_from_response, extract_json_or_default
+from utils.json_extraction import (
+    extract_json_from_response,
+    extract_json_or_default,
+    strip_code_fence,
+)
 from utils.retry import (
     RetryExhausted,
     calculate_backoff,
@@ -17,14 +21,16 @@ from utils.retry import (
     redis_retry,
     retry,
 )
-from utils.vectors import cosine_similarity
+from utils.vectors import best_cosine_match, cosine_similarity
 
 __all__ = [
     # Vector utilities
     "cosine_similarity",
+    "best_cosine_match",
     # JSON extraction
     "extract_json_from_response",
     "extract_json_or_default",
+    "strip_code_fence",
     # Circuit breaker (SD-006)
     "CircuitBreaker",
     "CircuitBreakerOpen",
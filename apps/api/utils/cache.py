@@ -11,6 +11,7 @@ Usage:
 Cache keys are constructed as: {prefix}:{user_id}:{hash(args)}
 """
 
+import asyncio
 import functools
 import hashlib
 import json
@@ -178,10 +179,11 @@ async def invalidate_user_caches(user_id: str) -> int:
     Returns:
         Total number of keys deleted
     """
-    total_deleted = 0
-    for prefix in CACHE_PREFIXES:
-        total_deleted += await invalidate_cache(prefix, user_id)
-    return total_deleted
+    # Prefixes are independent, so their SCAN loops run concurrently
+    deleted = await asyncio.gather(
+        *(invalidate_cache(prefix, user_id) for prefix in CACHE_PREFIXES)
+    )
+    return sum(deleted)
 
 
 def cached(
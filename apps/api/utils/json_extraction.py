@@ -12,14 +12,43 @@ from typing import Any
 
 from utils.logging import get_logger
 
+try:
+    # orjson is C-backed and several times faster; its JSONDecodeError
+    # subclasses json.JSONDecodeError so the handlers below work for both.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
 
+def strip_code_fence(text: str) -> str:
+    """Strip a surrounding markdown code fence from text.
+
+    Uses index lookups rather than split/rsplit so no intermediate lists
+    are built, and returns the text unchanged if the fence is malformed
+    (e.g. no newline after the opening ```).
+
+    Args:
+        text: Stripped LLM response text
+
+    Returns:
+        The fenced body, or the original text if it is not fenced
+    """
+    if not text.startswith("```"):
+        return text
+    nl = text.find("\n")
+    end = text.rfind("```")
+    if nl == -1 or end <= nl:
+        return text
+    return text[nl + 1 : end]
+
+
 def extract_json_from_response(response: str) -> Any | None:
     """Extract JSON from an LLM response using multiple strategies.
 
     Tries the following strategies in order:
-    1. Parse as pure JSON
+    1. Parse as pure JSON, or as the body of a response wrapped in a fence
     2. Extract from ```json code blocks
     3. Extract from ``` code blocks (untyped)
     4. Regex fallback for embedded JSON objects/arrays
@@ -37,17 +66,24 @@ def extract_json_from_response(response: str) -> Any | None:
 
     # Strategy 1: Try pure JSON first
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except json.JSONDecodeError:
         pass
 
+    # Most LLM output is a single fenced block: slice it out without regex
+    if text.startswith("```"):
+        try:
+            return _json_loads(strip_code_fence(text))
+        except json.JSONDecodeError:
+            pass
+
     # Strategy 2: Extract from ```json code blocks
     json_block_match = re.search(
         r"```json\s*\n?(.*?)\n?```", text, re.DOTALL | re.IGNORECASE
     )
     if json_block_match:
         try:
-            return json.loads(json_block_match.group(1).strip())
+            return _json_loads(json_block_match.group(1).strip())
         except json.JSONDecodeError as e:
             logger.debug(f"Failed to parse ```json block: {e}")
 
@@ -55,7 +91,7 @@ def extract_json_from_response(response: str) -> Any | None:
     generic_block_match = re.search(r"```\s*\n?(.*?)\n?```", text, re.DOTALL)
     if generic_block_match:
         try:
-            return json.loads(generic_block_match.group(1).strip())
+            return _json_loads(generic_block_match.group(1).strip())
         except json.JSONDecodeError as e:
             logger.debug(f"Failed to parse ``` block: {e}")
 
@@ -64,7 +100,7 @@ def extract_json_from_response(response: str) -> Any | None:
     json_object_match = re.search(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", text, re.DOTALL)
     if json_object_match:
         try:
-            return json.loads(json_object_match.group(0))
+            return _json_loads(json_object_match.group(0))
         except json.JSONDecodeError:
             pass
 
@@ -72,7 +108,7 @@ def extract_json_from_response(response: str) -> Any | None:
     json_array_match = re.search(r"\[.*\]", text, re.DOTALL)
     if json_array_match:
         try:
-            return json.loads(json_array_match.group(0))
+            return _json_loads(json_array_match.group(0))
         except json.JSONDecodeError:
             pass
 
@@ -1,11 +1,20 @@
 """Vector utilities for embedding operations."""
 
 import math
+from collections.abc import Iterable
+
+
+def vector_norm(vec: list[float]) -> float:
+    """Calculate the Euclidean (L2) norm of a vector."""
+    return math.sqrt(math.sumprod(vec, vec))
 
 
 def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     """Calculate cosine similarity between two vectors.
 
+    Uses math.sumprod so the dot products run in C rather than as a Python
+    generator over every dimension (embeddings are 2048-d).
+
     Args:
         vec1: First embedding vector
         vec2: Second embedding vector
@@ -15,9 +24,54 @@ def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     """
     if not vec1 or not vec2:
         return 0.0
-    dot = sum(a * b for a, b in zip(vec1, vec2))
-    norm1 = math.sqrt(sum(a * a for a in vec1))
-    norm2 = math.sqrt(sum(b * b for b in vec2))
+    if len(vec1) != len(vec2):
+        # Match zip() semantics for the dot product on mismatched lengths
+        n = min(len(vec1), len(vec2))
+        dot = math.sumprod(vec1[:n], vec2[:n])
+    else:
+        dot = math.sumprod(vec1, vec2)
+    norm1 = vector_norm(vec1)
+    norm2 = vector_norm(vec2)
     if norm1 == 0 or norm2 == 0:
         return 0.0
     return dot / (norm1 * norm2)
+
+
+def best_cosine_match(
+    query: list[float],
+    candidates: Iterable[list[float] | None],
+    threshold: float = -1.0,
+) -> tuple[int, float] | None:
+    """Find the candidate most similar to the query vector.
+
+    The query norm is computed once rather than once per comparison.
+
+    Args:
+        query: The query embedding vector
+        candidates: Candidate embedding vectors; None, empty or
+            mismatched-dimension entries are skipped
+        threshold: Only matches strictly above this similarity are returned
+
+    Returns:
+        Tuple of (candidate index, similarity), or None if nothing beats threshold
+    """
+    if not query:
+        return None
+    query_norm = vector_norm(query)
+    if query_norm == 0:
+        return None
+
+    best: tuple[int, float] | None = None
+    best_similarity = threshold
+    dims = len(query)
+    for i, candidate in enumerate(candidates):
+        if not candidate or len(candidate) != dims:
+            continue
+        candidate_norm = vector_norm(candidate)
+        if candidate_norm == 0:
+            continue
+        similarity = math.sumprod(query, candidate) / (query_norm * candidate_norm)
+        if similarity > best_similarity:
+            best_similarity = similarity
+            best = (i, similarity)
+    return best